@@ -1,112 +1,263 @@
-import requests
-import time
+"""
+Spring Boot 수집 API 전송 클라이언트
 
-import json
+사용 의도:
+- 요청마다 새 연결을 맺던 requests.post 대신 keep-alive Session(커넥션 풀) 재사용
+- 게시글이 많을 때(FILTER_MINUTES=360 등) 한 번의 큰 POST 대신 크기 제한된 배치로 나눠 전송
+- 429/5xx/타임아웃/연결 오류는 지터를 섞은 지수 백오프로 재시도, Retry-After 헤더 우선
+- 선택적으로 요청 본문 gzip 압축 (서버가 Content-Encoding: gzip 을 지원할 때만)
+- 배치별 전송 바이트 / 지연 시간 보고
 
+환경 변수:
+    API_BATCH_SIZE: 배치당 최대 게시글 수 (기본 100)
+    API_MAX_BATCH_BYTES: 배치당 최대 본문 크기 (기본 1MB, 압축 전 기준)
+    API_GZIP: '1' 이면 요청 본문 gzip 압축 (기본 사용 안 함)
+    API_TIMEOUT: 응답 대기 시간 (초, 기본 30)
 """
-    Spring Boot API로 데이터 전송
+import gzip
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.deal_item import serialize_batch
+from common.metrics import span, incr
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class IngestionClient:
+    """
+    수집 API 클라이언트 (프로세스 내에서 재사용)
 
     Args:
         api_url: API 엔드포인트 URL
         api_key: API 인증 키
-        site: 출처 사이트명
-        items: 세일 정보 리스트
-        max_retries: 최대 재시도 횟수
+        batch_size: 배치당 최대 게시글 수
+        max_batch_bytes: 배치당 최대 본문 크기 (압축 전)
+        use_gzip: 요청 본문 gzip 압축 여부
+        max_retries: 배치당 최대 시도 횟수 (기본값)
+        timeout: (연결, 응답) 대기 시간 (초)
+        backoff_base: 백오프 기본 대기 시간 (초)
+        backoff_max: 백오프 최대 대기 시간 (초)
+    """
 
-    Returns:
-        dict: API 응답 결과
-"""
-def send_to_spring_boot(api_url, api_key, site, items, max_retries=3):
+    def __init__(self, api_url, api_key, batch_size=100, max_batch_bytes=1024 * 1024, use_gzip=False,
+                 max_retries=3, timeout=(5, 30), backoff_base=1.0, backoff_max=30.0):
+        self.api_url = api_url
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.use_gzip = use_gzip
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
 
-    headers = {
-        'Content-Type': 'application/json',
-        'X-API-Key': api_key
-    }
-
-    payload = {
-        'site': site,
-        'items': items
-    }
-
-    # 재시도 로직
-    for attempt in range(max_retries):
-        try:
-            print(f"API 호출 시도 {attempt + 1}/{max_retries}")
-
-            response = requests.post(
-                api_url,
-                json={'site': site, 'items': items},
-                headers=headers,
-                timeout=60          # 60초
-            )
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'X-API-Key': api_key or '',
+        })
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def send(self, site, items, max_retries=None):
+        """
+        게시글 전송 (배치 분할 + 배치별 재시도)
 
-            # 성공
-            if response.status_code == 200:
-                result = response.json()
-                print(f"API 호출 성공: {result}")
-                return result
+        Returns:
+            dict: {
+                'success': 모든 배치 성공 여부,
+                'batches': 배치 수, 'sent_items': 성공한 게시글 수,
+                'failed_items': 실패한 배치의 게시글 리스트,
+                'bytes': 전송 바이트 합계, 'latency_ms': 배치별 지연 시간,
+                'responses': 배치별 서버 응답
+            }
+        """
+        max_retries = max_retries or self.max_retries
+        report = {
+            'success': True,
+            'batches': 0,
+            'sent_items': 0,
+            'failed_items': [],
+            'bytes': 0,
+            'latency_ms': [],
+            'responses': [],
+        }
+
+        for batch, body in self._batches(site, items):
+            report['batches'] += 1
+            if body is None:
+                report['success'] = False
+                report['failed_items'].extend(batch)
+                report['responses'].append({'success': False, 'error': 'Serialization failed'})
+                continue
 
-            # 실패
+            result, sent_bytes, latency_ms = self._post_with_retry(body, report['batches'], len(batch), max_retries)
+            report['bytes'] += sent_bytes
+            report['latency_ms'].append(latency_ms)
+            report['responses'].append(result)
+
+            if result.get('success') is False:
+                report['success'] = False
+                report['failed_items'].extend(batch)
             else:
-                print(f"API 호출 실패 (HTTP {response.status_code}): {response.text}")
-
-                # 재시도 (5xx)
-                if 500 <= response.status_code < 600:
-                    if attempt < max_retries -1:
-                        wait_time = 2 ** attempt        # 지수 백오프 (1초, 2초, 4초)
-                        print(f"{wait_time}초 후 재시도...")
-                        time.sleep(wait_time)
-                        continue
-
-                # 재시도 불가능 (4xx)
-                return {
-                    'success': False,
-                    'error': f"HTTP {response.status_code}",
-                    'message': response.text
-                }
-
-        except requests.exceptions.Timeout:
-            print(f"API 호출 타임아웃 (시도 {attempt + 1}/{max_retries})")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+                report['sent_items'] += len(batch)
+
+        incr('send_batches', report['batches'])
+        incr('send_bytes', report['bytes'])
+        incr('send_failed_items', len(report['failed_items']))
+        print(f"API 전송 결과: 배치 {report['batches']}개, 성공 {report['sent_items']}개, "
+              f"실패 {len(report['failed_items'])}개, {report['bytes']:,}B, 지연 {report['latency_ms']}ms")
+        return report
+
+    def _batches(self, site, items):
+        """
+        (배치 게시글 리스트, 직렬화된 본문) 생성
+
+        batch_size 단위로 나눈 뒤, 본문이 max_batch_bytes 를 넘으면 반으로 다시 나눈다.
+        직렬화할 수 없는 배치는 본문 None
+        """
+        pending = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        while pending:
+            batch = pending.pop(0)
+            try:
+                body = serialize_batch(site, batch)
+            except (TypeError, ValueError) as e:
+                print(f"❌ 전송 데이터 직렬화 실패: {e}")
+                yield batch, None
                 continue
 
-        except requests.exceptions.HTTPError as http_err:
-            print(f"❌ HTTP 에러 발생: {http_err}")
-            print(f"    - Status Code: {response.status_code}")
-            print(f"    - Response Body: {response.text}")  # 가장 중요한 로그!
+            if len(body) > self.max_batch_bytes and len(batch) > 1:
+                middle = len(batch) // 2
+                pending[:0] = [batch[:middle], batch[middle:]]
+                continue
+
+            yield batch, body
+
+    def _post_with_retry(self, body, batch_num, batch_len, max_retries):
+        """
+        배치 1개 전송
+
+        Returns:
+            tuple: (결과 dict, 전송 바이트, 마지막 시도 지연 시간 ms)
+        """
+        headers = {}
+        if self.use_gzip:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
 
-        except requests.exceptions.RequestException as req_err:
-            print(f"❌ 네트워크 관련 에러 발생: {req_err}")  # DNS, 연결 거부 등
+        result = {'success': False, 'error': 'Max retries exceeded', 'message': f'{max_retries}번 시도 후 실패'}
+        sent_bytes = 0
+        latency_ms = 0.0
+
+        for attempt in range(max_retries):
+            if attempt > 0:
+                incr('send_retries')
+
+            retry_after = None
+            start = time.perf_counter()
             try:
-                response = requests.post(...)
+                with span('send_request'):
+                    response = self.session.post(self.api_url, data=body, headers=headers, timeout=self.timeout)
+                sent_bytes += len(body)
+                latency_ms = round((time.perf_counter() - start) * 1000, 1)
 
                 if response.status_code == 200:
-                    result = response.json()  # JSON 파싱
-                    print(f"API 호출 성공: {result}")
-                    return result
-
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON 파싱 실패: {e}")
-                print(f"   Response Status: {response.status_code}")
-                print(f"   Response Body: {response.text[:500]}")  # 처음 500자만
-                # 재시도 또는 실패 처리
-
-        except json.JSONDecodeError:
-            print("❌ JSON 파싱 에러 발생: 서버가 유효한 JSON을 반환하지 않았습니다.")
-            print(f"    - Status Code: {response.status_code}")
-            print(f"    - Response Body: {response.text}")  # HTML 에러 페이지 등이 반환되었을 수 있음
-
-        except Exception as e:
-            print(f"API 호출 예외 발생: {e}")
+                    try:
+                        result = response.json()
+                    except ValueError:
+                        result = {'success': True, 'message': response.text[:500]}
+                    print(f"API 배치 {batch_num} 전송 성공 ({batch_len}개, {len(body):,}B, {latency_ms}ms)")
+                    return result, sent_bytes, latency_ms
+
+                print(f"API 배치 {batch_num} 전송 실패 (HTTP {response.status_code}): {response.text[:500]}")
+                result = {'success': False, 'error': f"HTTP {response.status_code}", 'message': response.text[:500]}
+
+                # 재시도 불가능 (429 를 제외한 4xx 등)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return result, sent_bytes, latency_ms
+
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+
+            except requests.exceptions.RequestException as e:
+                # 타임아웃, DNS, 연결 거부 등
+                sent_bytes += len(body)
+                latency_ms = round((time.perf_counter() - start) * 1000, 1)
+                print(f"API 배치 {batch_num} 네트워크 에러 (시도 {attempt + 1}/{max_retries}): {e}")
+                result = {'success': False, 'error': type(e).__name__, 'message': str(e)}
+
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
+                wait_time = self._backoff(attempt, retry_after)
+                print(f"{wait_time:.1f}초 후 재시도...")
+                time.sleep(wait_time)
+
+        return result, sent_bytes, latency_ms
+
+    def _backoff(self, attempt, retry_after=None):
+        """Retry-After 가 있으면 우선, 없으면 지수 백오프 + full jitter"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def _parse_retry_after(value):
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초, 해석 불가 시 None"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_ingestion_client(api_url, api_key):
+    """API URL/키별 공용 클라이언트 (환경 변수 설정 적용)"""
+    key = (api_url, api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = IngestionClient(
+                api_url, api_key,
+                batch_size=int(os.environ.get('API_BATCH_SIZE', 100)),
+                max_batch_bytes=int(os.environ.get('API_MAX_BATCH_BYTES', 1024 * 1024)),
+                use_gzip=os.environ.get('API_GZIP', '0') == '1',
+                timeout=(5, float(os.environ.get('API_TIMEOUT', 30))),
+            )
+            _clients[key] = client
+        return client
+
+
+def send_to_spring_boot(api_url, api_key, site, items, max_retries=3):
+    """
+    Spring Boot API로 데이터 전송 (IngestionClient 사용)
+
+    Args:
+        api_url: API 엔드포인트 URL
+        api_key: API 인증 키
+        site: 출처 사이트명
+        items: 세일 정보 리스트
+        max_retries: 배치당 최대 시도 횟수
+
+    Returns:
+        dict: 전송 결과 (IngestionClient.send 참고, 실패 시 'success': False)
+    """
+    return get_ingestion_client(api_url, api_key).send(site, items, max_retries=max_retries)
 
-    # 모든 재시도 실패
-    return {
-        'success': False,
-        'error': 'Max retries exceeded',
-        'message': f'{max_retries}번 재시도 후 실패'
-    }
 
+def is_send_success(result):
+    """send_to_spring_boot 결과가 전송 성공인지 여부 (실패 시 {'success': False, ...} 반환)"""
+    return isinstance(result, dict) and result.get('success') is not False
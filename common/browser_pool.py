@@ -0,0 +1,298 @@
+"""
+Chrome 브라우저 풀
+
+사용 의도:
+- 스크래퍼마다 Chrome을 새로 띄우고 quit() 하던 구조를 프로세스 공용 풀로 대체
+- 스크래퍼는 lease() 로 브라우저를 빌려 쓰고 반납 (반납 시 쿠키/로딩 상태 초기화)
+- N페이지 사용 또는 메모리(RSS) 임계치 초과 시 브라우저 재생성
+
+효과:
+- 실행 주기마다 반복되던 Chrome 콜드 스타트(수 초~수십 초) 제거
+- 여러 사이트/게시판이 같은 warm 브라우저 재사용
+"""
+import atexit
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from common.metrics import span, incr
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+
+def create_chrome_driver(headless=True):
+    """Chrome 드라이버 생성 (모든 스크래퍼 공통 옵션)"""
+    options = Options()
+
+    # User-Agent 설정 (공통)
+    options.add_argument(f'--user-agent={USER_AGENT}')
+
+    # 기본 옵션 (공통)
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--referer=https://www.google.com/')
+
+    # 자동화 감지 우회
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    # DOMContentLoaded 까지만 대기 (목록은 선택자 대기로 확인, 차단된 리소스 때문에 load 이벤트를 기다리지 않음)
+    options.page_load_strategy = 'eager'
+
+    # 허용/차단 요청 집계용 네트워크 로그 (common.resource_blocker)
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    try:
+        # 환경 자동 감지
+        if platform.system() == 'Windows':
+            print("(로컬 Windows 환경 감지 - WebDriverManager 자동 설치)")
+            # 로컬: WebDriverManager 사용
+            from webdriver_manager.chrome import ChromeDriverManager
+            service = Service(ChromeDriverManager().install())
+        else:
+            print("(Linux 컨테이너 환경 감지 - Fargate 경로 사용)")
+            # Fargate: 고정 경로
+            service = Service('/usr/local/bin/chromedriver')
+
+        driver = webdriver.Chrome(service=service, options=options)
+        print("Chrome 드라이버 생성 성공!")
+
+        # WebDriver 속성 숨기기
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.set_page_load_timeout(60)
+        return driver
+
+    except Exception as e:
+        print(f"❌ Chrome 드라이버 생성 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        raise
+
+
+def _process_tree_rss_mb(root_pid):
+    """
+    chromedriver 프로세스와 하위 Chrome 프로세스들의 RSS 합계 (MB)
+
+    /proc 기반이라 Linux(Fargate)에서만 동작, 그 외 환경은 None
+    """
+    if not root_pid or not os.path.isdir('/proc'):
+        return None
+
+    children = {}
+    rss_kb = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/status') as f:
+                ppid = None
+                rss = 0
+                for line in f:
+                    if line.startswith('PPid:'):
+                        ppid = int(line.split()[1])
+                    elif line.startswith('VmRSS:'):
+                        rss = int(line.split()[1])
+        except (OSError, ValueError):
+            continue
+        pid = int(entry)
+        rss_kb[pid] = rss
+        children.setdefault(ppid, []).append(pid)
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss_kb.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return total / 1024
+
+
+class PooledBrowser:
+    """풀에서 관리하는 Chrome 인스턴스 1개"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.pages = 0      # 누적 페이지 로드 수
+        self.leases = 0     # 누적 대여 횟수
+
+    def rss_mb(self):
+        try:
+            pid = self.driver.service.process.pid
+        except Exception:
+            return None
+        return _process_tree_rss_mb(pid)
+
+    def quit(self):
+        try:
+            self.driver.quit()
+            print("Chrome 브라우저 정상 종료")
+        except Exception as e:
+            print(f"Chrome 종료 중 에러: {e}")
+
+
+class BrowserPool:
+    """
+    장시간 유지되는 Chrome 인스턴스 풀
+
+    Args:
+        size: 최대 Chrome 인스턴스 수
+        max_pages: 이 횟수만큼 페이지를 로드한 브라우저는 반납 시 재생성
+        max_rss_mb: 프로세스 트리 메모리가 이 값을 넘으면 반납 시 재생성
+        driver_factory: Chrome 드라이버 생성 함수
+    """
+
+    def __init__(self, size=1, max_pages=30, max_rss_mb=700, driver_factory=create_chrome_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.driver_factory = driver_factory
+
+        self._idle = []
+        self._created = 0
+        self._cond = threading.Condition()
+        self.stats = {'created': 0, 'recycled': 0, 'leases': 0}
+
+    def acquire(self, site=None, timeout=None):
+        """
+        브라우저 대여 (빈 브라우저가 없고 최대 수에 도달했으면 반납될 때까지 대기)
+
+        Returns:
+            PooledBrowser
+        """
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                if not self._cond.wait(timeout):
+                    raise TimeoutError(f"[{site}] {timeout}초 안에 사용 가능한 브라우저가 없습니다.")
+
+            browser = self._idle.pop() if self._idle else None
+            if browser is None:
+                self._created += 1
+
+        if browser is None:
+            try:
+                with span('driver_start'):
+                    browser = PooledBrowser(self.driver_factory())
+                incr('driver_starts')
+            except Exception:
+                with self._cond:
+                    self._created -= 1
+                    self._cond.notify()
+                raise
+            self.stats['created'] += 1
+            print(f"Chrome 브라우저 시작 ({site}, 풀 {self._created}/{self.size})")
+        else:
+            print(f"Chrome 브라우저 재사용 ({site}, 누적 {browser.pages}페이지)")
+
+        browser.leases += 1
+        self.stats['leases'] += 1
+        return browser
+
+    def release(self, browser):
+        """브라우저 반납 (상태 초기화, 필요 시 재생성 대상으로 폐기)"""
+        reason = self._recycle_reason(browser)
+
+        if reason is None:
+            try:
+                self._reset(browser.driver)
+            except Exception as e:
+                reason = f"상태 초기화 실패: {e}"
+
+        if reason is not None:
+            print(f"Chrome 브라우저 재생성 대상: {reason}")
+            browser.quit()
+            self.stats['recycled'] += 1
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._idle.append(browser)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, site=None, timeout=None):
+        """
+        with pool.lease('PPOMPPU') as browser:
+            browser.driver.get(url)
+            browser.pages += 1
+        """
+        browser = self.acquire(site, timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def _recycle_reason(self, browser):
+        if browser.pages >= self.max_pages:
+            return f"{browser.pages}페이지 사용"
+
+        rss = browser.rss_mb()
+        if rss is not None and rss > self.max_rss_mb:
+            return f"메모리 {rss:.0f}MB > {self.max_rss_mb}MB"
+
+        return None
+
+    def _reset(self, driver):
+        """다음 대여자를 위해 탭/로딩/쿠키 상태 초기화"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        driver.execute_script("window.stop();")
+        # delete_all_cookies 는 현재 문서 도메인 쿠키만 지우므로 CDP 로 전체 삭제
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.get('about:blank')
+
+        # 쌓인 네트워크 로그 비우기 (다음 대여자의 요청 집계와 섞이지 않도록)
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
+
+    def close(self):
+        """대기 중인 브라우저 모두 종료"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for browser in idle:
+            browser.quit()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """
+    프로세스 공용 브라우저 풀
+
+    환경 변수:
+        BROWSER_POOL_SIZE: 최대 Chrome 수 (기본 1)
+        BROWSER_MAX_PAGES: 재생성 기준 페이지 수 (기본 30)
+        BROWSER_MAX_RSS_MB: 재생성 기준 메모리 (기본 700MB)
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool(
+                size=int(os.environ.get('BROWSER_POOL_SIZE', 1)),
+                max_pages=int(os.environ.get('BROWSER_MAX_PAGES', 30)),
+                max_rss_mb=int(os.environ.get('BROWSER_MAX_RSS_MB', 700)),
+            )
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -0,0 +1,237 @@
+"""
+게시판 글 등록 속도 기반 적응형 크롤링 주기 / 수집 기간
+
+사용 의도:
+- 크롤링 주기(EventBridge 규칙)와 수집 기간(FILTER_MINUTES)이 사이트별로 고정
+  → 점심시간 뽐뿌처럼 1분에 여러 건 올라오는 게시판은 max_pages 를 넘겨 누락,
+    새벽처럼 글이 없는 게시판은 빈 실행에 브라우저 시간만 사용
+- 실행마다 수집한 게시글 시간(created_ts)으로 게시판별 최근 등록 속도(건/시간)를 지수 이동 평균으로 추적하고,
+  다음 실행 주기와 수집 기간을 목표 게시글 수 / 최대 지연 시간에 맞춰 결정
+
+결정 규칙:
+- 주기 = 목표 게시글 수 / 등록 속도  (ADAPTIVE_MIN_INTERVAL ~ ADAPTIVE_MAX_INTERVAL 초)
+  최대 주기가 곧 최대 지연 시간(신선도 목표), 최소 주기는 사이트 부하 상한
+- 수집 기간 = max(주기 × ADAPTIVE_WINDOW_FACTOR, 마지막 성공 이후 경과 시간 + 주기)
+  (ADAPTIVE_MIN_WINDOW_MINUTES ~ ADAPTIVE_MAX_WINDOW_MINUTES 분)
+  → 실패 / 재시작으로 실행이 밀려도 그 사이 게시글을 수집 기간이 덮음
+- 기록이 없는 첫 실행은 FILTER_MINUTES 그대로 사용
+
+페이지 예산 (max_pages):
+- 예상 게시글 수 = 등록 속도 × 지난 실행의 최신 게시글 이후 경과 시간 (수집 기간 이내)
+- 예상 페이지 수 = 예상 게시글 수 × ADAPTIVE_PAGE_MARGIN / 페이지당 게시글 수(실행마다 관측)
+- 예산 = max(예상 페이지 수 + 1, ADAPTIVE_MIN_PAGES) (ADAPTIVE_MAX_PAGES 이하)
+  → 조용한 게시판은 기존과 같은 3페이지, 붐비는 게시판은 필요한 만큼
+- 예상 페이지 수가 2 이상이면 스크래퍼가 2페이지부터 미리 동시에 요청 (common.fetcher.prefetch_pages)
+- 예산에서 멈춘 실행은 놓친 게시글 수를 추정해 지표(page_overflow_posts)로 기록
+
+등록 속도 관측 (성공한 실행만):
+- 관측 구간 = max(수집 기준 시각, 지난 실행의 최신 게시글 시간) ~ 실행 종료
+  (게시글 번호 기록(common.watermark)으로 이미 전송한 글이 빠져도 구간이 맞음)
+- 반영 비율은 지난 관측 이후 경과 시간에 비례 (CRAWL_RATE_HALFLIFE_MINUTES 반감기)
+- 최대 페이지에서 멈춘 실행(page_limit_reached)은 가장 오래된 수집 게시글부터를 관측 구간으로 사용하고,
+  관측 속도가 더 높으면 바로 반영 (누락 방지 우선)
+
+환경 변수:
+    ADAPTIVE_CRAWL: '0' 이면 비활성화 (기본 활성, 비활성 시 FILTER_MINUTES / 고정 주기)
+    ADAPTIVE_TARGET_POSTS: 실행 1회 목표 게시글 수 (기본 40)
+    ADAPTIVE_MIN_INTERVAL / ADAPTIVE_MAX_INTERVAL: 주기 범위 (초, 기본 60 / 900)
+    ADAPTIVE_WINDOW_FACTOR: 주기 대비 수집 기간 배수 (기본 3)
+    ADAPTIVE_MIN_WINDOW_MINUTES / ADAPTIVE_MAX_WINDOW_MINUTES: 수집 기간 범위 (분, 기본 10 / 360)
+    CRAWL_RATE_HALFLIFE_MINUTES: 등록 속도 반감기 (분, 기본 60)
+    ADAPTIVE_MIN_PAGES / ADAPTIVE_MAX_PAGES: 페이지 예산 범위 (기본 3 / 10)
+    ADAPTIVE_PAGE_MARGIN: 예상 게시글 수 여유 배수 (기본 1.2)
+"""
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from common.local_state import state_path
+
+# interval: 다음 실행까지 권장 간격 (초, 기록 없으면 None) / filter_minutes: 이번 실행 수집 기간 (분)
+# rate_per_hour: 추정 등록 속도 (건/시간, 기록 없으면 None)
+# pages: 예상 페이지 수 (미리 받을 페이지 수) / max_pages: 페이지 예산 (기록 없으면 None → 스크래퍼 기본값)
+CrawlPlan = namedtuple('CrawlPlan', ['interval', 'filter_minutes', 'rate_per_hour', 'pages', 'max_pages'])
+
+# rate_per_hour: 이번 실행 관측 등록 속도 / overflow_posts: 페이지 예산 때문에 놓친 것으로 추정되는 게시글 수
+CrawlObservation = namedtuple('CrawlObservation', ['rate_per_hour', 'overflow_posts'])
+
+MIN_OBSERVED_SECONDS = 60  # 짧은 관측 구간 1~2건으로 속도가 튀지 않도록
+DEFAULT_PAGE_SIZE = 20  # 페이지당 게시글 수 관측 전 기본값
+PAGE_SIZE_WEIGHT = 0.3  # 페이지당 게시글 수 이동 평균 반영 비율
+
+
+def adaptive_enabled():
+    return os.environ.get('ADAPTIVE_CRAWL', '1') != '0'
+
+
+def _env_float(name, default):
+    return float(os.environ.get(name, default))
+
+
+class CrawlRateStore:
+    """사이트 → 등록 속도 / 최신 게시글 시간 / 마지막 성공 시각 (SQLite)"""
+
+    def __init__(self, path=None):
+        self.path = path or state_path('crawl_rate.sqlite3')
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS crawl_rate ('
+            ' site TEXT PRIMARY KEY,'
+            ' rate REAL NOT NULL,'
+            ' newest_ts REAL,'
+            ' last_success_at REAL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(crawl_rate)')}
+        if 'page_size' not in columns:
+            self._conn.execute('ALTER TABLE crawl_rate ADD COLUMN page_size REAL')
+        self._conn.commit()
+
+    def get(self, site):
+        """
+        Returns:
+            dict | None: {'rate': 건/초, 'newest_ts', 'last_success_at', 'updated_at', 'page_size'}
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT rate, newest_ts, last_success_at, updated_at, page_size FROM crawl_rate WHERE site = ?',
+                (site,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'rate': row[0], 'newest_ts': row[1], 'last_success_at': row[2], 'updated_at': row[3],
+                'page_size': row[4]}
+
+    def put(self, site, state):
+        """get() 과 같은 형식의 dict 저장"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO crawl_rate (site, rate, newest_ts, last_success_at, updated_at, page_size) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (site, state['rate'], state['newest_ts'], state['last_success_at'], state['updated_at'],
+                 state['page_size'])
+            )
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+class CrawlRateTracker:
+    """
+    사이트 1개의 실행 계획(plan) / 관측 기록(observe)
+
+    Args:
+        site: 출처 사이트명
+        default_filter_minutes: 기록이 없을 때 수집 기간 (기본: FILTER_MINUTES)
+        store: CrawlRateStore (기본: 상태 디렉터리의 crawl_rate.sqlite3)
+    """
+
+    def __init__(self, site, default_filter_minutes=None, store=None):
+        self.site = site
+        if default_filter_minutes is None:
+            default_filter_minutes = int(os.environ.get('FILTER_MINUTES', 30))
+        self.default_filter_minutes = default_filter_minutes
+
+        self.target_posts = _env_float('ADAPTIVE_TARGET_POSTS', 40)
+        self.min_interval = _env_float('ADAPTIVE_MIN_INTERVAL', 60)
+        self.max_interval = _env_float('ADAPTIVE_MAX_INTERVAL', 900)
+        self.window_factor = _env_float('ADAPTIVE_WINDOW_FACTOR', 3)
+        self.min_window = _env_float('ADAPTIVE_MIN_WINDOW_MINUTES', 10) * 60
+        self.max_window = _env_float('ADAPTIVE_MAX_WINDOW_MINUTES', 360) * 60
+        self.halflife = _env_float('CRAWL_RATE_HALFLIFE_MINUTES', 60) * 60
+        self.min_pages = int(_env_float('ADAPTIVE_MIN_PAGES', 3))
+        self.max_pages = int(_env_float('ADAPTIVE_MAX_PAGES', 10))
+        self.page_margin = _env_float('ADAPTIVE_PAGE_MARGIN', 1.2)
+
+        self.store = store or CrawlRateStore()
+        self.state = self.store.get(site)
+
+    def plan(self, now=None):
+        """이번 실행 수집 기간 / 페이지 예산 + 다음 실행 권장 간격"""
+        if self.state is None:
+            return CrawlPlan(None, self.default_filter_minutes, None, 1, None)
+        now = time.time() if now is None else now
+        rate = self.state['rate']
+
+        interval = self.target_posts / rate if rate > 0 else self.max_interval
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        window = interval * self.window_factor
+        if self.state['last_success_at']:
+            window = max(window, now - self.state['last_success_at'] + interval)
+        window = min(max(window, self.min_window), self.max_window)
+
+        # 지난 실행에서 본 최신 게시글 이후(수집 기간 이내) 올라왔을 게시글 수 → 페이지 수
+        since = self.state['newest_ts'] or self.state['last_success_at'] or now - window
+        backlog = rate * min(max(now - since, 0), window) * self.page_margin
+        pages = max(1, math.ceil(backlog / (self.state['page_size'] or DEFAULT_PAGE_SIZE)))
+        max_pages = min(max(pages + 1, self.min_pages), self.max_pages)
+
+        return CrawlPlan(round(interval), math.ceil(window / 60), round(rate * 3600, 1),
+                         min(pages, max_pages), max_pages)
+
+    def observe(self, items, window_start, now=None, truncated=False, delivered=True, list_pages=0, list_rows=0):
+        """
+        성공한 실행의 게시글로 등록 속도 갱신
+
+        Args:
+            items: 이번 실행에서 수집한 DealItem 리스트
+            window_start: 이번 실행 수집 기준 시각 (epoch 초)
+            truncated: 최대 페이지에서 멈춰 수집 기간을 다 확인하지 못한 실행
+            delivered: 전송 완료(또는 보관) 여부, False 면 마지막 성공 시각을 갱신하지 않음
+                       (다음 실행 수집 기간이 이번 실행 구간까지 덮도록)
+            list_pages / list_rows: 이번 실행에서 읽은 목록 페이지 수 / 게시글 행 수 (페이지당 게시글 수 관측)
+
+        Returns:
+            CrawlObservation
+        """
+        now = time.time() if now is None else now
+        timestamps = [item.created_ts for item in items if item.created_ts is not None]
+
+        start = window_start
+        newest_ts = None
+        if self.state is not None:
+            newest_ts = self.state['newest_ts']
+            if newest_ts is not None:
+                start = max(start, newest_ts)
+        expected_start = start
+        if truncated and timestamps:
+            start = max(start, min(timestamps))
+
+        count = sum(1 for ts in timestamps if ts > start)
+        seconds = max(now - start, MIN_OBSERVED_SECONDS)
+        observed = count / seconds
+
+        # 예산에서 멈춘 실행: 확인하지 못한 구간(원래 관측 시작 ~ 가장 오래된 수집 게시글) × 관측 속도
+        overflow_posts = round((start - expected_start) * observed)
+
+        if self.state is None:
+            rate = observed
+        else:
+            elapsed = max(now - self.state['updated_at'], MIN_OBSERVED_SECONDS)
+            weight = 1 - 0.5 ** (elapsed / self.halflife)
+            rate = self.state['rate'] + weight * (observed - self.state['rate'])
+            if truncated:
+                rate = max(rate, observed)
+
+        if timestamps:
+            newest_ts = max(max(timestamps), newest_ts or 0)
+
+        page_size = (self.state or {}).get('page_size')
+        if list_pages:
+            observed_size = list_rows / list_pages
+            page_size = observed_size if page_size is None else page_size + PAGE_SIZE_WEIGHT * (observed_size - page_size)
+
+        last_success_at = now if delivered else (self.state or {}).get('last_success_at')
+        self.state = {'rate': rate, 'newest_ts': newest_ts, 'last_success_at': last_success_at, 'updated_at': now,
+                      'page_size': page_size}
+        self.store.put(self.site, self.state)
+        return CrawlObservation(round(observed * 3600, 1), overflow_posts)
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,197 @@
+"""
+세일 게시글 레코드 (DealItem)
+
+사용 의도:
+- 사이트마다 _extract_item 에서 dict 를 제각각 만들던 것을 하나의 타입으로 통일
+  (루리웹만 crawledAt, 루리웹 price 는 float, 댓글 수가 문자열인 경우 등)
+- 등록 시간은 epoch 초(created_ts) 하나로 보관 → 시간 필터 / 페이지 중단 판단에서 문자열 변환 반복 제거
+- API 전송 형식(dict, JSON)은 to_dict / serialize_batch 한 곳에서 생성
+- __slots__ 로 게시글당 메모리 축소 (FILTER_MINUTES 가 긴 경우)
+
+기존 dict 사용처(watermark, log_item 등)를 위해 get / [] / items 는 API 필드명(camelCase)으로 동작
+"""
+import calendar
+import json
+import time
+from datetime import datetime, timezone, timedelta
+
+KST = timezone(timedelta(hours=9))
+KST_OFFSET_SECONDS = 9 * 60 * 60
+
+# API 필드명 → 속성명 (createdAt 은 created_ts 에서 생성)
+API_FIELDS = {
+    'title': 'title',
+    'price': 'price',
+    'storeName': 'store_name',
+    'category': 'category',
+    'shippingFee': 'shipping_fee',
+    'productUrl': 'product_url',
+    'imageUrl': 'image_url',
+    'replyCount': 'reply_count',
+    'likeCount': 'like_count',
+    'sourceSite': 'source_site',
+    'createdAt': 'created_at',
+}
+
+
+def to_int(value, default=None):
+    """숫자 / 숫자 문자열('1,234', '12.0') → int, 실패 시 default"""
+    if value is None or isinstance(value, bool):
+        return default
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(round(value))
+    try:
+        return int(round(float(str(value).replace(',', '').strip())))
+    except ValueError:
+        return default
+
+
+def to_epoch(value):
+    """
+    등록 시간 → epoch 초 (timezone 정보가 없으면 KST 로 간주), 실패 시 None
+
+    지원: epoch 숫자, datetime, 'YYYY-MM-DD HH:MM:SS', ISO 8601 문자열
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=KST)
+        return value.timestamp()
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            # 'YYYY-MM-DD HH:MM:SS' (대부분의 사이트) → strptime 없이 변환
+            if len(value) == 19 and value[4] == '-' and value[10] == ' ':
+                fields = (int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                          int(value[11:13]), int(value[14:16]), int(value[17:19]))
+                return float(calendar.timegm(fields + (0, 0, 0)) - KST_OFFSET_SECONDS)
+            return to_epoch(datetime.fromisoformat(value.replace('Z', '+00:00')))
+        except ValueError:
+            return None
+    return None
+
+
+def format_kst(ts, fmt='%Y-%m-%d %H:%M:%S'):
+    """epoch 초 → KST 시간 문자열"""
+    if ts is None:
+        return None
+    return time.strftime(fmt, time.gmtime(ts + KST_OFFSET_SECONDS))
+
+
+class DealItem:
+    """
+    세일 게시글 1개
+
+    Args:
+        title: 제목
+        product_url: 게시글 URL
+        source_site: 출처 사이트명
+        created_at: 등록 시간 (datetime / 'YYYY-MM-DD HH:MM:SS' / ISO 문자열 / epoch)
+        price: 가격 (정수로 변환)
+        store_name: 판매처
+        category: 카테고리
+        shipping_fee: 배송비 문자열
+        image_url: 이미지 URL
+        reply_count: 댓글 수 (정수로 변환, 기본 0)
+        like_count: 추천 수 (정수로 변환, 기본 0)
+    """
+
+    __slots__ = ('title', 'price', 'store_name', 'category', 'shipping_fee', 'product_url',
+                 'image_url', 'reply_count', 'like_count', 'source_site', 'created_ts')
+
+    def __init__(self, title, product_url, source_site, created_at=None, price=None, store_name=None,
+                 category=None, shipping_fee=None, image_url=None, reply_count=0, like_count=0):
+        self.title = title
+        self.product_url = product_url
+        self.source_site = source_site
+        self.created_ts = to_epoch(created_at)
+        self.price = to_int(price)
+        self.store_name = store_name
+        self.category = category
+        self.shipping_fee = shipping_fee
+        self.image_url = image_url
+        self.reply_count = to_int(reply_count, 0)
+        self.like_count = to_int(like_count, 0)
+
+    @property
+    def created_at(self):
+        """API 전송 형식 등록 시간 ('YYYY-MM-DD HH:MM:SS', KST)"""
+        return format_kst(self.created_ts)
+
+    def is_valid(self):
+        """필수 필드(제목, URL) 확인"""
+        return bool(self.title and self.product_url)
+
+    def is_recent(self, cutoff_ts):
+        """cutoff_ts 이후 등록 여부 (시간 정보가 없으면 False)"""
+        return self.created_ts is not None and self.created_ts >= cutoff_ts
+
+    def to_dict(self):
+        """API 전송 형식 dict"""
+        return {
+            'title': self.title,
+            'price': self.price,
+            'storeName': self.store_name,
+            'category': self.category,
+            'shippingFee': self.shipping_fee,
+            'productUrl': self.product_url,
+            'imageUrl': self.image_url,
+            'replyCount': self.reply_count,
+            'likeCount': self.like_count,
+            'sourceSite': self.source_site,
+            'createdAt': self.created_at,
+        }
+
+    # dict 호환 (API 필드명)
+    def get(self, key, default=None):
+        attr = API_FIELDS.get(key)
+        if attr is None:
+            return default
+        return getattr(self, attr)
+
+    def __getitem__(self, key):
+        if key not in API_FIELDS:
+            raise KeyError(key)
+        return getattr(self, API_FIELDS[key])
+
+    def __contains__(self, key):
+        return key in API_FIELDS
+
+    def keys(self):
+        return API_FIELDS.keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __eq__(self, other):
+        if not isinstance(other, DealItem):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"DealItem({self.source_site}, {self.title!r}, {self.created_at})"
+
+
+def as_dict(item):
+    """DealItem 또는 dict → API 전송 형식 dict"""
+    if isinstance(item, DealItem):
+        return item.to_dict()
+    return item
+
+
+def filter_recent(items, cutoff_ts):
+    """cutoff_ts 이후 등록된 게시글만 (시간 정보가 없는 게시글 제외)"""
+    return [item for item in items if item.is_recent(cutoff_ts)]
+
+
+def serialize_batch(site, items):
+    """API 요청 본문 (UTF-8 JSON bytes)"""
+    payload = {'site': site, 'items': [as_dict(item) for item in items]}
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,129 @@
+"""
+상세 페이지 등록 시간 캐시 (SQLite)
+
+사용 의도:
+- 게시글 등록 시간은 바뀌지 않으므로, 한 번 상세 페이지에서 읽은 값은 디스크에 저장
+- 다음 실행부터는 캐시에 없는 (새) 게시글만 상세 페이지를 로드
+- TTL / 최대 건수 초과분은 오래된 순으로 삭제
+
+효과:
+- 1페이지에 오래 머무는 게시글의 상세 페이지 반복 로드 제거
+- 실행당 상세 페이지 로드 수: O(게시글 수) → O(새 게시글 수)
+"""
+import sqlite3
+import threading
+import time
+
+from common.local_state import state_path
+from common.metrics import incr
+from common.post_id import post_key
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60   # 7일
+DEFAULT_MAX_ENTRIES = 20000
+
+
+class DetailTimeCache:
+    """
+    게시글 URL → 등록 시간(절대 시각 문자열) 캐시
+
+    Args:
+        site: 출처 사이트명 (키 접두사)
+        path: SQLite 파일 경로 (기본: 상태 디렉터리의 detail_cache.sqlite3)
+        ttl_seconds: 항목 유지 기간
+        max_entries: 최대 항목 수
+    """
+
+    def __init__(self, site, path=None, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.site = site
+        self.path = path or state_path('detail_cache.sqlite3')
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS detail_times ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' created_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_detail_times_created ON detail_times (created_at)')
+        self._conn.commit()
+
+    def get_many(self, urls):
+        """
+        캐시 조회
+
+        Returns:
+            dict: {url: 등록 시간 문자열} (캐시에 있는 항목만)
+        """
+        keys = {post_key(self.site, url): url for url in urls}
+        found = {}
+        if not keys:
+            return found
+
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT key, value FROM detail_times WHERE created_at >= ? AND key IN ({placeholders})',
+                    [cutoff, *chunk]
+                ).fetchall()
+                for key, value in rows:
+                    found[keys[key]] = value
+
+        hits, misses = len(found), len(keys) - len(found)
+        self.hits += hits
+        self.misses += misses
+        incr('detail_cache_hit', hits)
+        incr('detail_cache_miss', misses)
+        return found
+
+    def put_many(self, values):
+        """
+        캐시 저장
+
+        Args:
+            values: {url: 등록 시간 문자열}
+        """
+        if not values:
+            return
+
+        now = time.time()
+        rows = [(post_key(self.site, url), value, now) for url, value in values.items() if value]
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO detail_times (key, value, created_at) VALUES (?, ?, ?)', rows
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """TTL 만료 항목 및 최대 건수 초과분(오래된 순) 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM detail_times WHERE created_at < ?', (time.time() - self.ttl_seconds,))
+            self._conn.execute(
+                'DELETE FROM detail_times WHERE key IN ('
+                ' SELECT key FROM detail_times ORDER BY created_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / total, 3) if total else None,
+        }
+
+    def close(self):
+        try:
+            self.evict()
+        finally:
+            self._conn.close()
@@ -0,0 +1,529 @@
+"""
+페이지 HTML 수집기 (HTTP 우선, Chrome 폴백)
+
+사용 의도:
+- 서버에서 렌더링되는 게시판 목록은 requests로 바로 받아온다
+- 응답에 목록 선택자가 없을 때만 (봇 차단, JS 렌더링 등) Chrome으로 다시 시도
+- 사이트별로 'http' / 'browser' 수집 방식을 선언
+
+효과:
+- Chrome 기동 + 페이지 로딩(20~40초) 없이 1초 내외로 목록 수집
+- Chrome이 필요 없는 게시판은 브라우저를 아예 띄우지 않아 메모리 절감
+
+다음 페이지 미리 받기 (HTTP):
+- fetch_soup / fetch_rows 에 prefetch_url 을 주면 현재 페이지 응답이 도착하는 즉시
+  다음 목록 페이지를 백그라운드로 요청 → 현재 페이지 파싱 / 상세 수집 / 전송과 겹침
+- 다음 페이지가 필요 없으면(마지노선 도달) close 시 폐기, 적중/낭비 건수는 stats 와 실행 지표에 기록
+- 여러 페이지가 필요할 것으로 예상되면(common.crawl_rate) prefetch_pages 로 2페이지부터 한 번에 동시 요청
+
+대기 / 요청 간격 (common.waits):
+- Chrome 목록 대기는 준비 신호(목록 존재 + 행 수 안정)로 끝내고, 목록 없이 네트워크가 유휴면 시간 초과 전에 포기
+- 모든 요청(HTTP, 미리 받기, Chrome 이동, 새 탭)은 도메인별 토큰 버킷을 거침
+- 페이지별 대기 시간은 로그로 출력하고 close 시 요약
+
+세션 유지 (common.session_store):
+- 시작 시 저장된 쿠키 / localStorage 를 requests.Session 과 (대여한) Chrome 에 복원
+- 종료 시 목록을 정상적으로 받았으면 현재 세션 저장, 복원한 세션으로 실패했으면 저장분 삭제
+
+환경 변수:
+    PREFETCH: '0' 이면 다음 페이지 미리 받기 비활성화 (기본 활성)
+    PREFETCH_WORKERS: 미리 받기 동시 요청 수 (기본 3)
+    SESSION_STORE: '0' 이면 세션 저장/복원 비활성화 (기본 활성)
+"""
+import contextvars
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+from common.browser_pool import get_browser_pool, USER_AGENT
+from common.resource_blocker import apply_resource_blocking, collect_network_stats
+from common.row_extractor import extract_rows_from_soup, extract_rows_in_browser
+from common.metrics import span, incr
+from common.waits import wait_for_list, get_politeness
+from common.session_store import (
+    SessionStore, session_store_enabled,
+    restore_browser_session, remove_browser_session_script, capture_browser_session,
+    restore_http_session, capture_http_session,
+)
+
+FETCH_MODE_HTTP = 'http'
+FETCH_MODE_BROWSER = 'browser'
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://www.google.com/',
+}
+
+# <meta charset="euc-kr"> / <meta http-equiv="Content-Type" content="text/html; charset=euc-kr">
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w-]+)', re.IGNORECASE)
+
+
+
+def prefetch_enabled():
+    return os.environ.get('PREFETCH', '1') != '0'
+
+
+# 사이트별 Session (커넥션 풀 + 쿠키 유지)
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_http_session(site):
+    """
+    사이트별 공용 requests.Session 반환
+
+    같은 프로세스 안에서는 keep-alive 커넥션과 쿠키를 재사용한다.
+    """
+    with _sessions_lock:
+        session = _sessions.get(site)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[site] = session
+        return session
+
+
+def decode_html(response):
+    """
+    응답 바이트를 올바른 문자셋으로 디코딩
+
+    1. Content-Type 헤더의 charset
+    2. <meta charset> 선언 (뽐뿌 등 EUC-KR 페이지)
+    3. requests의 추정 인코딩
+    """
+    content = response.content
+
+    header_charset = None
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset=' in content_type.lower():
+        header_charset = response.encoding
+
+    charset = header_charset
+    if not charset:
+        match = _META_CHARSET_PATTERN.search(content[:4096])
+        if match:
+            charset = match.group(1).decode('ascii', 'ignore')
+
+    if not charset:
+        charset = response.apparent_encoding or 'utf-8'
+
+    # euc-kr 페이지에 확장 완성형 글자가 섞이는 경우가 많음
+    if charset.lower() in ('euc-kr', 'euckr', 'ks_c_5601-1987'):
+        charset = 'cp949'
+
+    try:
+        return content.decode(charset, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+class PageFetcher:
+    """
+    한 번의 크롤링 실행 동안 사용하는 페이지 수집기
+
+    Args:
+        site: 출처 사이트명 (Session 구분용)
+        mode: 'http' (HTTP 우선, Chrome 폴백) / 'browser' (Chrome만 사용)
+        pool: Chrome 브라우저 풀 (기본: 프로세스 공용 풀, Chrome이 필요해질 때 대여)
+        timeout: HTTP 요청 타임아웃 (초)
+        resource_allowlist: Chrome 리소스 차단에서 제외할 URL 패턴 (common.resource_blocker)
+    """
+
+    def __init__(self, site, mode=FETCH_MODE_HTTP, pool=None, timeout=10, resource_allowlist=None):
+        self.site = site
+        self.mode = mode
+        self.pool = pool
+        self.timeout = timeout
+        self.resource_allowlist = resource_allowlist or []
+        self.session = get_http_session(site)
+        self.politeness = get_politeness()
+
+        self._browser = None
+        self.page_waits = []  # Chrome 페이지별 목록 대기 시간 (초)
+        self.last_html = None
+        self.stats = {
+            'http': 0, 'browser': 0, 'fallback': 0,
+            'allowed_requests': 0, 'blocked_requests': 0, 'received_bytes': 0,
+            'prefetch_issued': 0, 'prefetch_hits': 0, 'prefetch_wasted': 0,
+        }
+
+        self._prefetch_executor = None
+        self._prefetched = {}  # URL → Future(requests.Response)
+
+        # 저장 세션 (None: 저장분 없음 / 비활성)
+        self._list_loaded = None  # 마지막 Chrome 로드에서 목록 확인 여부
+        self._session_script = None  # 복원용 새 문서 스크립트 식별자 (반납 전 제거)
+        self._browser_hosts = set()  # Chrome 으로 방문한 호스트 (저장할 쿠키 범위)
+        self.session_store = self._open_session_store()
+        self._saved_session = self.session_store.load() if self.session_store else None
+        if self._saved_session and not self.session.cookies:
+            restore_http_session(self.session, self._saved_session)
+            print(f"저장된 세션 복원 (HTTP): 쿠키 {len(self._saved_session['cookies'])}개")
+
+    @property
+    def driver(self):
+        """Chrome 드라이버 (필요해지는 시점에 풀에서 대여)"""
+        if self._browser is None:
+            if self.pool is None:
+                self.pool = get_browser_pool()
+            self._browser = self.pool.acquire(self.site)
+            try:
+                apply_resource_blocking(self._browser.driver, self.resource_allowlist)
+            except Exception as e:
+                print(f"리소스 차단 설정 실패 (차단 없이 진행): {e}")
+            if self._saved_session:
+                try:
+                    self._session_script = restore_browser_session(self._browser.driver, self._saved_session)
+                    incr('session_restored')
+                    print(f"저장된 세션 복원 (Chrome): 쿠키 {len(self._saved_session['cookies'])}개")
+                except Exception as e:
+                    print(f"세션 복원 실패 (새 세션으로 진행): {e}")
+        return self._browser.driver
+
+    def _open_session_store(self):
+        """세션 저장소 열기 (실패해도 저장 없이 진행)"""
+        if not session_store_enabled():
+            return None
+        try:
+            return SessionStore(self.site)
+        except Exception as e:
+            print(f"세션 저장소 사용 불가 (저장 없이 진행): {e}")
+            return None
+
+    def _save_session(self):
+        """
+        목록을 정상적으로 받은 세션 저장, 복원한 세션으로 목록 확인에 실패했으면 저장분 삭제
+
+        Chrome 을 썼으면 Chrome 세션(봇 확인 통과 쿠키 포함), 아니면 HTTP 세션 기준
+        """
+        if self.session_store is None:
+            return
+        try:
+            if self._browser is not None:
+                if self._list_loaded:
+                    driver = self._browser.driver
+                    hosts = self._browser_hosts | {urlsplit(driver.current_url).hostname}
+                    self.session_store.save(*capture_browser_session(driver, hosts))
+                elif self._list_loaded is False and self._saved_session:
+                    print("저장된 세션 거부됨 → 삭제 (다음 실행은 워밍업부터)")
+                    incr('session_rejected')
+                    self.session_store.invalidate()
+            elif self.stats['http']:
+                saved = self._saved_session or {}
+                self.session_store.save(capture_http_session(self.session), saved.get('local_storage'))
+        except Exception as e:
+            print(f"세션 저장 실패: {e}")
+        finally:
+            self.session_store.close()
+            self.session_store = None
+
+    @property
+    def has_driver(self):
+        return self._browser is not None
+
+    def fetch_soup(self, url, selector, wait_timeout=15, navigate=None, prefetch_url=None, row_selector=None):
+        """
+        페이지를 받아 BeautifulSoup 객체로 반환
+
+        Args:
+            url: 페이지 URL
+            selector: 페이지가 정상 로드되었는지 판단할 CSS 선택자 (목록 테이블 등)
+            wait_timeout: Chrome 사용 시 선택자 대기 시간 (초)
+            navigate: Chrome 사용 시 driver.get(url) 대신 호출할 이동 함수 (메뉴 클릭 등)
+            prefetch_url: 응답 도착 후 백그라운드로 미리 받을 다음 페이지 URL (HTTP 모드만)
+            row_selector: Chrome 사용 시 행 수 안정 판단에 쓸 게시글 행 선택자 (없으면 selector 존재만 확인)
+
+        Returns:
+            BeautifulSoup: 파싱된 문서
+        """
+        if self.mode == FETCH_MODE_HTTP:
+            soup = self._fetch_http(url, selector, prefetch_url=prefetch_url)
+            if soup is not None:
+                return soup
+
+            self.stats['fallback'] += 1
+            print(f"HTTP 응답에서 '{selector}' 확인 실패 → Chrome으로 재시도")
+
+        return self._fetch_browser(url, selector, wait_timeout, navigate, row_selector)
+
+    def fetch_rows(self, url, selector, spec, wait_timeout=15, navigate=None, prefetch_url=None):
+        """
+        페이지의 게시글 행을 원시 필드 dict 리스트로 반환 (common.row_extractor 명세 사용)
+
+        HTTP로 받으면 BeautifulSoup 으로, Chrome을 쓰면 페이지 안에서 JS로 추출한다.
+        Chrome 경로는 page_source 전송과 문서 전체 파싱을 하지 않는다.
+        prefetch_url 은 fetch_soup 과 같음 (HTTP 모드만).
+
+        Returns:
+            list: [{필드명: 문자열 또는 None}, ...]
+        """
+        if self.mode == FETCH_MODE_HTTP:
+            soup = self._fetch_http(url, selector, prefetch_url=prefetch_url)
+            if soup is not None:
+                return extract_rows_from_soup(soup, spec)
+
+            self.stats['fallback'] += 1
+            print(f"HTTP 응답에서 '{selector}' 확인 실패 → Chrome으로 재시도")
+
+        driver = self._load_in_browser(url, selector, wait_timeout, navigate, spec.get('rows'))
+        with span('js_extract'):
+            rows = extract_rows_in_browser(driver, spec)
+        self._record_network(driver)
+        return rows
+
+    def prefetch(self, url):
+        """다음 목록 페이지를 백그라운드로 미리 요청 (HTTP 모드만, 결과는 같은 URL 의 다음 _fetch_http 가 사용)"""
+        if self.mode != FETCH_MODE_HTTP or not url or url in self._prefetched or not prefetch_enabled():
+            return
+        if self._prefetch_executor is None:
+            workers = int(os.environ.get('PREFETCH_WORKERS', 3))
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"prefetch-{self.site}")
+        # 실행 지표(contextvars)를 이어받도록 작업마다 현재 컨텍스트 복사본에서 실행
+        self._prefetched[url] = self._prefetch_executor.submit(contextvars.copy_context().run, self._http_get, url)
+        self.stats['prefetch_issued'] += 1
+
+    def prefetch_pages(self, urls):
+        """예상 페이지를 한 번에 미리 요청 (PREFETCH_WORKERS 개씩 동시, 순서대로 사용)"""
+        for url in urls:
+            self.prefetch(url)
+
+    def discard_prefetch(self):
+        """사용하지 않은 미리 받기 폐기 (낭비 건수로 기록)"""
+        for future in self._prefetched.values():
+            future.cancel()
+            self.stats['prefetch_wasted'] += 1
+        self._prefetched = {}
+
+    def _get(self, url):
+        """미리 받은 응답이 있으면 사용, 없거나 실패했으면 바로 요청"""
+        future = self._prefetched.pop(url, None)
+        if future is not None:
+            try:
+                with span('prefetch_wait'):
+                    response = future.result()
+                self.stats['prefetch_hits'] += 1
+                return response
+            except requests.exceptions.RequestException as e:
+                print(f"미리 받기 실패 → 다시 요청: {url}, 에러: {e}")
+
+        return self._http_get(url)
+
+    def _http_get(self, url):
+        """도메인별 요청 간격을 지킨 뒤 요청 (미리 받기 스레드에서도 사용)"""
+        self.politeness.acquire(url)
+        with span('http_get'):
+            return self.session.get(url, timeout=self.timeout)
+
+    def _fetch_http(self, url, selector, remember=True, prefetch_url=None):
+        try:
+            response = self._get(url)
+        except requests.exceptions.RequestException as e:
+            print(f"HTTP 요청 실패: {url}, 에러: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(f"HTTP 요청 실패 (HTTP {response.status_code}): {url}")
+            return None
+
+        # 현재 페이지 파싱 / 후속 처리와 다음 페이지 다운로드를 겹침
+        self.prefetch(prefetch_url)
+
+        incr('http_bytes', len(response.content))
+        with span('parse'):
+            html = decode_html(response)
+            soup = BeautifulSoup(html, 'lxml')
+        if soup.select_one(selector) is None:
+            return None
+
+        if remember:
+            self.last_html = html
+        self.stats['http'] += 1
+        return soup
+
+    def _fetch_browser(self, url, selector, wait_timeout, navigate, row_selector=None):
+        driver = self._load_in_browser(url, selector, wait_timeout, navigate, row_selector)
+
+        with span('page_source'):
+            html = driver.page_source
+        self.last_html = html
+        self._record_network(driver)
+        with span('parse'):
+            return BeautifulSoup(html, 'lxml')
+
+    def _load_in_browser(self, url, selector, wait_timeout, navigate, row_selector=None):
+        """Chrome으로 페이지 이동 후 목록 준비 대기 (common.waits)"""
+        driver = self.driver
+
+        with span('driver_get'):
+            if navigate:
+                navigate(driver)  # 요청 간격은 이동 함수(common.navigation)가 처리
+            else:
+                self.politeness.acquire(url)
+                driver.get(url)
+        self._browser_hosts.add(urlsplit(url).hostname)
+
+        waited = wait_for_list(driver, selector, row_selector, timeout=wait_timeout)
+        self.page_waits.append(round(waited.seconds, 2))
+        if waited.ready:
+            print(f"게시글 로드 확인 ({waited.rows}개, 대기 {waited.seconds:.1f}초)")
+        elif waited.reason == 'idle':
+            # 목록 없이 로드가 끝난 페이지 (봇 확인 / 오류) → 시간 초과까지 기다리지 않음
+            print(f"목록 없이 페이지 로드 완료 (대기 {waited.seconds:.1f}초, 계속 진행)")
+        else:
+            # 타임아웃 되어도 계속 진행 (부분 데이터라도 수집)
+            print(f"목록 대기 시간 초과 ({waited.seconds:.1f}초, 행 {waited.rows}개, 계속 진행)")
+        self._list_loaded = waited.ready
+
+        self.stats['browser'] += 1
+        self._browser.pages += 1
+        return driver
+
+    def _record_network(self, driver):
+        """Chrome 네트워크 로그에서 허용/차단 요청 수, 수신 바이트 누적"""
+        network = collect_network_stats(driver)
+        self.stats['allowed_requests'] += network['allowed']
+        self.stats['blocked_requests'] += network['blocked']
+        self.stats['received_bytes'] += network['bytes']
+
+    def fetch_many_soups(self, urls, selector, max_workers=6, wait_timeout=15):
+        """
+        여러 페이지(상세 페이지 등)를 동시에 받아 BeautifulSoup 객체로 반환
+
+        HTTP 요청은 스레드 풀로 동시에 보내고, 선택자 확인에 실패한 페이지만
+        Chrome 탭 여러 개로 한꺼번에 연다. 현재 목록 페이지는 다시 로드하지 않는다.
+
+        Args:
+            urls: 페이지 URL 리스트
+            selector: 페이지 로드 확인용 CSS 선택자
+            max_workers: 동시 요청 수 (Chrome 폴백 시 동시 탭 수)
+            wait_timeout: Chrome 사용 시 선택자 대기 시간 (초)
+
+        Returns:
+            dict: {url: BeautifulSoup 또는 None(실패)}
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        results = {}
+        if not urls:
+            return results
+
+        remaining = urls
+        if self.mode == FETCH_MODE_HTTP:
+            with span('detail_http'), ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._fetch_http, url, selector, remember=False)
+                    for url in urls
+                ]
+                soups = [future.result() for future in futures]
+                for url, soup in zip(urls, soups):
+                    results[url] = soup
+
+            remaining = [url for url in urls if results[url] is None]
+            if remaining:
+                self.stats['fallback'] += len(remaining)
+                print(f"HTTP 응답에서 '{selector}' 확인 실패 {len(remaining)}건 → Chrome 탭으로 재시도")
+
+        for start in range(0, len(remaining), max_workers):
+            batch = remaining[start:start + max_workers]
+            try:
+                results.update(self._fetch_browser_tabs(batch, selector, wait_timeout))
+            except Exception as e:
+                print(f"Chrome 탭 수집 실패 ({len(batch)}건): {e}")
+                results.update({url: None for url in batch})
+
+        return results
+
+    def _fetch_browser_tabs(self, urls, selector, wait_timeout):
+        """새 탭 여러 개에서 동시에 로드한 뒤 하나씩 수집하고 닫음"""
+        driver = self.driver
+        results = {}
+
+        origin = driver.current_window_handle
+        before = set(driver.window_handles)
+        for url in urls:
+            self.politeness.acquire(url)
+            driver.execute_script("window.open(arguments[0], '_blank');", url)
+
+        # window.open 순서대로 핸들이 추가됨
+        new_handles = [h for h in driver.window_handles if h not in before]
+
+        for url, handle in zip(urls, new_handles):
+            try:
+                driver.switch_to.window(handle)
+                waited = wait_for_list(driver, selector, timeout=wait_timeout, stable_for=0)
+                if not waited.ready:
+                    print(f"  탭 로딩 실패: {url} ({waited.reason}, {waited.seconds:.1f}초)")
+                    results[url] = None
+                    continue
+                results[url] = BeautifulSoup(driver.page_source, 'lxml')
+                self.stats['browser'] += 1
+                self._browser.pages += 1
+            except Exception as e:
+                print(f"  탭 로딩 실패: {url}, 에러: {e}")
+                results[url] = None
+            finally:
+                driver.close()
+
+        driver.switch_to.window(origin)
+        self._record_network(driver)
+
+        for url in urls:
+            results.setdefault(url, None)
+        return results
+
+    def reset_page_state(self, clear_cookies=False):
+        """
+        페이지 간 메모리 정리 (Chrome 사용 중일 때만)
+
+        Args:
+            clear_cookies: True 면 쿠키 삭제 (기본: 유지, 봇 확인을 통과한 세션을 다음 페이지에서 재사용)
+        """
+        if self._browser is None:
+            return
+        self._browser.driver.execute_script("window.stop();")
+        if clear_cookies:
+            self._browser.driver.delete_all_cookies()
+
+    def close(self):
+        """수집 통계를 실행 지표에 기록하고 빌린 Chrome을 풀에 반납 (종료는 풀이 담당)"""
+        self._save_session()
+        self.discard_prefetch()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+        issued = self.stats['prefetch_issued']
+        if issued:
+            hits = self.stats['prefetch_hits']
+            print(f"다음 페이지 미리 받기: {issued}건 중 사용 {hits}건, 폐기 {self.stats['prefetch_wasted']}건 "
+                  f"(적중률 {hits / issued:.0%})")
+
+        if self.page_waits:
+            print(f"페이지별 목록 대기(초): {self.page_waits} (합계 {sum(self.page_waits):.1f}초)")
+            self.page_waits = []
+
+        for key, value in self.stats.items():
+            incr(f"fetch_{key}", value)
+        self.stats = {key: 0 for key in self.stats}
+
+        if self._browser is None:
+            return
+        browser, self._browser = self._browser, None
+        if self._session_script:
+            try:
+                remove_browser_session_script(browser.driver, self._session_script)
+            except Exception as e:
+                print(f"세션 복원 스크립트 제거 실패: {e}")
+            self._session_script = None
+        self._browser_hosts = set()
+        self.pool.release(browser)
@@ -2,7 +2,8 @@
 시간 필터링 유틸리티
 """
 from datetime import datetime, timedelta, timezone
-import re
+
+from common.time_parser import parse_time_kst
 
 # Python 표준 시간대 객체 (KST)
 KST = timezone(timedelta(hours=9))
@@ -29,7 +30,14 @@ def filter_by_time(items, minutes=30):
 
     for item in items:
         try:
-            time_str = item.get('crawledAt')
+            # DealItem: epoch 값으로 바로 비교
+            created_ts = getattr(item, 'created_ts', None)
+            if created_ts is not None:
+                if created_ts >= cutoff_time.timestamp():
+                    filtered.append(item)
+                continue
+
+            time_str = item.get('createdAt') or item.get('crawledAt')
             if not time_str:
                 continue
 
@@ -58,154 +66,11 @@ def filter_by_time(items, minutes=30):
 
 def parse_time(time_str):
     """
-    다양한 시간 문자열을 datetime 객체로 변환
+    다양한 시간 문자열을 datetime 객체로 변환 (common.time_parser 사용)
 
     None: 파싱 실패
     """
-    if not time_str:
-        return None
-
-    kst = timezone(timedelta(hours=9))
-    now = datetime.now(kst)
-    time_str = time_str.strip()
-    print(f"time_str = {time_str}")
-
-    try:
-        # 'yyyy-MM-dd HH:mm:ss'
-        if len(time_str) == 19 and time_str[10] == ' ':
-            dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-            return dt.replace(tzinfo=kst)
-
-        # 상대 시간 ("N분 전", "N시간 전" 등)
-        # 방금 전 or 초
-        if '방금' in time_str or '초' in time_str:
-            return now
-
-        # N분 전
-        match = re.search(r'(\d+)분\s*전', time_str)
-        if match:
-            minutes = int(match.group(1))
-            return now - timedelta(minutes=minutes)
-
-        # N시간 전
-        match = re.search(r'(\d+)시간\s*전', time_str)
-        if match:
-            hours = int(match.group(1))
-            return now - timedelta(hours=hours)
-
-        # N일 전
-        match = re.search(r'(\d+)일\s*전', time_str)
-        if match:
-            days = int(match.group(1))
-            return now - timedelta(days=days)
-
-        # "YYYY-MM-DDTHH:MM:SS+09:00" (ISO 8601)
-        if 'T' in time_str:
-            return datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-
-        # "YYYY-MM-DD HH:MM" 형식
-        if '-' in time_str and ':' in time_str:
-            print("test")
-
-            try:
-                # 초(second)가 있는 형식 먼저 시도
-                dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                return dt.replace(tzinfo=kst)
-            except ValueError:
-                try:
-                    # 초(second)가 없는 형식 시도
-                    dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M')
-                    print(f"{dt.replace(tzinfo=kst)}")
-                    return dt.replace(tzinfo=kst)
-                except ValueError:
-                    # "MM-DD HH:MM" 형식 시도
-                    try:
-                        parsed = datetime.strptime(time_str, '%m-%d %H:%M')
-                        dt = parsed.replace(year=now.year)
-                        return dt.replace(tzinfo=kst)
-                    except ValueError:
-                        pass  # 다른 형식일 수 있으므로 계속 진행
-
-        # "HH:MM:SS" 형식 (당일)
-        if ':' in time_str and 'T' not in time_str and '-' not in time_str and '.' not in time_str and '/' not in time_str:
-            print("HH:MM:SS type")
-            try:
-                if len(time_str.split(':')) == 3:
-                    parsed = datetime.strptime(time_str, '%H:%M:%S')
-                else:
-                    parsed = datetime.strptime(time_str, '%H:%M')
-
-                article_time = now.replace(hour=parsed.hour, minute=parsed.minute,
-                                           second=parsed.second if len(time_str.split(':')) == 3 else 0,
-                                           microsecond=0)
-
-                # 미래 시간이면 어제로 처리
-                if article_time > now:
-                    article_time -= timedelta(days=1)
-
-                print(f"article_time : {article_time}")
-                return article_time
-
-            except ValueError:
-                pass
-
-            # YYYY-MM-DD HH:MM:SS 형식 (초 포함)
-            if '-' in time_str and ':' in time_str:
-                try:
-                    dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                    return dt.replace(tzinfo=kst)
-                except ValueError:
-                    try:
-                        # 초 없는 형식
-                        dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M')
-                        return dt.replace(tzinfo=kst)
-                    except ValueError:
-                        # MM-DD HH:MM 형식
-                        try:
-                            parsed = datetime.strptime(time_str, '%m-%d %H:%M')
-                            dt = parsed.replace(year=now.year)
-                            return dt.replace(tzinfo=kst)
-                        except ValueError:
-                            pass
-
-        # "YYYY.MM.DD" 형식 (루리웹)
-        if '.' in time_str and len(time_str.split('.')) == 3:
-
-            try:
-                dt = datetime.strptime(time_str, '%Y.%m.%d')
-                return dt.replace(tzinfo=kst)
-            except ValueError:
-                try:
-                    # 2. 4자리 연도가 실패하면, 2자리 연도 (YY.MM.DD) 형식 시도
-                    dt = datetime.strptime(time_str, '%y.%m.%d')
-                    return dt.replace(tzinfo=kst)
-                except ValueError:
-                    # 두 형식 모두 실패하면 다음 로직으로
-                    pass
-
-        # "YYYY/MM/DD" 형식
-        if '/' in time_str:
-            try:
-                dt = datetime.strptime(time_str, '%Y/%m/%d')
-                return dt.replace(tzinfo=kst)
-            except:
-                pass
-
-        # "MM-DD HH:MM" 형식 (올해)
-        if '-' in time_str and ':' in time_str:
-            try:
-                parsed = datetime.strptime(time_str, '%m-%d %H:%M')
-                dt = parsed.replace(year=now.year)
-                return dt.replace(tzinfo=kst)
-            except:
-                pass
-
-
-        return None
-
-    except Exception as e:
-        print(f"[시간 파싱 실패] {time_str}: {e}")
-        return None
+    return parse_time_kst(time_str)
 
 
 def to_iso8601(dt):
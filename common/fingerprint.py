@@ -0,0 +1,178 @@
+"""
+게시글 변경 감지 (필드 지문 저장소, SQLite)
+
+사용 의도:
+- 시간 범위 안의 게시글을 실행마다 모두 다시 전송 → 대부분 아무것도 바뀌지 않은 반복 전송
+- 게시글 키(post_key)별로 마지막으로 전송한 필드 값을 저장하고,
+  이번 실행 게시글을 새 글 / 변경(바뀐 필드 목록) / 변경 없음으로 분류
+- 새 글과 변경된 글만 전송, 변경 없는 글은 전송 제외
+
+효과:
+- 전송량 및 백엔드 쓰기 부하 감소 (특히 INCREMENTAL_CRAWL=0 또는 게시글 번호가 없는 게시판)
+
+워터마크(common.watermark)와의 관계:
+- INCREMENTAL_CRAWL=1(기본) 이면 지난 실행에서 전송한 번호 이하 게시글은 분류 전에 제외되므로,
+  여기서 보는 게시글은 새 글뿐 → 좋아요 / 댓글 수 변경은 감지되지 않음
+- 이미 보낸 게시글의 변경까지 전송하려면 INCREMENTAL_CRAWL=0 (시간 범위 안 게시글을 모두 분류)
+
+환경 변수:
+    CHANGE_DETECTION: '0' 이면 비활성화 (기본 활성)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from common.deal_item import as_dict
+from common.local_state import state_path
+from common.post_id import post_key
+
+DEFAULT_TTL_SECONDS = 2 * 24 * 60 * 60   # 2일
+DEFAULT_MAX_ENTRIES = 50000
+
+# 실행 시각에 따라 바뀌는 필드 (변경 판단에서 제외)
+# createdAt: 상대 시간("N분 전") 게시판은 실행마다 다른 시각으로 해석되어 지문이 고정되지 않음
+VOLATILE_FIELDS = ('createdAt',)
+
+
+def change_detection_enabled():
+    return os.environ.get('CHANGE_DETECTION', '1') != '0'
+
+
+def _fields(item):
+    return {k: v for k, v in as_dict(item).items() if k not in VOLATILE_FIELDS}
+
+
+def _stored_fields(item):
+    """저장 형태(JSON 왕복)의 필드 (datetime 등은 문자열로 비교)"""
+    return json.loads(json.dumps(_fields(item), ensure_ascii=False, default=str))
+
+
+def fingerprint(item):
+    """게시글 필드 해시 (필드 순서 무관)"""
+    data = json.dumps(_fields(item), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+class FingerprintStore:
+    """
+    게시글 키 → 마지막 전송 필드 (해시 + 값)
+
+    Args:
+        site: 출처 사이트명 (키 접두사)
+        path: SQLite 파일 경로 (기본: 상태 디렉터리의 fingerprints.sqlite3)
+        ttl_seconds: 항목 유지 기간
+        max_entries: 최대 항목 수
+    """
+
+    def __init__(self, site, path=None, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.site = site
+        self.path = path or state_path('fingerprints.sqlite3')
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        self.changed_fields = {}  # 필드명 → 변경 횟수
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS fingerprints ('
+            ' key TEXT PRIMARY KEY,'
+            ' hash TEXT NOT NULL,'
+            ' fields TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_fingerprints_updated ON fingerprints (updated_at)')
+        self._conn.commit()
+
+    def classify(self, items):
+        """
+        새 글 / 변경 / 변경 없음 분류
+
+        Returns:
+            list: 전송 대상 (새 글 + 변경된 글, 원래 순서 유지)
+        """
+        keys = [post_key(self.site, item.get('productUrl')) for item in items]
+        stored = self._load(keys)
+
+        changed_items = []
+        for key, item in zip(keys, items):
+            previous = stored.get(key)
+            if previous is None:
+                self.counts['new'] += 1
+                changed_items.append(item)
+                continue
+
+            previous_hash, previous_fields = previous
+            if previous_hash == fingerprint(item):
+                self.counts['unchanged'] += 1
+                continue
+
+            self.counts['changed'] += 1
+            changed_items.append(item)
+            fields = _stored_fields(item)
+            for name in set(fields) | set(previous_fields):
+                if fields.get(name) != previous_fields.get(name):
+                    self.changed_fields[name] = self.changed_fields.get(name, 0) + 1
+
+        return changed_items
+
+    def commit(self, items):
+        """전송 성공한 게시글의 필드 저장"""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [
+            (post_key(self.site, item.get('productUrl')), fingerprint(item),
+             json.dumps(_fields(item), ensure_ascii=False, default=str), now)
+            for item in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO fingerprints (key, hash, fields, updated_at) VALUES (?, ?, ?, ?)', rows
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """TTL 만료 항목 및 최대 건수 초과분(오래된 순) 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM fingerprints WHERE updated_at < ?', (time.time() - self.ttl_seconds,))
+            self._conn.execute(
+                'DELETE FROM fingerprints WHERE key IN ('
+                ' SELECT key FROM fingerprints ORDER BY updated_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def stats(self):
+        total = sum(self.counts.values())
+        return {
+            **self.counts,
+            'suppression_ratio': round(self.counts['unchanged'] / total, 3) if total else None,
+            'changed_fields': self.changed_fields,
+        }
+
+    def close(self):
+        try:
+            self.evict()
+        finally:
+            self._conn.close()
+
+    def _load(self, keys):
+        found = {}
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT key, hash, fields FROM fingerprints WHERE updated_at >= ? AND key IN ({placeholders})',
+                    [cutoff, *chunk]
+                ).fetchall()
+                for key, hash_value, fields in rows:
+                    found[key] = (hash_value, json.loads(fields))
+        return found
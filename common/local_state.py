@@ -0,0 +1,22 @@
+"""
+로컬 상태 파일 경로 관리
+
+사용 의도: 실행 간에 유지할 캐시/상태 파일(SQLite 등)의 저장 위치를 한 곳에서 결정
+효과: CRAWLER_STATE_DIR 환경 변수로 EFS 등 영구 볼륨을 지정하면 컨테이너 재시작 후에도 유지
+"""
+import os
+import tempfile
+
+DEFAULT_STATE_DIR = os.path.join(tempfile.gettempdir(), 'scandeals-crawler')
+
+
+def get_state_dir():
+    """상태 디렉터리 경로 (없으면 생성)"""
+    state_dir = os.environ.get('CRAWLER_STATE_DIR', DEFAULT_STATE_DIR)
+    os.makedirs(state_dir, exist_ok=True)
+    return state_dir
+
+
+def state_path(filename):
+    """상태 디렉터리 아래 파일 경로"""
+    return os.path.join(get_state_dir(), filename)
@@ -1,8 +1,11 @@
 from datetime import datetime
 
+from common.deal_item import as_dict
+
 
 def log_item(item):
 
+    item = as_dict(item)
     if not item or not isinstance(item, dict):
         print("  [DEBUG] 로깅할 아이템이 없거나 형식이 올바르지 않습니다.")
         return
@@ -10,7 +13,7 @@ def log_item(item):
     field_order = [
         'title', 'price', 'shippingFee', 'storeName', 'category',
         'productUrl', 'imageUrl', 'replyCount', 'likeCount',
-        'sourceSite', 'crawledAt'
+        'sourceSite', 'createdAt'
     ]
 
     log_parts = []
@@ -24,7 +27,7 @@ def log_item(item):
             if value is None:
                 value = 'N/A'
 
-            if field == 'crawledAt' and value and isinstance(value, str) and 'T' in value:
+            if field == 'createdAt' and value and isinstance(value, str) and 'T' in value:
                 try:
                     # ISO 8601 문자열을 datetime 객체로 변환
                     dt_obj = datetime.fromisoformat(value)
@@ -0,0 +1,185 @@
+"""
+실행 단위 구간(phase) 시간 측정 + 구조화 지표 출력
+
+사용 의도:
+- print 로그만으로는 실행 시간이 어디에 쓰이는지(드라이버 기동, driver.get, 대기, 파싱, 추출, 전송) 알 수 없음
+- 크롤링 1회 실행 동안 구간별 소요 시간과 카운터(페이지, 게시글, 바이트, 재시도)를 모아
+  실행 종료 시 JSON 한 줄(CloudWatch EMF 형식)로 출력
+
+사용법:
+    run = start_run('PPOMPPU')
+    with span('scrape'):
+        ...
+    incr('items', len(items))
+    gauge('adaptive_interval_seconds', 120)
+    run.finish()
+
+- span / incr / gauge / timed 는 현재 실행(contextvars)에 기록, 실행 중이 아니면 아무것도 하지 않음
+- 구간은 중첩될 수 있음 (예: scrape 안의 driver_get) → 구간 합계가 전체 시간보다 클 수 있음
+
+환경 변수:
+    METRICS_NAMESPACE: EMF 네임스페이스 (기본 ScanDeals/Crawler)
+    METRICS_FILE: 지정 시 같은 JSON 줄을 파일에도 추가 (로컬 분석용)
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_NAMESPACE = 'ScanDeals/Crawler'
+
+_current_run = contextvars.ContextVar('current_run', default=None)
+
+
+class RunMetrics:
+    """
+    크롤링 1회 실행의 구간 시간 / 카운터
+
+    Args:
+        site: 출처 사이트명 (EMF 차원)
+    """
+
+    def __init__(self, site):
+        self.site = site
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.phases = {}      # 구간명 → 누적 ms
+        self.counters = {}    # 카운터명 → 값
+        self.properties = {}  # 지표가 아닌 부가 정보 (success, error 등)
+        self._lock = threading.Lock()
+        self._finished = False
+
+    def add_duration(self, phase, ms):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + ms
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name, value):
+        """누적이 아닌 값 (마지막 기록값 사용)"""
+        with self._lock:
+            self.counters[name] = value
+
+    def set(self, name, value):
+        self.properties[name] = value
+
+    def fail(self, error):
+        self.properties['success'] = False
+        self.properties['error'] = str(error)
+
+    def elapsed_ms(self):
+        """실행 시작 후 경과 시간 (ms)"""
+        return (time.perf_counter() - self._start) * 1000
+
+    def record(self):
+        """EMF 형식 레코드 (dict)"""
+        total_ms = self.elapsed_ms()
+
+        values = {f"{phase}_ms": round(ms, 1) for phase, ms in self.phases.items()}
+        values['total_ms'] = round(total_ms, 1)
+        values.update(self.counters)
+
+        definitions = [
+            {'Name': name, 'Unit': _unit(name)}
+            for name in values
+        ]
+
+        return {
+            '_aws': {
+                'Timestamp': int(self.started * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': os.environ.get('METRICS_NAMESPACE', DEFAULT_NAMESPACE),
+                    'Dimensions': [['Site']],
+                    'Metrics': definitions,
+                }],
+            },
+            'Site': self.site,
+            'success': True,
+            **self.properties,
+            **values,
+        }
+
+    def finish(self):
+        """지표 출력 (stdout + METRICS_FILE), 실행 컨텍스트 해제"""
+        if self._finished:
+            return None
+        self._finished = True
+
+        line = json.dumps(self.record(), ensure_ascii=False)
+        print(line)
+
+        path = os.environ.get('METRICS_FILE')
+        if path:
+            try:
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+            except OSError as e:
+                print(f"지표 파일 기록 실패: {e}")
+
+        if _current_run.get() is self:
+            _current_run.set(None)
+        return line
+
+
+def _unit(name):
+    if name.endswith('_ms'):
+        return 'Milliseconds'
+    if name.endswith('_bytes'):
+        return 'Bytes'
+    if name.endswith('_seconds'):
+        return 'Seconds'
+    return 'Count'
+
+
+def start_run(site):
+    """새 실행 시작 (현재 스레드/컨텍스트의 기록 대상으로 설정)"""
+    run = RunMetrics(site)
+    _current_run.set(run)
+    return run
+
+
+def current_run():
+    return _current_run.get()
+
+
+@contextmanager
+def span(phase):
+    """구간 시간 측정 (실행 중이 아니면 측정만 생략)"""
+    run = _current_run.get()
+    if run is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.add_duration(phase, (time.perf_counter() - start) * 1000)
+
+
+def incr(name, value=1):
+    run = _current_run.get()
+    if run is not None:
+        run.incr(name, value)
+
+
+def gauge(name, value):
+    run = _current_run.get()
+    if run is not None:
+        run.gauge(name, value)
+
+
+def timed(phase):
+    """함수 전체를 구간으로 측정하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
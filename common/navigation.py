@@ -0,0 +1,133 @@
+"""
+Chrome 게시판 페이지 이동 계획 (페이지당 로드 1회)
+
+사용 의도:
+- 펨코리아 / 루리웹 _navigate 가 메뉴·페이지 번호 클릭(또는 대체 driver.get) + 고정 대기 후
+  driver.get(url) 을 무조건 한 번 더 호출 → 논리 페이지 1개에 2~3회 로드 + 수 초 대기
+- 펨코리아 1페이지는 매 실행 홈페이지 방문 + 메뉴 클릭
+- 목록 URL 로 바로 한 번 이동하고, 봇 확인 페이지가 감지될 때만 사이트별 워밍업
+  (홈페이지 → 메뉴 클릭)을 거쳐 다시 이동
+- 워밍업은 실행(세션)당 한 번, 쿠키는 페이지 간 유지 (fetcher.reset_page_state(clear_cookies=False))
+- 목록 확인은 준비 신호로 판단 (common.waits.wait_for_list): 목록 없이 로드가 끝나면 바로 워밍업,
+  봇 확인 페이지가 진행 중이면 ready_timeout 까지 통과를 기다림
+- 이동 / 재시도는 도메인별 요청 간격(common.waits.get_politeness)을 거침, 재시도 간격은 2, 4, ... 초 (retry_delay 이하)
+
+지표:
+    page_loads: 페이지 로드 수 (워밍업 포함), 페이지별 로드 수는 로그로 출력
+    nav_warmups: 워밍업 실행 수
+
+사용법:
+    self.navigator = NavigationPlanner(self.list_selector, warmup=self._warmup)
+    fetcher.fetch_rows(url, ..., navigate=lambda driver: self.navigator.navigate(driver, page_num, url))
+"""
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from common.metrics import incr
+from common.waits import wait_for_list, get_politeness
+
+# 봇 확인 / 차단 페이지 표시 (제목 또는 본문, 소문자 비교)
+CHALLENGE_MARKERS = (
+    'just a moment', 'attention required', 'cf-chl', 'captcha',
+    'access denied', '보안 시스템', '잠시만 기다', '비정상적인 접근',
+)
+
+
+class NavigationPlanner:
+    """
+    게시판 목록 페이지 이동 (실행 단위로 생성)
+
+    Args:
+        list_selector: 목록이 정상 로드되었는지 판단할 CSS 선택자
+        warmup: 봇 확인 페이지 감지 시 호출할 함수 warmup(driver) → 발생한 페이지 로드 수
+        ready_timeout: 이동 후 목록 선택자 대기 시간 (초, 초과하면 봇 확인 여부 판단)
+        load_retries: driver.get 실패 시 재시도 횟수
+        retry_delay: 재시도 간격 상한 (초)
+    """
+
+    def __init__(self, list_selector, warmup=None, ready_timeout=10, load_retries=3, retry_delay=10):
+        self.list_selector = list_selector
+        self.warmup = warmup
+        self.ready_timeout = ready_timeout
+        self.load_retries = load_retries
+        self.retry_delay = retry_delay
+        self.politeness = get_politeness()
+
+        self.warmed_up = False
+        self.loads = {}  # 페이지 번호 → 로드 수
+
+    def navigate(self, driver, page_num, url):
+        """page_num 페이지(url)로 이동 (정상이면 로드 1회)"""
+        loads = self._load(driver, url)
+
+        if not self._list_ready(driver):
+            challenge = self._challenge_marker(driver)
+            if self.warmup and not self.warmed_up:
+                print(f"  목록 확인 실패 ({challenge or '목록 없음'}) → 워밍업 이동 후 재시도")
+                incr('nav_warmups')
+                self.warmed_up = True
+                try:
+                    loads += self.warmup(driver)
+                except Exception as e:
+                    print(f"  워밍업 실패 (직접 이동): {e}")
+                if not self._at(driver, url):
+                    loads += self._load(driver, url)
+            else:
+                print(f"  목록 확인 실패 ({challenge or '목록 없음'}), 워밍업 없이 진행")
+
+        self.loads[page_num] = self.loads.get(page_num, 0) + loads
+        incr('page_loads', loads)
+        print(f"  {page_num}페이지 로드 {loads}회")
+
+    def summary(self):
+        """페이지별 로드 수 요약 문자열"""
+        total = sum(self.loads.values())
+        pages = len(self.loads)
+        if not pages:
+            return "페이지 로드 없음"
+        return f"페이지 로드 {total}회 / {pages}페이지 (페이지당 {total / pages:.1f}회, 워밍업 {'O' if self.warmed_up else 'X'})"
+
+    def _load(self, driver, url):
+        """driver.get (실패 시 재시도), 시도한 로드 수 반환"""
+        for attempt in range(1, self.load_retries + 1):
+            try:
+                self.politeness.acquire(url)
+                driver.get(url)
+                return attempt
+            except WebDriverException as e:
+                if attempt == self.load_retries:
+                    print(f"  최종 실패: {e}")
+                    raise
+                delay = min(2 ** attempt, self.retry_delay)
+                print(f"  재시도 {attempt}/{self.load_retries} ({delay}초 후)...")
+                time.sleep(delay)
+
+    def _list_ready(self, driver):
+        """목록 준비 여부 (목록 없이 로드가 끝났어도 봇 확인 진행 중이면 남은 시간까지 통과 대기)"""
+        waited = wait_for_list(driver, self.list_selector, timeout=self.ready_timeout)
+        if waited.ready:
+            return True
+        remaining = self.ready_timeout - waited.seconds
+        if waited.reason == 'idle' and remaining > 0 and self._challenge_marker(driver):
+            return wait_for_list(driver, self.list_selector, timeout=remaining, idle_for=remaining).ready
+        return False
+
+    @staticmethod
+    def _challenge_marker(driver):
+        """봇 확인 페이지 표시 문자열 (없으면 None)"""
+        try:
+            text = f"{driver.title}\n{driver.page_source[:20000]}".lower()
+        except Exception:
+            return None
+        for marker in CHALLENGE_MARKERS:
+            if marker in text:
+                return marker
+        return None
+
+    @staticmethod
+    def _at(driver, url):
+        try:
+            return driver.current_url.rstrip('/') == url.rstrip('/')
+        except Exception:
+            return False
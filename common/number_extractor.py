@@ -4,6 +4,8 @@
 
 import re
 
+from common.price_parser import parse_title, parse_shipping
+
 
 # 가격
 def extract_price_from_text(title):
@@ -16,125 +18,24 @@ def extract_price_from_text(title):
     - 5,090원 → 5090
     - ￦ 376,650 (KRW) → 376650
     - ￦69920 → 69920
-    """
-
-    if not title:
-        return None
-
-        # 만원 단위: 12.3만원, 5만원
-        man_pattern = r'([0-9]+\.?[0-9]*)\s*만\s*원'
-        man_match = re.search(man_pattern, title)
-        if man_match:
-            try:
-                return int(float(man_match.group(1)) * 10000)
-            except ValueError:
-                pass
-
-        # 원화 기호: ￦69920, ₩99,000
-        won_symbol_patterns = [
-            r'[￦₩]\s*([0-9,]+)',
-        ]
-        for pattern in won_symbol_patterns:
-            match = re.search(pattern, title)
-            if match:
-                price_text = match.group(1).replace(',', '')
-                try:
-                    price = int(price_text)
-                    if 100 <= price <= 100000000:
-                        return price
-                except ValueError:
-                    pass
-
-        # 콤마 + 원: 8,910원, 139,000원
-        comma_won_pattern = r'([0-9,]+)\s*원'
-        comma_won_match = re.search(comma_won_pattern, title)
-        if comma_won_match:
-            price_text = comma_won_match.group(1).replace(',', '')
-            try:
-                price = int(price_text)
-                if 100 <= price <= 100000000:
-                    return price
-            except ValueError:
-                pass
-
-        # 순수 숫자 (4자리 이상): 69920
-        pure_number_pattern = r'(?<!\d)([0-9]{4,})(?!\d)'
-        pure_number_match = re.search(pure_number_pattern, title)
-        if pure_number_match:
-            try:
-                price = int(pure_number_match.group(1))
-                if 1000 <= price <= 100000000:
-                    return price
-            except ValueError:
-                pass
-
-        # 달러
-        dollar_patterns = [
-            r'\$\s*([0-9,]+(?:\.[0-9]{1,2})?)',
-            r'([0-9,]+(?:\.[0-9]{1,2})?)\s*달러',
-            r'([0-9,]+(?:\.[0-9]{1,2})?)\s*USD',
-        ]
-        for pattern in dollar_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group(0)  # 문자열 그대로 반환
-
-        # 엔화
-        yen_patterns = [
-            r'¥\s*([0-9,]+)',
-            r'([0-9,]+)\s*엔',
-            r'([0-9,]+)\s*JPY',
-        ]
-        for pattern in yen_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group(0)  # 문자열 그대로 반환
-
-        # 유로
-        euro_patterns = [
-            r'€\s*([0-9,]+(?:\.[0-9]{1,2})?)',
-            r'([0-9,]+(?:\.[0-9]{1,2})?)\s*유로',
-            r'([0-9,]+(?:\.[0-9]{1,2})?)\s*EUR',
-        ]
-        for pattern in euro_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group(0)  # 문자열 그대로 반환
-
-        # 무료 키워드
-        free_keywords = ['무료', '나눔', '공짜', 'free']
-        if any(keyword in title.lower() for keyword in free_keywords):
-            if '무료' in title and '원' not in title:
-                return None
+    - $899 → '$899' (외화는 문자열 그대로)
 
-        return None
+    형식 인식은 common.price_parser.parse_title (한 번 스캔)
+    """
+    info = parse_title(title)
+    if info.currency and info.currency != 'KRW':
+        return info.price_text
+    return info.price
 
 
 # 배송비
 def extract_shipping_fee(target_text):
     """
-    제목에서 배송비 추출 (공통)
-    """
-
-    if not target_text:
-        return None
-
-    free_keywords = ['무료', '무배', '무료배송', '배송비무료', '0', '공짜']
+    배송비 추출 (공통) → '무료' / '2,500원' / None
 
-    # 1. 무료배송 키워드
-    if any(keyword in target_text for keyword in free_keywords):
-        return "무료"
-
-    # 2. 배송비 2500원
-    shipping_pattern = r'배송비?\s*[:：]?\s*([0-9,]+)원?'
-    shipping_match = re.search(shipping_pattern, target_text)
-    if shipping_match:
-        fee = int(shipping_match.group(1).replace(',', ''))
-        if fee == 0:
-            return "무료배송"
-        return f"{fee:,}원"
-
-    return None
+    형식 인식은 common.price_parser.parse_shipping
+    """
+    return parse_shipping(target_text)
 
 
 def format_price(price):
@@ -0,0 +1,240 @@
+"""
+전송 실패 게시글 보관함 (outbox, SQLite)
+
+사용 의도:
+- API 재시도를 모두 실패한 배치의 게시글은 그대로 버려지고, 다음 실행에서 같은 페이지를 다시 크롤링해야 복구됨
+- 실패한 게시글을 디스크에 보관하고, 다음 실행 시작 시 크롤링보다 먼저 재전송(drain)
+- 게시글 키(post_key) 기준 중복 제거, 최대 건수 / 최대 용량 / 보관 기간 초과분은 오래된 순으로 삭제
+
+효과:
+- 백엔드 장애 중 수집한 게시글을 재크롤링 없이 복구
+- 보관에 성공하면 워터마크를 저장해도 유실이 없으므로 다음 실행은 새 글만 크롤링
+
+환경 변수:
+    OUTBOX: '0' 이면 비활성화 (기본 활성)
+    OUTBOX_MAX_ITEMS: 사이트별 최대 보관 건수 (기본 5000)
+    OUTBOX_MAX_BYTES: 사이트별 최대 보관 용량 (기본 20MB)
+    OUTBOX_MAX_AGE_HOURS: 보관 기간 (기본 24시간, 핫딜 특성상 오래된 게시글은 전송 의미 없음)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from common.deal_item import as_dict
+from common.local_state import state_path
+from common.post_id import post_key
+
+DEFAULT_MAX_ITEMS = 5000
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_AGE_HOURS = 24
+
+
+def outbox_enabled():
+    return os.environ.get('OUTBOX', '1') != '0'
+
+
+class Outbox:
+    """
+    사이트별 전송 실패 게시글 보관함
+
+    Args:
+        site: 출처 사이트명
+        path: SQLite 파일 경로 (기본: 상태 디렉터리의 outbox.sqlite3)
+        max_items: 최대 보관 건수
+        max_bytes: 최대 보관 용량 (직렬화된 게시글 기준)
+        max_age_seconds: 보관 기간
+    """
+
+    def __init__(self, site, path=None, max_items=None, max_bytes=None, max_age_seconds=None):
+        self.site = site
+        self.path = path or state_path('outbox.sqlite3')
+        self.max_items = max_items or int(os.environ.get('OUTBOX_MAX_ITEMS', DEFAULT_MAX_ITEMS))
+        self.max_bytes = max_bytes or int(os.environ.get('OUTBOX_MAX_BYTES', DEFAULT_MAX_BYTES))
+        self.max_age_seconds = max_age_seconds or float(os.environ.get('OUTBOX_MAX_AGE_HOURS', DEFAULT_MAX_AGE_HOURS)) * 3600
+
+        self._lock = threading.Lock()
+        # 여러 사이트 스레드가 같은 파일을 쓰므로 잠금 대기 시간 지정
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS outbox ('
+            ' key TEXT PRIMARY KEY,'
+            ' site TEXT NOT NULL,'
+            ' payload TEXT NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' created_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_outbox_site_created ON outbox (site, created_at)')
+        self._conn.commit()
+
+    def spool(self, items):
+        """
+        게시글 보관 (같은 게시글은 최신 내용으로 교체, 최초 보관 시각 유지)
+
+        Returns:
+            int: 보관한 게시글 수 (한도 / 기간 초과로 바로 삭제된 게시글 제외)
+        """
+        rows = []
+        now = time.time()
+        for item in items:
+            try:
+                payload = json.dumps(as_dict(item), ensure_ascii=False)
+            except (TypeError, ValueError) as e:
+                print(f"[OUTBOX] 직렬화 실패, 보관 제외: {e}")
+                continue
+            rows.append((self._key(item), self.site, payload, len(payload.encode('utf-8')), now))
+
+        if not rows:
+            return 0
+
+        # 한 트랜잭션으로 기록 (커밋 1회 = fsync 1회)
+        with self._lock:
+            self._conn.executemany(
+                'INSERT INTO outbox (key, site, payload, size, created_at) VALUES (?, ?, ?, ?, ?)'
+                ' ON CONFLICT(key) DO UPDATE SET payload = excluded.payload, size = excluded.size',
+                rows
+            )
+            self._conn.commit()
+
+        self.evict()
+
+        # 방금 기록한 게시글도 한도 초과로 삭제될 수 있으므로 남은 것만 보관으로 계산
+        kept = self._existing({key for key, *_ in rows})
+        spooled = sum(1 for key, *_ in rows if key in kept)
+        if spooled < len(rows):
+            print(f"[OUTBOX] {self.site}: {len(rows)}개 중 {len(rows) - spooled}개는 보관 한도 초과로 보관 못 함")
+        print(f"[OUTBOX] {self.site}: {spooled}개 보관")
+        return spooled
+
+    def pending(self):
+        """보관 기간 이내 게시글 (오래된 순)"""
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT payload FROM outbox WHERE site = ? AND created_at >= ? ORDER BY created_at',
+                (self.site, cutoff)
+            ).fetchall()
+        return [json.loads(payload) for payload, in rows]
+
+    def ack(self, items):
+        """전송 완료한 게시글 삭제"""
+        keys = [(self._key(item),) for item in items]
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany('DELETE FROM outbox WHERE key = ?', keys)
+            self._conn.commit()
+
+    def mark_failed(self, items):
+        """재전송 실패 횟수 기록"""
+        keys = [(self._key(item),) for item in items]
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany('UPDATE outbox SET attempts = attempts + 1 WHERE key = ?', keys)
+            self._conn.commit()
+
+    def evict(self):
+        """
+        보관 기간 초과분, 최대 건수 / 최대 용량 초과분(오래된 순) 삭제
+
+        Returns:
+            int: 삭제한 게시글 수
+        """
+        with self._lock:
+            deleted = self._conn.execute(
+                'DELETE FROM outbox WHERE site = ? AND created_at < ?',
+                (self.site, time.time() - self.max_age_seconds)
+            ).rowcount
+
+            rows = self._conn.execute(
+                'SELECT key, size FROM outbox WHERE site = ? ORDER BY created_at DESC',
+                (self.site,)
+            ).fetchall()
+            total = 0
+            overflow = []
+            for index, (key, size) in enumerate(rows):
+                total += size
+                if index >= self.max_items or total > self.max_bytes:
+                    overflow.append((key,))
+
+            if overflow:
+                self._conn.executemany('DELETE FROM outbox WHERE key = ?', overflow)
+            self._conn.commit()
+
+        deleted += len(overflow)
+        if deleted:
+            print(f"[OUTBOX] {self.site}: 보관 한도 / 기간 초과 {deleted}개 삭제")
+        return deleted
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM outbox WHERE site = ?', (self.site,)).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def _existing(self, keys):
+        """보관함에 있는 키"""
+        keys = list(keys)
+        found = set()
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                found.update(key for key, in self._conn.execute(
+                    f'SELECT key FROM outbox WHERE key IN ({placeholders})', chunk
+                ))
+        return found
+
+    def _key(self, item):
+        return post_key(self.site, item.get('productUrl'))
+
+
+def drain_outbox(client, site):
+    """
+    보관된 게시글 재전송 (크롤링 전에 호출)
+
+    Returns:
+        dict: {'replayed': 전송 성공 수, 'failed': 전송 실패 수, 'remaining': 남은 보관 수,
+               'sent_items': 전송 성공 게시글 (변경 감지 지문 저장용)}
+    """
+    outbox = Outbox(site)
+    try:
+        outbox.evict()
+        items = outbox.pending()
+        if not items:
+            return {'replayed': 0, 'failed': 0, 'remaining': 0, 'sent_items': []}
+
+        print(f"[OUTBOX] {site}: 보관된 게시글 {len(items)}개 재전송")
+        result = client.send(site, items)
+
+        failed_keys = {outbox._key(item) for item in result['failed_items']}
+        sent = [item for item in items if outbox._key(item) not in failed_keys]
+        outbox.ack(sent)
+        outbox.mark_failed(result['failed_items'])
+        return {'replayed': len(sent), 'failed': len(result['failed_items']), 'remaining': outbox.count(),
+                'sent_items': sent}
+    finally:
+        outbox.close()
+
+
+def spool_failed(site, items):
+    """
+    전송 실패 게시글 보관
+
+    Returns:
+        bool: 모두 보관했는지 여부 (보관함 오류 / 한도 초과로 일부 삭제 시 False → 워터마크 유지)
+    """
+    if not items:
+        return True
+    outbox = Outbox(site)
+    try:
+        return outbox.spool(items) == len(items)
+    except sqlite3.Error as e:
+        print(f"[OUTBOX] {site}: 보관 실패: {e}")
+        return False
+    finally:
+        outbox.close()
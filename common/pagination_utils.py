@@ -1,56 +1,65 @@
 """
-스크레이퍼별 페이지 처리 로직 공통화
-"""
-import datetime
-
-from common.filter_by_regtime import filter_by_time, parse_time
-
+스크레이퍼 공통 페이지 처리 (시간 마지노선 판단 / 페이지 URL)
 
-def _scrape_all_items(self):
-    """
-    - 페이지의 마지막 게시글이 30분 이내면 다음 페이지 계속 확인
-    - 마지막 게시글이 30분 초과하거나 최대 페이지 도달 시 중단
-    """
-    all_items = []
-    page_num = 1
-    max_page = 5
-    cutoff_time = datetime.now() - datetime.timedelta(minutes=30)
+사용 의도:
+- 사이트마다 filter_recent 로 전체 게시글을 비교한 뒤, 마지막 게시글을 따로 다시 확인해 계속/중단 판단
+- 마지막 게시글 시간이 없을 때 사이트마다 다르게 처리 (뽐뿌/퀘이사존/아카라이브: 계속, 나머지: 중단)
+- 게시글을 한 번만 훑으면서 수집 대상 / 마지막 시간 / 정렬 여부를 함께 구하고,
+  수집 대상 구간과 계속/중단 판단을 한 번에 반환
+  (정렬 확인 자체가 O(n) 이라 이진 탐색을 붙여도 페이지 단위로는 이득 없음)
+- 정렬이 깨진 목록(고정 글, 끌어올림 등)도 같은 스캔으로 처리 (cutoff_linear_pages 로 집계)
 
-    print(f"== test == {self.source_site} 크롤링 ")
+중단 규칙 (전 사이트 공통):
+- 시간 정보가 있는 마지막 게시글이 마지노선보다 오래됐으면 중단
+- 페이지에 시간 정보가 있는 게시글이 하나도 없으면 중단 (다음 페이지도 판단 불가)
+"""
+from collections import namedtuple
 
-    while page_num <= max_page:
-        print(f"\n{page_num}페이지 크롤링 중...")
+from common.metrics import incr
 
-        page_items = self._scrape_page(page_num, self.url)
+# kept: 마지노선 이내 게시글 (원래 순서) / stop: 다음 페이지 확인 중단 여부
+# last_ts: 판단에 쓴 게시글 시간 (없으면 None) / ordered: 시간 있는 게시글이 모두 최신순이었는지
+PageCutoff = namedtuple('PageCutoff', ['kept', 'stop', 'last_ts', 'ordered'])
 
-        if not page_items:
-            print(f"{page_num}페이지: 게시글 없음, 종료")
-            break
 
-        # 30분 이내 작성된 게시글 필터링
-        page_filtered = filter_by_time(page_items, minutes=30)
-        all_items.extend(page_filtered)
-        print(f"{page_num}페이지: {len(page_items)}개 → 필터링 {len(page_filtered)}개")
+def cut_page(items, cutoff_ts):
+    """
+    한 페이지 게시글을 마지노선(cutoff_ts) 기준으로 자르기
 
-        # 다음 페이지 확인 여부 판단
-        # 원본(page_items)의 마지막 게시글 시간으로 판단
-        last_item = page_items[-1]
-        last_time = parse_time(last_item.get('crawledAt', ''))
+    Args:
+        items: DealItem 리스트 (목록 순서, 공지 제외)
+        cutoff_ts: 마지노선 (epoch 초)
 
-        if not last_time:
-            print(f"  → 시간 파싱 실패, 크롤링 종료")
-            break
+    Returns:
+        PageCutoff
+    """
+    kept = []
+    last_ts = None
+    ordered = True
+    for item in items:
+        ts = item.created_ts
+        if ts is None:
+            continue
+        if last_ts is not None and ts > last_ts:
+            ordered = False
+        last_ts = ts
+        if ts >= cutoff_ts:
+            kept.append(item)
 
-        # 마지막 게시글 등록 시간이 30분 초과면 중단
-        if last_time < cutoff_time:
-            print(f"→ 마지막 게시글 30분 초과 ({last_time.strftime('%H:%M:%S')}), 종료")
-            break
+    if last_ts is None:
+        return PageCutoff([], True, None, True)
+    if not ordered:
+        incr('cutoff_linear_pages')
+    return PageCutoff(kept, last_ts < cutoff_ts, last_ts, ordered)
 
-        print(f"→ 마지막 게시글 30분 이내 ({last_time.strftime('%H:%M:%S')}), 다음 페이지 확인")
-        page_num += 1
 
-    if page_num > self.max_pages:
-        print(f"\n⚠️ 최대 페이지({self.max_pages}) 도달, 크롤링 종료")
+def page_url(base_url, param, page_num):
+    """
+    목록 페이지 URL (1페이지는 base_url 그대로)
 
-    print(f"\n✅ 총 {len(all_items)}개 수집 완료")
-    return all_items
+    base_url 에 쿼리 문자열이 있으면 '&', 없으면 '?' 로 페이지 파라미터 연결
+    """
+    if page_num == 1:
+        return base_url
+    separator = '&' if '?' in base_url else '?'
+    return f"{base_url}{separator}{param}={page_num}"
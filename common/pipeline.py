@@ -0,0 +1,312 @@
+"""
+페이지 단위 크롤링 → 전송 파이프라인
+
+사용 의도:
+- 기존에는 모든 페이지를 수집한 뒤에야 API 전송을 시작 → 1페이지 게시글도 전체 크롤링 시간만큼 늦게 도착
+- 스크래퍼가 페이지를 필터링할 때마다 on_page 콜백으로 게시글을 넘기고,
+  별도 전송 스레드가 크기 제한 큐에서 꺼내 바로 전송 (2페이지 로딩 중 1페이지 전송)
+- 큐가 가득 차면 스크래퍼가 대기 (전송이 느릴 때 메모리 무한 증가 방지)
+- 크롤링 전에 지난 실행의 전송 실패 게시글(common.outbox)을 먼저 재전송하고, 이번 실패분은 보관
+- 지난 전송 이후 바뀌지 않은 게시글은 전송 제외 (common.fingerprint)
+
+사용법:
+    items, result = scrape_and_send(scraper, api_url, api_key, site)
+
+종료 요청 (crawler.daemon SIGTERM):
+- request_shutdown() 이후 on_page 는 받은 페이지를 큐에 넣고 ShutdownRequested 를 발생시켜
+  스크래퍼 페이지 순회를 중단 → 큐에 남은 페이지 전송 + 실패분 보관까지 마친 뒤 반환
+
+환경 변수:
+    STREAM_SEND: '0' 이면 기존 방식 (전체 수집 후 한 번에 전송)
+    STREAM_QUEUE_SIZE: 전송 대기 페이지 수 (기본 4)
+"""
+import contextvars
+import os
+import queue
+import sqlite3
+import threading
+
+from common.api_client import get_ingestion_client, send_to_spring_boot, is_send_success
+from common.fingerprint import change_detection_enabled, FingerprintStore
+from common.metrics import current_run, span, incr
+from common.outbox import outbox_enabled, drain_outbox, spool_failed
+from common.post_id import post_key
+
+_STOP = object()
+
+_shutdown = threading.Event()
+
+
+class ShutdownRequested(Exception):
+    """종료 요청으로 페이지 수집 중단 (스크래퍼는 수집한 게시글까지 반환)"""
+
+
+def request_shutdown():
+    """진행 중인 크롤링에 종료 요청 (다음 페이지로 넘어가지 않음)"""
+    _shutdown.set()
+
+
+def shutdown_requested():
+    return _shutdown.is_set()
+
+
+def stream_enabled():
+    return os.environ.get('STREAM_SEND', '1') != '0'
+
+
+def _empty_report():
+    return {
+        'success': True,
+        'pages': 0,
+        'batches': 0,
+        'sent_items': 0,
+        'failed_items': [],
+        'bytes': 0,
+        'latency_ms': [],
+        'responses': [],
+    }
+
+
+class PageSender:
+    """
+    페이지별 게시글을 큐로 받아 전송 스레드에서 API 전송
+
+    Args:
+        api_url: API 엔드포인트 URL
+        api_key: API 인증 키
+        site: 출처 사이트명
+        queue_size: 전송 대기 페이지 수 (가득 차면 put 대기)
+    """
+
+    def __init__(self, api_url, api_key, site, queue_size=None):
+        self.client = get_ingestion_client(api_url, api_key)
+        self.site = site
+        self.queue = queue.Queue(maxsize=queue_size or int(os.environ.get('STREAM_QUEUE_SIZE', 4)))
+        self.report = _empty_report()
+        self._seen = set()  # 페이지 경계에서 밀려 중복 수집된 게시글 제외
+        self._run = current_run()
+        self._changes = _open_change_store(site)
+
+        # 메트릭 컨텍스트(현재 실행)를 전송 스레드에서도 사용
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(target=context.run, args=(self._worker,),
+                                        name=f"sender-{site}", daemon=True)
+        self._thread.start()
+
+    def put(self, items):
+        """스크래퍼 on_page 콜백 (큐가 가득 차면 대기)"""
+        if items:
+            with span('send_wait'):
+                self.queue.put(list(items))
+        if _shutdown.is_set():
+            incr('shutdown_interrupted')
+            raise ShutdownRequested(f"[{self.site}] 종료 요청: 현재 페이지까지 전송 후 중단")
+
+    def close(self):
+        """남은 페이지 전송 완료까지 대기 후 통합 결과 반환"""
+        self.queue.put(_STOP)
+        self._thread.join()
+        _close_change_store(self.site, self._changes)
+        return self.report
+
+    def _worker(self):
+        while True:
+            items = self.queue.get()
+            if items is _STOP:
+                return
+
+            self.report['pages'] += 1
+            incr('stream_pages')
+
+            items = self._dedupe(items)
+            items = _classify_changes(self.site, self._changes, items)
+            if not items:
+                continue
+
+            try:
+                with span('send'):
+                    result = self.client.send(self.site, items)
+            except Exception as e:
+                print(f"[{self.site}] 페이지 전송 실패: {e}")
+                result = {'success': False, 'batches': 0, 'sent_items': 0, 'failed_items': items,
+                          'bytes': 0, 'latency_ms': [], 'responses': [{'success': False, 'error': str(e)}]}
+
+            self._merge(result)
+            _commit_changes(self.site, self._changes, _sent_items(items, result))
+
+    def _dedupe(self, items):
+        unique = []
+        for item in items:
+            key = post_key(self.site, item.get('productUrl'))
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            unique.append(item)
+        return unique
+
+    def _merge(self, result):
+        report = self.report
+        if result.get('success') is False:
+            report['success'] = False
+        elif report['sent_items'] == 0 and result.get('sent_items') and self._run is not None:
+            # 실행 시작 → 첫 게시글 전송까지 (신선도 지표)
+            self._run.add_duration('first_send', self._run.elapsed_ms())
+
+        for key in ('batches', 'sent_items', 'bytes'):
+            report[key] += result.get(key, 0)
+        for key in ('failed_items', 'latency_ms', 'responses'):
+            report[key].extend(result.get(key, []))
+
+
+def scrape_and_send(scraper, api_url, api_key, site, send=True):
+    """
+    크롤링 + API 전송 (STREAM_SEND 활성 시 페이지 단위 전송)
+
+    - OUTBOX 활성 시 크롤링 전에 보관된 게시글 재전송, 전송 실패 게시글은 보관 (결과의 'spooled')
+
+    Returns:
+        tuple: (수집한 게시글 리스트, 전송 결과 또는 None)
+    """
+    if not send:
+        with span('scrape'):
+            return scraper.scrape(), None
+
+    use_outbox = outbox_enabled()
+    if use_outbox:
+        _replay_outbox(api_url, api_key, site)
+
+    items, result = _scrape_and_send(scraper, api_url, api_key, site)
+
+    if use_outbox and result and result.get('failed_items'):
+        with span('outbox'):
+            result['spooled'] = spool_failed(site, result['failed_items'])
+        if result['spooled']:
+            incr('outbox_spooled', len(result['failed_items']))
+
+    return items, result
+
+
+def summarize_result(result):
+    """
+    로그 / 실행 리포트용 전송 결과 (failed_items 의 게시글(DealItem) 목록 → 개수)
+
+    원본 결과는 JSON 직렬화가 되지 않으므로 출력 / json.dumps 전에 변환
+    """
+    if not isinstance(result, dict):
+        return result
+    summary = dict(result)
+    summary['failed_items'] = len(result.get('failed_items') or [])
+    return summary
+
+
+def is_delivered(result):
+    """전송 성공 또는 실패분을 모두 보관함에 저장 (→ 워터마크 저장해도 유실 없음)"""
+    return is_send_success(result) or (isinstance(result, dict) and result.get('spooled') is True)
+
+
+def _replay_outbox(api_url, api_key, site):
+    """보관된 게시글 재전송 (보관함 오류는 크롤링을 막지 않음)"""
+    try:
+        with span('outbox'):
+            drained = drain_outbox(get_ingestion_client(api_url, api_key), site)
+    except sqlite3.Error as e:
+        print(f"[OUTBOX] {site}: 재전송 실패: {e}")
+        return
+    if drained['replayed'] or drained['failed']:
+        print(f"[OUTBOX] {site}: 재전송 {drained['replayed']}개, 실패 {drained['failed']}개, 남은 보관 {drained['remaining']}개")
+
+    # 재전송한 게시글 지문 저장 (이번 크롤링에서 다시 '새 글'로 전송하지 않도록)
+    if drained['sent_items']:
+        changes = _open_change_store(site)
+        _commit_changes(site, changes, drained['sent_items'])
+        _close_change_store(site, changes)
+    incr('outbox_replayed', drained['replayed'])
+    incr('outbox_remaining', drained['remaining'])
+
+
+def _scrape_and_send(scraper, api_url, api_key, site):
+    if not stream_enabled():
+        with span('scrape'):
+            items = scraper.scrape()
+        if not items:
+            return items, None
+
+        changes = _open_change_store(site)
+        try:
+            to_send = _classify_changes(site, changes, items)
+            if not to_send:
+                return items, _empty_report()
+            with span('send'):
+                result = send_to_spring_boot(api_url=api_url, api_key=api_key, site=site, items=to_send)
+            _commit_changes(site, changes, _sent_items(to_send, result))
+            return items, result
+        finally:
+            _close_change_store(site, changes)
+
+    sender = PageSender(api_url, api_key, site)
+    try:
+        with span('scrape'):
+            items = scraper.scrape(on_page=sender.put)
+    finally:
+        result = sender.close()
+
+    if not result['pages']:
+        return items, None
+    return items, result
+
+
+def _open_change_store(site):
+    """변경 감지 저장소 (비활성 또는 오류 시 None → 모두 전송)"""
+    if not change_detection_enabled():
+        return None
+    try:
+        return FingerprintStore(site)
+    except sqlite3.Error as e:
+        print(f"[{site}] 변경 감지 저장소 열기 실패: {e}")
+        return None
+
+
+def _classify_changes(site, changes, items):
+    """전송 대상 선별 (저장소 없음 또는 조회 실패 시 모두 전송)"""
+    if changes is None or not items:
+        return items
+    try:
+        return changes.classify(items)
+    except Exception as e:
+        # 전송 스레드가 죽으면 put / close 가 멈추므로 여기서 처리
+        print(f"[{site}] 변경 감지 조회 실패 (모두 전송): {e}")
+        incr('change_detection_errors')
+        return items
+
+
+def _commit_changes(site, changes, items):
+    """전송 성공 게시글 지문 저장 (실패 시 다음 실행에서 다시 전송될 뿐이므로 기록만)"""
+    if changes is None or not items:
+        return
+    try:
+        changes.commit(items)
+    except Exception as e:
+        print(f"[{site}] 변경 감지 저장 실패: {e}")
+        incr('change_detection_errors')
+
+
+def _close_change_store(site, changes):
+    if changes is None:
+        return
+    stats = changes.stats()
+    incr('items_new', stats['new'])
+    incr('items_changed', stats['changed'])
+    incr('items_unchanged', stats['unchanged'])
+    if stats['suppression_ratio'] is not None:
+        print(f"[{site}] 변경 감지: 새 글 {stats['new']}개, 변경 {stats['changed']}개 {stats['changed_fields']}, "
+              f"변경 없음 {stats['unchanged']}개 (전송 제외 비율 {stats['suppression_ratio']:.0%})")
+    try:
+        changes.close()
+    except sqlite3.Error as e:
+        print(f"[{site}] 변경 감지 저장소 정리 실패: {e}")
+
+
+def _sent_items(items, result):
+    """전송 결과에서 실패 배치를 제외한 게시글"""
+    failed = {id(item) for item in result.get('failed_items', [])}
+    return [item for item in items if id(item) not in failed]
@@ -0,0 +1,60 @@
+"""
+게시글 URL 정규화 / 게시글 번호 추출
+
+지원 형태:
+- 쿼리 파라미터: ?no=123 (뽐뿌), ?document_srl=123 (XE 게시판), ?wr_id=123
+- 경로 마지막 숫자: /read/123 (루리웹), /views/123 (퀘이사존), /b/hotdeal/123 (아카라이브), /os/123 (어미새)
+"""
+import re
+from urllib.parse import urlsplit, parse_qs
+
+POST_ID_QUERY_KEYS = ('no', 'document_srl', 'wr_id')
+
+_DIGITS_PATTERN = re.compile(r'^\d+$')
+
+
+def extract_post_id(url):
+    """
+    게시글 URL에서 게시글 번호 추출
+
+    Returns:
+        int: 게시글 번호
+        None: 번호를 찾지 못함
+    """
+    if not url:
+        return None
+
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    for key in POST_ID_QUERY_KEYS:
+        values = query.get(key)
+        if values and _DIGITS_PATTERN.match(values[0]):
+            return int(values[0])
+
+    for segment in reversed(parts.path.split('/')):
+        if _DIGITS_PATTERN.match(segment):
+            return int(segment)
+
+    return None
+
+
+def normalize_post_url(url):
+    """
+    캐시 키 등에 사용할 정규화된 URL (쿼리/프래그먼트/끝 슬래시 제거)
+    """
+    if not url:
+        return url
+
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+
+
+def post_key(site, url):
+    """
+    사이트 내 게시글 고유 키 ('SITE:게시글번호', 번호가 없으면 'SITE:정규화 URL')
+    """
+    post_id = extract_post_id(url)
+    if post_id is not None:
+        return f"{site}:{post_id}"
+    return f"{site}:{normalize_post_url(url)}"
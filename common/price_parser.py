@@ -0,0 +1,152 @@
+"""
+제목 가격 / 배송비 추출 엔진
+
+사용 의도:
+- number_extractor.extract_price_from_text / price_extractor.extract_price_from_title 가
+  컴파일되지 않은 정규식 10여 개를 제목마다 순서대로 시도
+- 뽐뿌 / 루리웹은 제목 끝 "(가격/배송비)" 정규식을 각자 보유
+- 모든 가격 형식을 하나의 정규식(이름 있는 그룹)으로 모듈 로드 시 한 번만 컴파일하고,
+  제목을 한 번 스캔해서 가격 / 통화 / 배송비 / 정리된 제목을 함께 반환
+
+우선순위 (같은 제목에 여러 형식이 있으면 위쪽 우선):
+    제목 끝 (가격/배송비)  →  N만원  →  ￦N  →  N원  →  4자리 이상 숫자  →  $ / ¥ / €
+
+단위 / 천 단위 구분 없는 19xx / 20xx 4자리 숫자는 연식 / 모델명으로 보고 가격에서 제외
+    ("라이젠 7 9800X3D 2025 신형" → 가격 없음, "2025원" / "￦2,025" 는 가격)
+
+사용법:
+    info = parse_title("[쿠팡] 대추방울토마토 (8,910원/무배)")
+    info.title, info.price, info.currency, info.shipping_fee
+    # '[쿠팡] 대추방울토마토', 8910, 'KRW', '무료'
+"""
+import re
+from collections import namedtuple
+
+# price: 원화 가격(int, 외화면 None) / amount: 표기 통화 기준 금액 / price_text: 매칭된 원문
+PriceInfo = namedtuple('PriceInfo', ['title', 'price', 'currency', 'amount', 'price_text', 'shipping_fee'])
+
+MIN_KRW = 100
+MIN_PLAIN_NUMBER = 1000
+MAX_KRW = 100000000
+
+# 단위 없는 숫자 중 연도로 보는 형식
+_YEAR = re.compile(r'(?:19|20)[0-9]{2}')
+
+_NUMBER = r'[0-9][0-9,]*'
+_DECIMAL = r'[0-9][0-9,]*(?:\.[0-9]{1,2})?'
+
+# 첫 글자 선검사(lookahead)로 숫자 / 통화 기호 / 여는 괄호가 아닌 위치는 대안 시도 없이 통과
+_PRICE_PATTERN = re.compile(
+    r'(?=[0-9(￦₩$¥€])(?:'
+    r'\((?P<tail>[0-9][0-9,.]*)\s*(?P<tail_man>만)?\s*원?\s*/\s*(?P<tail_ship>[^()]*?)\)\s*$'
+    r'|(?P<man>[0-9]+(?:\.[0-9]+)?)\s*만\s*원'
+    rf'|[￦₩]\s*(?P<won_sym>{_NUMBER})'
+    rf'|(?P<won>{_NUMBER})\s*원'
+    rf'|\$\s*(?P<usd>{_DECIMAL})|(?P<usd_word>{_DECIMAL})\s*(?:달러|USD)'
+    rf'|¥\s*(?P<jpy>{_NUMBER})|(?P<jpy_word>{_NUMBER})\s*(?:엔|JPY)'
+    rf'|€\s*(?P<eur>{_DECIMAL})|(?P<eur_word>{_DECIMAL})\s*(?:유로|EUR)'
+    r'|(?<![0-9A-Za-z.,])(?P<plain>[0-9]{4,})(?![0-9A-Za-z.,]))',
+    re.IGNORECASE
+)
+
+# 그룹명 → (우선순위, 통화)
+_GROUPS = {
+    'tail': (0, 'KRW'),
+    'man': (1, 'KRW'),
+    'won_sym': (2, 'KRW'),
+    'won': (3, 'KRW'),
+    'plain': (4, 'KRW'),
+    'usd': (5, 'USD'), 'usd_word': (5, 'USD'),
+    'jpy': (6, 'JPY'), 'jpy_word': (6, 'JPY'),
+    'eur': (7, 'EUR'), 'eur_word': (7, 'EUR'),
+}
+
+_FREE_SHIPPING = re.compile(r'무료|무배|공짜|free', re.IGNORECASE)
+_SHIPPING_FEE = re.compile(r'배송비?\s*[:：]?\s*([0-9][0-9,]*)')
+_FEE_ONLY = re.compile(r'[￦₩]?\s*([0-9][0-9,]*)\s*원?\s*(?:\(?KRW\)?)?', re.IGNORECASE)
+
+_NO_PRICE = PriceInfo(None, None, None, None, None, None)
+
+
+def _to_number(text, man=False):
+    try:
+        value = float(text.replace(',', ''))
+    except ValueError:
+        return None
+    return value * 10000 if man else value
+
+
+def parse_shipping(text):
+    """
+    배송비 문자열 정규화
+
+    - 무료배송 키워드, '배송비 2500', 금액만 있는 문자열('2,500원', '￦ 3,000 (KRW)', '0') 인식
+
+    Returns:
+        str | None: '무료' / '2,500원', 해석 불가면 None
+    """
+    if not text:
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    if _FREE_SHIPPING.search(text):
+        return '무료'
+
+    match = _SHIPPING_FEE.search(text) or _FEE_ONLY.fullmatch(text)
+    if not match:
+        return None
+    fee = int(match.group(1).replace(',', '') or 0)
+    return '무료' if fee == 0 else f"{fee:,}원"
+
+
+def parse_title(title):
+    """
+    제목 한 번 스캔 → PriceInfo(정리된 제목, 가격, 통화, 가격 원문, 배송비)
+
+    - price 는 원화만 (외화는 currency / amount / price_text 로 확인)
+    - 제목 끝 "(가격/배송비)" 는 제목에서 제거하고 배송비로 사용 (해석 불가한 배송비는 원문 유지)
+    - 배송비 표기가 없으면 제목의 무료배송 키워드만 확인
+    """
+    if not title:
+        return _NO_PRICE
+
+    best = None
+    for match in _PRICE_PATTERN.finditer(title):
+        group = match.lastgroup
+        if group in ('tail_man', 'tail_ship'):
+            group = 'tail'
+        rank, currency = _GROUPS[group]
+        if best is not None and rank >= best[0]:
+            continue
+
+        if group == 'plain' and _YEAR.fullmatch(match.group(group)):
+            continue
+        value = _to_number(match.group(group), man=(group == 'man' or (group == 'tail' and match.group('tail_man'))))
+        if value is None:
+            continue
+        if currency == 'KRW':
+            minimum = MIN_PLAIN_NUMBER if group == 'plain' else MIN_KRW
+            if not minimum <= value <= MAX_KRW:
+                continue
+        best = (rank, currency, value, match)
+        if rank == 0:
+            break
+
+    free_shipping = '무료' if '배' in title and _FREE_SHIPPING.search(title) else None
+    if best is None:
+        return PriceInfo(title.strip(), None, None, None, None, free_shipping)
+
+    rank, currency, value, match = best
+    if rank == 0:
+        shipping_text = match.group('tail_ship').strip()
+        return PriceInfo(title[:match.start()].strip(), int(round(value)), currency, value,
+                         match.group(0).strip(), parse_shipping(shipping_text) or shipping_text or None)
+
+    price = int(round(value)) if currency == 'KRW' else None
+    return PriceInfo(title.strip(), price, currency, value, match.group(0).strip(), free_shipping)
+
+
+def parse_titles(titles):
+    """제목 리스트 일괄 처리 (백필용)"""
+    return [parse_title(title) for title in titles]
@@ -0,0 +1,115 @@
+"""
+Chrome 리소스 차단 (CDP Network.setBlockedURLs)
+
+사용 의도:
+- 목록 테이블만 파싱하므로 이미지/폰트/CSS/광고·트래커 스크립트는 받을 필요가 없음
+  (imageUrl 은 src 속성 값만 사용)
+- 사이트별 허용 목록으로 목록 렌더링에 꼭 필요한 패턴만 다시 허용
+- performance 로그로 허용/차단 요청 수와 전송 바이트 집계
+
+효과:
+- 페이지당 로드 시간/전송량 감소
+- 응답 없는 광고 호스트 때문에 60초 페이지 로드 타임아웃까지 기다리던 꼬리 지연 제거
+
+환경 변수:
+    BROWSER_BLOCK_RESOURCES: '0' 이면 차단하지 않음 (기본 차단)
+"""
+import json
+import os
+from fnmatch import fnmatch
+
+BLOCKED_URL_PATTERNS = (
+    # 이미지
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp', '*.avif',
+    # 폰트
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # 스타일시트
+    '*.css',
+    # 동영상
+    '*.mp4', '*.webm',
+    # 광고 / 트래커
+    '*googlesyndication.com*', '*doubleclick.net*', '*googleadservices.com*', '*adservice.google.*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*googletagservices.com*',
+    '*facebook.net*', '*connect.facebook.com*', '*criteo.com*', '*criteo.net*', '*taboola.com*',
+    '*dable.io*', '*mobon.net*', '*adfit.kakao.com*', '*t1.daumcdn.net/kas*', '*wcs.naver.net*',
+    '*amazon-adsystem.com*', '*scorecardresearch.com*', '*adnxs.com*', '*outbrain.com*',
+)
+
+
+def resource_blocking_enabled():
+    return os.environ.get('BROWSER_BLOCK_RESOURCES', '1') != '0'
+
+
+def _is_allowed(pattern, allowlist):
+    """
+    허용 목록 항목 중 하나가 차단 패턴에 해당하는지 (대소문자 무시)
+
+    - 같은 패턴: '*.css' ↔ '*.css'
+    - 패턴에 걸리는 URL / 호스트 / 파일명: 'https://cdn.example.com/list.css', 'static.criteo.net' → 해당 패턴 해제
+    - 패턴을 포함하는 더 넓은 패턴: '*criteo*' → '*criteo.com*', '*criteo.net*' 해제
+    """
+    pattern = pattern.lower()
+    for entry in allowlist:
+        entry = entry.lower()
+        if entry == pattern or fnmatch(entry, pattern) or fnmatch(pattern, entry):
+            return True
+    return False
+
+
+def apply_resource_blocking(driver, allowlist=()):
+    """
+    드라이버에 차단 패턴 적용 (풀 브라우저는 사이트가 바뀔 때마다 다시 호출)
+
+    Chrome 차단은 패턴 단위이므로 허용 항목에 걸리는 차단 패턴 전체를 해제
+    (예: 'https://cdn.example.com/list.css' 를 허용하면 '*.css' 차단이 빠짐)
+
+    Args:
+        driver: Chrome WebDriver
+        allowlist: 차단 해제할 패턴 / URL / 호스트 (예: ['*.css'], ['static.criteo.net'])
+
+    Returns:
+        list: 적용된 차단 패턴
+    """
+    patterns = []
+    if resource_blocking_enabled():
+        allowlist = list(allowlist or ())
+        patterns = [pattern for pattern in BLOCKED_URL_PATTERNS if not _is_allowed(pattern, allowlist)]
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    return patterns
+
+
+def collect_network_stats(driver):
+    """
+    performance 로그를 비우면서 마지막 호출 이후의 요청 수 집계
+
+    Returns:
+        dict: {'allowed': 허용 요청 수, 'blocked': 차단 요청 수, 'bytes': 수신 바이트}
+    """
+    stats = {'allowed': 0, 'blocked': 0, 'bytes': 0}
+
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        # performance 로그를 켜지 않은 드라이버
+        return stats
+
+    requests = 0
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+
+        method = message.get('method')
+        if method == 'Network.requestWillBeSent':
+            requests += 1
+        elif method == 'Network.loadingFailed':
+            if message.get('params', {}).get('blockedReason'):
+                stats['blocked'] += 1
+        elif method == 'Network.loadingFinished':
+            stats['bytes'] += int(message.get('params', {}).get('encodedDataLength', 0))
+
+    stats['allowed'] = max(requests - stats['blocked'], 0)
+    return stats
@@ -0,0 +1,87 @@
+"""
+게시글 목록 행(row) 필드 추출 (브라우저 내 JS / BeautifulSoup 공용 명세)
+
+사용 의도:
+- 사이트별 행 선택자를 명세(dict) 하나로 선언
+- Chrome 사용 시: 명세를 execute_script 한 번으로 페이지 안에서 실행해 원시 필드 dict 리스트만 받음
+  (driver.page_source 전송 + 문서 전체 BeautifulSoup 파싱 생략)
+- HTTP 수집 시: 같은 명세를 BeautifulSoup 으로 실행
+- 어느 경로든 결과는 같은 원시 필드 dict → 사이트의 정규화 함수(_build_item)로 전달
+
+명세 형식:
+    {
+        'rows': '행 CSS 선택자',
+        'fields': {
+            '필드명': ('행 기준 CSS 선택자', 'text' 또는 속성명),
+        },
+    }
+    - 선택자가 None 이면 행 요소 자신
+    - 요소가 없으면 None
+    - 'text' 는 BeautifulSoup get_text(strip=True) 와 같은 규칙 (텍스트 노드별 strip 후 이어 붙임)
+"""
+
+ROW_EXTRACT_SCRIPT = """
+const spec = arguments[0];
+
+function strippedText(node) {
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    const parts = [];
+    while (walker.nextNode()) {
+        const text = walker.currentNode.nodeValue.trim();
+        if (text) parts.push(text);
+    }
+    return parts.join('');
+}
+
+const fieldNames = Object.keys(spec.fields);
+return Array.from(document.querySelectorAll(spec.rows)).map(row => {
+    const result = {};
+    for (const name of fieldNames) {
+        const [selector, attr] = spec.fields[name];
+        const element = selector ? row.querySelector(selector) : row;
+        if (!element) {
+            result[name] = null;
+        } else if (attr === 'text') {
+            result[name] = strippedText(element);
+        } else {
+            result[name] = element.getAttribute(attr);
+        }
+    }
+    return result;
+});
+"""
+
+
+def extract_fields(row, fields):
+    """
+    BeautifulSoup 행 요소 1개에서 원시 필드 추출
+
+    Returns:
+        dict: {필드명: 문자열 또는 None}
+    """
+    result = {}
+    for name, (selector, attr) in fields.items():
+        element = row.select_one(selector) if selector else row
+        if element is None:
+            result[name] = None
+        elif attr == 'text':
+            result[name] = element.get_text(strip=True)
+        else:
+            result[name] = element.get(attr)
+    return result
+
+
+def extract_rows_from_soup(soup, spec):
+    """BeautifulSoup 문서에서 명세대로 모든 행의 원시 필드 추출"""
+    return [extract_fields(row, spec['fields']) for row in soup.select(spec['rows'])]
+
+
+def extract_rows_in_browser(driver, spec):
+    """
+    현재 Chrome 페이지에서 명세대로 모든 행의 원시 필드 추출 (execute_script 1회)
+
+    Returns:
+        list: 원시 필드 dict 리스트
+    """
+    fields = {name: list(field) for name, field in spec['fields'].items()}
+    return driver.execute_script(ROW_EXTRACT_SCRIPT, {'rows': spec['rows'], 'fields': fields}) or []
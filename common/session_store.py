@@ -0,0 +1,210 @@
+"""
+사이트별 세션(쿠키 + localStorage) 저장소 (SQLite)
+
+사용 의도:
+- 봇 확인을 통과한 세션을 실행이 끝나면 버리고, 다음 실행(새 컨테이너 / 새 Chrome)에서
+  홈페이지 방문 + 메뉴 클릭 워밍업과 봇 확인 페이지를 다시 거침
+- 목록을 정상적으로 받은 실행의 쿠키 / localStorage 를 사이트별로 저장하고,
+  새 Chrome(CDP) 또는 requests.Session 에 복원
+- 복원한 세션으로 첫 목록 확인에 실패하면(사이트가 거부) 저장분 삭제 → 다음 실행은 워밍업부터
+
+검증:
+- 별도 요청 없이 첫 목록 페이지 로드 결과로 판단 (common.fetcher)
+- 저장 시각이 TTL 을 넘었거나 만료된 쿠키는 복원하지 않음
+
+환경 변수:
+    SESSION_STORE: '0' 이면 비활성화 (기본 활성)
+    SESSION_TTL_HOURS: 저장 세션 유지 시간 (기본 12)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from common.local_state import state_path
+
+DEFAULT_TTL_HOURS = 12
+
+# 새 문서마다 저장된 localStorage 를 채움 (페이지 스크립트보다 먼저, 이미 있는 값은 유지)
+_LOCAL_STORAGE_SCRIPT = """
+(function (data) {
+    try {
+        var items = data[location.origin];
+        if (!items) return;
+        for (var key in items) {
+            if (window.localStorage.getItem(key) === null) window.localStorage.setItem(key, items[key]);
+        }
+    } catch (e) {}
+})(%s);
+"""
+
+_READ_LOCAL_STORAGE_SCRIPT = """
+try { return [location.origin, Object.assign({}, window.localStorage)]; } catch (e) { return null; }
+"""
+
+
+def _alive(cookie, now):
+    """만료되지 않은 쿠키 (expires: epoch 초, 세션 쿠키는 -1 또는 없음)"""
+    expires = cookie.get('expires') or -1
+    return expires <= 0 or expires > now
+
+
+def session_store_enabled():
+    return os.environ.get('SESSION_STORE', '1') != '0'
+
+
+class SessionStore:
+    """
+    사이트 → 마지막으로 검증된 세션
+
+    Args:
+        site: 출처 사이트명
+        path: SQLite 파일 경로 (기본: 상태 디렉터리의 sessions.sqlite3)
+        ttl_seconds: 저장 세션 유지 기간 (기본: SESSION_TTL_HOURS)
+    """
+
+    def __init__(self, site, path=None, ttl_seconds=None):
+        self.site = site
+        self.path = path or state_path('sessions.sqlite3')
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get('SESSION_TTL_HOURS', DEFAULT_TTL_HOURS)) * 3600
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS sessions ('
+            ' site TEXT PRIMARY KEY,'
+            ' cookies TEXT NOT NULL,'
+            ' local_storage TEXT NOT NULL,'
+            ' saved_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def load(self):
+        """
+        저장 세션 조회
+
+        Returns:
+            dict | None: {'cookies': [CDP 쿠키 dict], 'local_storage': {origin: {key: value}}}
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT cookies, local_storage, saved_at FROM sessions WHERE site = ?', (self.site,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        cookies, local_storage, saved_at = row
+        now = time.time()
+        if saved_at < now - self.ttl_seconds:
+            return None
+
+        cookies = [c for c in json.loads(cookies) if _alive(c, now)]
+        if not cookies:
+            return None
+        return {'cookies': cookies, 'local_storage': json.loads(local_storage)}
+
+    def save(self, cookies, local_storage=None):
+        """세션 저장 (쿠키가 없으면 저장하지 않음)"""
+        if not cookies:
+            return
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sessions (site, cookies, local_storage, saved_at) VALUES (?, ?, ?, ?)',
+                (self.site, json.dumps(cookies, ensure_ascii=False),
+                 json.dumps(local_storage or {}, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def invalidate(self):
+        """사이트가 거부한 세션 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM sessions WHERE site = ?', (self.site,))
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+# ---------- Chrome (CDP) ----------
+
+def restore_browser_session(driver, state):
+    """
+    새 Chrome 에 쿠키(Network.setCookies) / localStorage(새 문서 스크립트) 복원
+
+    Returns:
+        str: 새 문서 스크립트 식별자 (반납 전 remove_browser_session_script 로 제거, localStorage 가 없으면 None)
+    """
+    cookie_fields = ('name', 'value', 'domain', 'path', 'expires', 'httpOnly', 'secure', 'sameSite')
+    cookies = []
+    for c in state['cookies']:
+        cookie = {k: c[k] for k in cookie_fields if c.get(k) is not None}
+        if cookie.get('expires', 0) <= 0:
+            cookie.pop('expires', None)  # 세션 쿠키
+        cookies.append(cookie)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+
+    if not state.get('local_storage'):
+        return None
+    result = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': _LOCAL_STORAGE_SCRIPT % json.dumps(state['local_storage'], ensure_ascii=False)
+    })
+    return result.get('identifier')
+
+
+def remove_browser_session_script(driver, identifier):
+    """restore_browser_session 이 등록한 새 문서 스크립트 제거 (풀의 다음 대여자에게 남기지 않음)"""
+    if identifier:
+        driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': identifier})
+
+
+def _cookie_matches(cookie, hosts):
+    """쿠키 도메인이 방문한 호스트 중 하나에 적용되는지 ('.fmkorea.com' ↔ 'www.fmkorea.com')"""
+    domain = (cookie.get('domain') or '').lstrip('.').lower()
+    return any(host == domain or host.endswith('.' + domain) for host in hosts)
+
+
+def capture_browser_session(driver, hosts):
+    """
+    방문한 호스트에 적용되는 쿠키 + 현재 페이지 origin 의 localStorage
+
+    Chrome 은 풀에서 여러 사이트가 돌려 쓰므로 다른 사이트 / 광고 도메인 쿠키는 저장하지 않음
+
+    Args:
+        hosts: 이 사이트에서 방문한 호스트 (예: {'www.fmkorea.com'})
+
+    Returns:
+        tuple: (cookies, local_storage)
+    """
+    hosts = {host.lower() for host in hosts if host}
+    cookies = [
+        c for c in driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        if _cookie_matches(c, hosts)
+    ]
+    local_storage = {}
+    result = driver.execute_script(_READ_LOCAL_STORAGE_SCRIPT)
+    if result and result[1]:
+        local_storage[result[0]] = result[1]
+    return cookies, local_storage
+
+
+# ---------- requests.Session ----------
+
+def restore_http_session(session, state):
+    """requests.Session 쿠키 저장소에 복원"""
+    for c in state['cookies']:
+        session.cookies.set(c['name'], c['value'], domain=c.get('domain', ''), path=c.get('path', '/'))
+
+
+def capture_http_session(session):
+    """requests.Session 쿠키 → CDP 쿠키 형식 리스트"""
+    return [
+        {
+            'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+            'expires': c.expires if c.expires else -1, 'secure': bool(c.secure),
+        }
+        for c in session.cookies
+    ]
@@ -2,7 +2,8 @@
 시간 필터링 유틸리티
 """
 from datetime import datetime, timedelta
-import re
+
+from common.time_parser import parse_time_kst
 
 def filter_by_time(items, minutes=30):
     """
@@ -25,70 +26,7 @@ def filter_by_time(items, minutes=30):
 
 def parse_time(time_str):
     """
-    시간 문자열을 datetime 객체로 변환
+    시간 문자열을 datetime 객체로 변환 (common.time_parser 사용, timezone 없는 KST 시각)
     """
-    now = datetime.now()
-
-    try:
-        # 방금 전 or 초
-        if '방금' in time_str or '초' in time_str:
-            return now
-
-        # N분 전
-        match = re.search(r'(\d+)분\s*전', time_str)
-        if match:
-            minutes = int(match.group(1))
-            return now - timedelta(minutes=minutes)
-
-        # N시간 전
-        match = re.search(r'(\d+)시간\s*전', time_str)
-        if match:
-            hours = int(match.group(1))
-            return now - timedelta(hours=hours)
-
-        # N일 전
-        match = re.search(r'(\d+)일\s*전', time_str)
-        if match:
-            days = int(match.group(1))
-            return now - timedelta(days=days)
-
-        # "00:00:00" 형식 (당일)
-        if ':' in time_str:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                parsed = datetime.strptime(time_str, '%H:%M:%S')
-                return now.replace(
-                    hour=parsed.hour,
-                    minute=parsed.minute,
-                    second=parsed.second,
-                    microsecond=0
-                )
-            elif len(parts) == 2:
-                parsed = datetime.strptime(time_str, '%H:%M')
-                return now.replace(
-                    hour=parsed.hour,
-                    minute=parsed.minute,
-                    second=0,
-                    microsecond=0
-                )
-
-        # "2025-01-15 14:30"
-        try:
-            return datetime.strptime(time_str, '%Y-%m-%d %H:%M')
-        except:
-            pass
-
-        # "2025/01/15" 형식
-        if '/' in time_str:
-            return datetime.strptime(time_str, '%Y/%m/%d')
-
-        # "01-15 14:30" 형식
-        if '-' in time_str and ':' in time_str:
-            parsed = datetime.strptime(time_str, '%m-%d %H:%M')
-            return parsed.replace(year=now.year)
-
-        return None
-
-    except Exception as e:
-        print(f"[시간 파싱 실패] {time_str}: {e}")
-        return None
\ No newline at end of file
+    article_time = parse_time_kst(time_str)
+    return article_time.replace(tzinfo=None) if article_time else None
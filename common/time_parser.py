@@ -0,0 +1,172 @@
+"""
+게시글 등록 시간 파싱 엔진 (문자열 → epoch 초)
+
+사용 의도:
+- filter_by_regtime.parse_time / time_filter.parse_time / _parse_universal_time / 뽐뿌 strptime 코드가
+  같은 형식을 각자 try/except 연쇄로 처리하고, 호출마다 KST timezone 생성 + datetime.now() 호출
+- 형식 인식 정규식은 모듈 로드 시 한 번만 컴파일, 기준 시각(now)은 실행 단위로 주입
+- 절대 시각 문자열('25.10.31 12:34:56', ISO 등)은 결과 캐시 (페이지 간 / 실행 간 반복)
+- 한 페이지의 시간 문자열을 parse_many 로 한 번에 변환
+
+지원 형식 (KST 기준, timezone 없는 값은 KST):
+    ISO 8601                  2025-10-31T15:30:00+09:00, ...Z
+    YYYY-MM-DD HH:MM[:SS]     2025-10-31 15:30:00
+    YY.MM.DD HH:MM:SS         25.10.31 15:30:00 (뽐뿌 title 속성)
+    YYYY.MM.DD / YY.MM.DD     2025.10.31
+    YYYY/MM/DD / YY/MM/DD     25/10/31
+    YYYY-MM-DD / YY-MM-DD     2025-10-31
+    MM-DD [HH:MM]             10-31, 10-31 15:30 (올해, 미래면 작년)
+    MM.DD                     10.31 (올해, 미래면 작년)
+    HH:MM[:SS]                15:30 (오늘, 미래면 어제)
+    상대 시간                  방금, N초 전, N분 전, N시간 전, N일 전
+"""
+import calendar
+import re
+import time
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+
+KST = timezone(timedelta(hours=9))
+KST_OFFSET_SECONDS = 9 * 60 * 60
+
+# 오늘 시간(HH:MM)이 기준 시각보다 이만큼 이상 미래면 어제 게시글로 처리 (서버/로컬 시계 오차 허용)
+FUTURE_TOLERANCE_SECONDS = 10 * 60
+
+_ISO = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+_DATETIME = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?$')
+_DOT_DATETIME = re.compile(r'^(\d{2}|\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s+(\d{1,2}):(\d{2})(?::(\d{2}))?$')
+_DATE = re.compile(r'^(\d{2}|\d{4})([-./])(\d{1,2})\2(\d{1,2})\.?$')
+_MONTH_DAY = re.compile(r'^(\d{1,2})[-.](\d{1,2})(?:\s+(\d{1,2}):(\d{2}))?$')
+_CLOCK = re.compile(r'^(\d{1,2}):(\d{2})(?::(\d{2}))?$')
+_RELATIVE = re.compile(r'(\d+)\s*(초|분|시간|일)\s*전')
+_JUST_NOW = ('방금', '지금')
+
+_UNIT_SECONDS = {'초': 1, '분': 60, '시간': 3600, '일': 86400}
+
+
+def _kst_epoch(year, month, day, hour=0, minute=0, second=0):
+    """KST 날짜/시각 → epoch 초 (범위 밖이면 None)"""
+    if not (1 <= month <= 12 and 1 <= day <= 31 and hour < 24 and minute < 60 and second < 61):
+        return None
+    if year < 100:
+        year += 2000
+    return float(calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0)) - KST_OFFSET_SECONDS)
+
+
+def _int(value, default=0):
+    return int(value) if value else default
+
+
+@lru_cache(maxsize=8192)
+def _parse_absolute(text):
+    """
+    기준 시각과 무관한 절대 시각 형식 (결과 캐시)
+
+    Returns:
+        float | None: epoch 초, 절대 형식이 아니면 None
+    """
+    if _ISO.match(text):
+        try:
+            value = datetime.fromisoformat(text[:-1] + '+00:00' if text.endswith('Z') else text)
+        except ValueError:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=KST)
+        return value.timestamp()
+
+    match = _DATETIME.match(text) or _DOT_DATETIME.match(text)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        return _kst_epoch(int(year), int(month), int(day), int(hour), int(minute), _int(second))
+
+    match = _DATE.match(text)
+    if match:
+        year, _, month, day = match.groups()
+        return _kst_epoch(int(year), int(month), int(day))
+
+    return None
+
+
+class TimeParser:
+    """
+    기준 시각(now)을 고정한 시간 파서 (크롤링 1회 실행 단위로 생성)
+
+    Args:
+        now: 기준 시각 (epoch 초 또는 datetime, 기본: 현재 시각)
+    """
+
+    def __init__(self, now=None):
+        if isinstance(now, datetime):
+            now = (now if now.tzinfo else now.replace(tzinfo=KST)).timestamp()
+        self.now = time.time() if now is None else float(now)
+
+        # 기준 시각의 KST 날짜 (오늘 / 올해 계산용)
+        kst_now = time.gmtime(self.now + KST_OFFSET_SECONDS)
+        self.year, self.month, self.day = kst_now.tm_year, kst_now.tm_mon, kst_now.tm_mday
+        self._cache = {}  # 기준 시각에 따라 달라지는 형식 결과
+
+    def parse(self, text):
+        """
+        시간 문자열 → epoch 초
+
+        Returns:
+            float | None: 해석할 수 없으면 None
+        """
+        if not text:
+            return None
+        if not isinstance(text, str):
+            return None
+        text = text.strip()
+
+        value = _parse_absolute(text)
+        if value is not None:
+            return value
+
+        if text in self._cache:
+            return self._cache[text]
+        value = self._parse_relative(text)
+        self._cache[text] = value
+        return value
+
+    def parse_many(self, texts):
+        """시간 문자열 리스트 → epoch 초 리스트 (같은 순서, 실패는 None)"""
+        return [self.parse(text) for text in texts]
+
+    def parse_datetime(self, text):
+        """시간 문자열 → KST timezone-aware datetime (기존 parse_time 호환)"""
+        value = self.parse(text)
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, KST)
+
+    def _parse_relative(self, text):
+        match = _CLOCK.match(text)
+        if match:
+            hour, minute, second = match.groups()
+            value = _kst_epoch(self.year, self.month, self.day, int(hour), int(minute), _int(second))
+            if value is not None and value > self.now + FUTURE_TOLERANCE_SECONDS:
+                value -= 86400
+            return value
+
+        match = _MONTH_DAY.match(text)
+        if match:
+            month, day, hour, minute = match.groups()
+            value = _kst_epoch(self.year, int(month), int(day), _int(hour), _int(minute))
+            if value is not None and value > self.now + 86400:
+                value = _kst_epoch(self.year - 1, int(month), int(day), _int(hour), _int(minute))
+            return value
+
+        match = _RELATIVE.search(text)
+        if match:
+            amount, unit = match.groups()
+            return self.now - int(amount) * _UNIT_SECONDS[unit]
+
+        if any(word in text for word in _JUST_NOW):
+            return self.now
+
+        return None
+
+
+def parse_time_kst(text, now=None):
+    """시간 문자열 → KST datetime (기준 시각 생략 시 현재 시각)"""
+    return TimeParser(now).parse_datetime(text)
@@ -0,0 +1,245 @@
+"""
+준비 신호 기반 대기 + 도메인별 요청 간격 (politeness)
+
+사용 의도:
+- 펨코리아 / 루리웹 워밍업의 time.sleep(random.uniform(1, 4)), 재시도 time.sleep(10) 처럼
+  페이지 상태와 무관한 고정 / 랜덤 대기가 실행 시간의 큰 부분을 차지
+- 목록 대기는 WebDriverWait(15~60초) 하나로, 목록이 없는 페이지(봇 확인, 오류)에서도 시간 초과까지 기다린 뒤 계속 진행
+- 대기는 구체적인 준비 신호로 끝내고, 사이트 부하 조절은 도메인별 토큰 버킷으로 분리
+
+준비 신호 (wait_for_list):
+- 목록 선택자 존재 + 게시글 행 수가 stable_for 초 동안 변하지 않음 → 준비 완료
+- 목록 선택자가 없는데 문서 로드 완료 + 리소스 요청 수가 idle_for 초 동안 그대로(네트워크 유휴) → 조기 포기
+- 둘 다 아니면 timeout 까지 대기
+
+요청 간격 (Politeness):
+- 도메인별 토큰 버킷 (초당 POLITENESS_RPS 개, 최대 POLITENESS_BURST 개 누적)
+- 모든 페이지 요청(HTTP, Chrome 이동, 메뉴 클릭, 새 탭) 직전에 acquire(url)
+- 토큰이 남아 있으면 대기 없음 → 고정 대기와 달리 요청이 드문 실행은 시간을 쓰지 않음
+
+지표:
+    wait_ms: 준비 신호 대기 (기존 WebDriverWait 구간과 같은 이름) / politeness_wait_ms: 요청 간격 대기
+    페이지별 대기 시간은 common.fetcher 가 로그로 출력하고 close 시 요약
+
+환경 변수:
+    POLITENESS: '0' 이면 요청 간격 조절 비활성화 (기본 활성)
+    POLITENESS_RPS: 도메인별 초당 요청 수 (기본 2)
+    POLITENESS_BURST: 연속 요청 허용 수 (기본 6)
+    POLITENESS_DOMAIN_RPS: 도메인별 초당 요청 수 (예: 'fmkorea.com=0.5,ruliweb.com=1')
+"""
+import os
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from selenium.webdriver import ActionChains
+
+from common.metrics import span
+
+# ready: 목록 준비 여부 / reason: 'ready' | 'idle'(목록 없이 네트워크 유휴) | 'timeout'
+# rows: 마지막 확인 행 수 / seconds: 대기 시간
+WaitResult = namedtuple('WaitResult', ['ready', 'reason', 'rows', 'seconds'])
+
+POLL_INTERVAL = 0.1
+
+# [목록 존재, 행 수, 문서 상태, 리소스 요청 수] 를 한 번의 호출로 확인
+_LIST_STATE_SCRIPT = """
+var list = document.querySelector(arguments[0]);
+var rows = list ? document.querySelectorAll(arguments[1]).length : 0;
+var resources = window.performance && performance.getEntriesByType
+    ? performance.getEntriesByType('resource').length : 0;
+return [!!list, rows, document.readyState, resources];
+"""
+
+
+def wait_for_list(driver, selector, row_selector=None, timeout=15, stable_for=0.3, idle_for=2.0):
+    """
+    목록 준비 대기 (선택자 존재 + 행 수 안정, 목록 없이 네트워크 유휴면 조기 포기)
+
+    Args:
+        selector: 목록 컨테이너 CSS 선택자
+        row_selector: 게시글 행 CSS 선택자 (없으면 selector 개수로 판단)
+        timeout: 최대 대기 시간 (초)
+        stable_for: 행 수가 변하지 않아야 하는 시간 (초)
+        idle_for: 목록 없이 네트워크 유휴로 판단할 시간 (초)
+
+    Returns:
+        WaitResult
+    """
+    row_selector = row_selector or selector
+    start = time.monotonic()
+    deadline = start + timeout
+    # 행 안정 판단 (존재, 행 수) 과 네트워크 유휴 판단 (문서 상태, 리소스 수) 을 따로 추적
+    # (광고 등 리소스가 계속 로드돼도 행 수만 안정되면 준비 완료)
+    list_state, list_changed = None, start
+    net_state, net_changed = None, start
+
+    with span('wait'):
+        while True:
+            now = time.monotonic()
+            try:
+                present, rows, ready_state, resources = driver.execute_script(
+                    _LIST_STATE_SCRIPT, selector, row_selector
+                )
+            except Exception:
+                # 페이지 이동 중 (문서 교체)
+                present, rows, ready_state, resources = False, 0, None, None
+                list_state = net_state = None
+                list_changed = net_changed = now
+
+            if (present, rows) != list_state:
+                list_state, list_changed = (present, rows), now
+            elif present and rows and now - list_changed >= stable_for:
+                return WaitResult(True, 'ready', rows, now - start)
+
+            if (ready_state, resources) != net_state:
+                net_state, net_changed = (ready_state, resources), now
+            elif not present and ready_state == 'complete' and now - net_changed >= idle_for:
+                return WaitResult(False, 'idle', 0, now - start)
+
+            if now >= deadline:
+                return WaitResult(bool(present), 'timeout', rows, now - start)
+            time.sleep(POLL_INTERVAL)
+
+
+def wait_for_navigation(driver, previous_url, timeout=15):
+    """
+    클릭 이동 완료 대기 (URL 변경 + 문서 로드 완료)
+
+    Returns:
+        bool: 이동 완료 여부 (시간 초과면 False, 호출 측은 현재 페이지로 계속 진행)
+    """
+    deadline = time.monotonic() + timeout
+    with span('wait'):
+        while time.monotonic() < deadline:
+            try:
+                if driver.current_url != previous_url and \
+                        driver.execute_script('return document.readyState') == 'complete':
+                    return True
+            except Exception:
+                pass  # 문서 교체 중
+            time.sleep(POLL_INTERVAL)
+    return False
+
+
+def click_and_wait(driver, element, timeout=15):
+    """
+    메뉴 클릭 이동 (요청 간격 확인 → 클릭 → 이동 완료 대기)
+
+    Returns:
+        bool: 이동 완료 여부
+    """
+    previous_url = driver.current_url
+    get_politeness().acquire(previous_url)
+    ActionChains(driver).move_to_element(element).click().perform()
+    return wait_for_navigation(driver, previous_url, timeout)
+
+
+# ---------- 도메인별 요청 간격 ----------
+
+def politeness_enabled():
+    return os.environ.get('POLITENESS', '1') != '0'
+
+
+def _domain(url):
+    """'https://www.fmkorea.com/hotdeal' → 'fmkorea.com' (www. / m. 제외)"""
+    host = (urlsplit(url).hostname or '').lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def parse_domain_rates(spec):
+    """'fmkorea.com=0.5,ruliweb.com=1' → {'fmkorea.com': 0.5, 'ruliweb.com': 1.0}"""
+    rates = {}
+    for part in (spec or '').split(','):
+        if not part.strip():
+            continue
+        domain, _, rate = part.partition('=')
+        rates[domain.strip().lower()] = float(rate)
+    return rates
+
+
+class TokenBucket:
+    """
+    초당 rate 개 토큰, 최대 burst 개 누적
+
+    reserve 는 토큰을 먼저 예약(음수 허용)하고 대기 시간만 반환, 대기는 락 밖에서 → 여러 스레드가 순서대로 간격을 둠
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """토큰 1개 예약, 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class Politeness:
+    """
+    도메인 → TokenBucket (프로세스 공용, 사이트 동시 실행 / 미리 받기 스레드가 함께 사용)
+
+    Args:
+        rate: 기본 초당 요청 수
+        burst: 연속 요청 허용 수
+        domain_rates: {도메인: 초당 요청 수}
+    """
+
+    def __init__(self, rate=2.0, burst=6, domain_rates=None):
+        self.rate = rate
+        self.burst = burst
+        self.domain_rates = domain_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """url 도메인 요청 전 호출, 대기한 시간(초) 반환"""
+        domain = _domain(url)
+        if not domain:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(self.domain_rates.get(domain, self.rate), self.burst)
+
+        delay = bucket.reserve()
+        if delay > 0:
+            with span('politeness_wait'):
+                time.sleep(delay)
+        return delay
+
+
+class _NoPoliteness:
+    def acquire(self, url):
+        return 0.0
+
+
+_politeness = None
+_politeness_lock = threading.Lock()
+
+
+def get_politeness():
+    """프로세스 공용 요청 간격 조절기 (POLITENESS=0 이면 대기 없음)"""
+    global _politeness
+    with _politeness_lock:
+        if _politeness is None:
+            if politeness_enabled():
+                _politeness = Politeness(
+                    rate=float(os.environ.get('POLITENESS_RPS', 2)),
+                    burst=int(os.environ.get('POLITENESS_BURST', 6)),
+                    domain_rates=parse_domain_rates(os.environ.get('POLITENESS_DOMAIN_RPS')),
+                )
+            else:
+                _politeness = _NoPoliteness()
+        return _politeness
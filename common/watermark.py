@@ -0,0 +1,143 @@
+"""
+게시판별 최고 게시글 번호(high-water mark) 저장소
+
+사용 의도:
+- 지난 실행에서 API로 전송한 게시글 중 가장 큰 게시글 번호를 게시판별로 저장
+- 다음 실행에서는 그 번호 이하 게시글을 제외하고, 이미 본 게시글에 도달하면 페이지 이동 중단
+- 시간 기준(FILTER_MINUTES) 필터는 그대로 유지 (안전장치)
+- 제외한 게시글은 변경 감지(common.fingerprint)까지 가지 않으므로 좋아요 / 댓글 수 변경은 전송되지 않음
+  (변경 전송이 필요하면 INCREMENTAL_CRAWL=0)
+
+효과:
+- 실행마다 수 시간치 게시글을 다시 파싱/전송하던 것을 지난 실행 이후 새 글만으로 축소
+
+환경 변수:
+    INCREMENTAL_CRAWL: '0' 이면 비활성화 (기본 활성)
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from common.local_state import state_path
+from common.post_id import extract_post_id
+
+
+def incremental_enabled():
+    return os.environ.get('INCREMENTAL_CRAWL', '1') != '0'
+
+
+class WatermarkStore:
+    """게시판 키 → 최고 게시글 번호 (SQLite)"""
+
+    def __init__(self, path=None):
+        self.path = path or state_path('watermarks.sqlite3')
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS watermarks ('
+            ' board TEXT PRIMARY KEY,'
+            ' post_id INTEGER NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, board):
+        with self._lock:
+            row = self._conn.execute('SELECT post_id FROM watermarks WHERE board = ?', (board,)).fetchone()
+        return row[0] if row else None
+
+    def advance(self, board, post_id):
+        """저장된 번호보다 클 때만 갱신"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO watermarks (board, post_id, updated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(board) DO UPDATE SET post_id = excluded.post_id, updated_at = excluded.updated_at '
+                'WHERE excluded.post_id > watermarks.post_id',
+                (board, post_id, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+class BoardWatermark:
+    """
+    크롤링 1회 동안 게시판 1개의 high-water mark 추적
+
+    - split_new(): 이미 전송한 게시글 제외 + 마지막 위치까지 이미 본 게시글인지 판단
+    - observe(): 이번 실행에서 전송할 게시글 기록
+    - commit(): API 전송 성공 후 호출, 기록한 최고 번호 저장
+
+    Args:
+        site: 출처 사이트명
+        board: 게시판 URL 등 사이트 내 게시판 구분값
+        store: WatermarkStore (기본: 상태 디렉터리의 watermarks.sqlite3)
+    """
+
+    def __init__(self, site, board, store=None):
+        self.key = f"{site}:{board}"
+        self.store = None
+        self.last_id = None
+        self.pending_id = None
+        self.skipped = 0
+
+        if not incremental_enabled():
+            return
+
+        try:
+            self.store = store or WatermarkStore()
+            self.last_id = self.store.get(self.key)
+        except Exception as e:
+            print(f"게시글 번호 기록 사용 불가 (시간 기준으로만 진행): {e}")
+            self.store = None
+
+        if self.last_id is not None:
+            print(f"지난 실행 최고 게시글 번호: {self.last_id} ({self.key})")
+
+    def split_new(self, items):
+        """
+        이미 전송한 게시글 제외
+
+        Returns:
+            tuple: (새 게시글 리스트, 이미 본 게시글 도달 여부)
+                   페이지 마지막 게시글이 이미 본 글이면 다음 페이지도 모두 이미 본 글로 판단
+                   (상단 고정 공지처럼 번호가 낮은 글이 중간에 섞여도 계속 진행)
+        """
+        if self.last_id is None or not items:
+            return items, False
+
+        new_items = []
+        for item in items:
+            if self.is_seen(item.get('productUrl')):
+                self.skipped += 1
+                continue
+            new_items.append(item)
+
+        last_id = extract_post_id(items[-1].get('productUrl'))
+        reached = last_id is not None and last_id <= self.last_id
+        return new_items, reached
+
+    def is_seen(self, url):
+        """지난 실행에서 전송한 번호 이하 게시글 (상세 페이지 로드 전 목록 행 단계에서도 사용)"""
+        if self.last_id is None:
+            return False
+        post_id = extract_post_id(url)
+        return post_id is not None and post_id <= self.last_id
+
+    def observe(self, items):
+        for item in items:
+            post_id = extract_post_id(item.get('productUrl'))
+            if post_id is not None and (self.pending_id is None or post_id > self.pending_id):
+                self.pending_id = post_id
+
+    def commit(self):
+        if self.store is None or self.pending_id is None:
+            return
+        try:
+            self.store.advance(self.key, self.pending_id)
+            print(f"최고 게시글 번호 저장: {self.pending_id} ({self.key})")
+            self.pending_id = None
+        except Exception as e:
+            print(f"최고 게시글 번호 저장 실패: {e}")
@@ -0,0 +1,6 @@
+"""
+crawler 패키지 선언
+
+사용 의도: 전체 사이트를 한 프로세스에서 실행하는 진입점 모음
+효과: python -m crawler.run --sites all 로 실행 가능
+"""
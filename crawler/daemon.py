@@ -0,0 +1,249 @@
+"""
+상주 크롤러 (내부 스케줄러)
+
+사용법:
+    python -m crawler.daemon --sites all --interval 300
+    python -m crawler.daemon --sites all --interval 300 --site-interval ppomppu=60,fmkorea=120 --jitter 0.1
+
+사용 의도:
+- 사이트별 Fargate 작업을 EventBridge 가 주기마다 새로 띄우는 구조 → 매 주기 컨테이너 기동 + import + Chrome 기동
+- 프로세스를 상주시켜 인터프리터 / Chrome 브라우저 풀 / HTTP Session 을 유지하고,
+  사이트별 주기를 우선순위 큐(다음 실행 시각 순)로 스케줄링
+
+동작:
+- 사이트마다 주기(--interval, --site-interval) + 지터(주기의 0 ~ jitter 비율)로 다음 실행 시각 결정
+- 적응형 주기(common.crawl_rate, ADAPTIVE_CRAWL) 사용 시 실행이 끝날 때마다 게시판 등록 속도로 정한
+  권장 간격으로 주기를 바꾸고 다음 실행 시각을 다시 잡음 (--interval / --site-interval 은 첫 실행 기준)
+- 같은 사이트의 이전 실행이 끝나지 않았으면 이번 주기는 건너뜀 (중복 실행 방지)
+- 사이트 실행이 --site-timeout 을 넘기면 프로세스를 종료 (스레드는 강제 종료할 수 없으므로 ECS 서비스가 재시작)
+- SIGTERM / SIGINT: 새 실행 중단, 진행 중인 사이트는 현재 페이지까지 전송 후 마무리 (common.pipeline.request_shutdown),
+  --grace 초 안에 끝나지 않으면 그대로 종료 (전송 실패분은 보관함에 남음)
+
+환경 변수:
+    DAEMON_INTERVAL: 기본 주기 (초, --interval 기본값, 기본 300)
+    DAEMON_SITE_INTERVALS: 사이트별 주기 (--site-interval 기본값, 예: 'ppomppu=60,fmkorea=120')
+"""
+import argparse
+import heapq
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from crawler.run import run_site
+from crawler.sites import resolve_sites, site_label
+from common.pipeline import request_shutdown
+
+DEFAULT_INTERVAL = 300
+
+
+def parse_site_intervals(spec):
+    """'ppomppu=60,fmkorea=120' → {'ppomppu': 60.0, 'fmkorea': 120.0}"""
+    intervals = {}
+    for part in (spec or '').split(','):
+        if not part.strip():
+            continue
+        name, _, seconds = part.partition('=')
+        name = name.strip().lower()
+        resolve_sites(name)  # 알 수 없는 사이트면 ValueError
+        intervals[name] = float(seconds)
+    return intervals
+
+
+class Scheduler:
+    """
+    사이트별 주기 실행 스케줄러
+
+    Args:
+        names: 사이트명 리스트 (앞쪽이 같은 시각 실행 시 우선)
+        intervals: {사이트명: 주기(초)}
+        concurrency: 동시에 실행할 사이트 수
+        jitter: 주기 대비 지터 비율 (0.1 → 0 ~ 주기의 10% 지연)
+        site_timeout: 사이트 1회 실행 최대 시간 (초)
+        send: API 전송 여부
+        run_func: 사이트 1회 실행 함수 run_func(name, send) → 결과 dict
+    """
+
+    def __init__(self, names, intervals, concurrency=2, jitter=0.1, site_timeout=600, send=True, run_func=run_site):
+        self.intervals = intervals
+        self.jitter = jitter
+        self.site_timeout = site_timeout
+        self.send = send
+        self.run_func = run_func
+
+        self.exit_code = 0
+        self.abandoned = False  # 끝나지 않은 실행 스레드를 두고 종료
+        self.stats = {name: {'runs': 0, 'failures': 0, 'skipped': 0, 'last_seconds': None} for name in names}
+
+        self._queue = []     # (실행 시각, 우선순위, 사이트명)
+        self._running = {}   # 사이트명 → (future, 제출 시각)
+        self._started = {}   # 사이트명 → 실제 시작 시각 (작업 스레드에서 기록, 빈 슬롯 대기 중이면 없음)
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='daemon')
+
+        # 첫 실행도 지터만큼 분산 (동시 기동 방지)
+        now = time.monotonic()
+        for priority, name in enumerate(names):
+            heapq.heappush(self._queue, (now + self._jitter_for(name), priority, name))
+
+    def _jitter_for(self, name):
+        return random.uniform(0, self.jitter * self.intervals[name])
+
+    def stop(self, signum=None, frame=None):
+        """새 실행 중단 (시그널 핸들러로도 사용)"""
+        if signum is not None:
+            print(f"\n종료 신호 수신 ({signal.Signals(signum).name}) → 새 실행 중단, 진행 중 실행 마무리")
+        self._stop.set()
+        request_shutdown()
+
+    def run_forever(self, grace=25):
+        """stop() 호출까지 실행, 종료 시 진행 중 실행을 grace 초까지 대기"""
+        try:
+            while not self._stop.is_set():
+                self._reap()
+                if self._stop.is_set():
+                    break
+
+                due, priority, name = self._queue[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._stop.wait(min(delay, 1.0))
+                    continue
+
+                heapq.heappop(self._queue)
+                heapq.heappush(self._queue, (self._next_due(name, due), priority, name))
+                self._start(name)
+        finally:
+            self._drain(grace)
+        return self.exit_code
+
+    def _next_due(self, name, due):
+        """다음 실행 시각 (밀린 주기는 몰아서 실행하지 않음)"""
+        interval = self.intervals[name]
+        next_due = due + interval
+        now = time.monotonic()
+        if next_due < now:
+            next_due = now + interval
+        return next_due + self._jitter_for(name)
+
+    def _start(self, name):
+        if name in self._running:
+            self.stats[name]['skipped'] += 1
+            started = self._started.get(name)
+            if started is None:
+                print(f"[{site_label(name)}] 이전 실행이 빈 슬롯 대기 중, 이번 주기 건너뜀")
+            else:
+                print(f"[{site_label(name)}] 이전 실행 진행 중 ({time.monotonic() - started:.0f}초), 이번 주기 건너뜀")
+            return
+
+        self.stats[name]['runs'] += 1
+        self._running[name] = (self._executor.submit(self._run, name), time.monotonic())
+
+    def _run(self, name):
+        """작업 스레드에서 실행 (시작 시각은 슬롯을 얻은 시점 기준 → 대기 시간이 타임아웃에 포함되지 않음)"""
+        self._started[name] = time.monotonic()
+        return self.run_func(name, self.send)
+
+    def _reap(self):
+        """끝난 실행 정리 + 타임아웃 확인 (아직 시작하지 않은 실행은 제외)"""
+        now = time.monotonic()
+        for name, (future, submitted) in list(self._running.items()):
+            started = self._started.get(name)
+            if future.done():
+                del self._running[name]
+                self._started.pop(name, None)
+                started = started or submitted
+                self._record(name, future, now - started, started)
+            elif started is not None and now - started > self.site_timeout:
+                print(f"[{site_label(name)}] {self.site_timeout}초 초과 → 프로세스 재시작 필요, 종료")
+                self.exit_code = 1
+                self.stop()
+
+    def _record(self, name, future, seconds, started=None):
+        stats = self.stats[name]
+        stats['last_seconds'] = round(seconds, 2)
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        if not result.get('success'):
+            stats['failures'] += 1
+        if result.get('next_interval') and started is not None and not self._stop.is_set():
+            self._adapt(name, result['next_interval'], started)
+
+        next_in = min(due for due, _, queued in self._queue if queued == name) - time.monotonic()
+        print(f"[{site_label(name)}] 실행 {stats['runs']}회째 {'성공' if result.get('success') else '실패'} "
+              f"({seconds:.1f}초, {result.get('total_items', 0)}개), 다음 실행 {max(next_in, 0):.0f}초 후")
+
+    def _adapt(self, name, interval, started):
+        """적응형 권장 간격으로 주기 변경 + 다음 실행 시각 재계산 (실행 시작 기준)"""
+        previous = self.intervals[name]
+        self.intervals[name] = float(interval)
+        due = max(started + interval, time.monotonic()) + self._jitter_for(name)
+        self._queue = [(due if queued == name else d, p, queued) for d, p, queued in self._queue]
+        heapq.heapify(self._queue)
+        if interval != previous:
+            self.stats[name]['interval'] = interval
+            print(f"[{site_label(name)}] 주기 변경 {previous:.0f}초 → {interval:.0f}초")
+
+    def _drain(self, grace):
+        """진행 중 실행 대기 (전송 큐 flush + 보관함 저장까지)"""
+        if self._running:
+            print(f"진행 중 실행 {len(self._running)}개 마무리 대기 (최대 {grace}초)")
+            futures = [future for future, _ in self._running.values()]
+            done, not_done = wait(futures, timeout=grace)
+            now = time.monotonic()
+            for name, (future, submitted) in list(self._running.items()):
+                if future in done:
+                    self._record(name, future, now - self._started.get(name, submitted))
+                else:
+                    print(f"[{site_label(name)}] {grace}초 안에 끝나지 않음 (전송 실패분은 보관함에 남음)")
+            if not_done:
+                self.abandoned = True
+                self.exit_code = self.exit_code or 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='상주 크롤러 (사이트별 주기 실행)')
+    parser.add_argument('--sites', default='all', help="'all' 또는 쉼표로 구분한 사이트명")
+    parser.add_argument('--interval', type=float, default=float(os.environ.get('DAEMON_INTERVAL', DEFAULT_INTERVAL)),
+                        help='기본 실행 주기 (초)')
+    parser.add_argument('--site-interval', default=os.environ.get('DAEMON_SITE_INTERVALS', ''),
+                        help="사이트별 주기 (예: ppomppu=60,fmkorea=120)")
+    parser.add_argument('--jitter', type=float, default=0.1, help='주기 대비 지터 비율 (기본 0.1)')
+    parser.add_argument('--concurrency', type=int, default=2, help='동시 실행 사이트 수 (기본 2)')
+    parser.add_argument('--site-timeout', type=int, default=600, help='사이트 1회 최대 실행 시간 (초)')
+    parser.add_argument('--grace', type=int, default=25, help='종료 신호 후 진행 중 실행 대기 시간 (초)')
+    parser.add_argument('--browsers', type=int, default=None, help='Chrome 브라우저 풀 크기 (기본: BROWSER_POOL_SIZE)')
+    parser.add_argument('--no-send', action='store_true', help='API 전송 없이 크롤링만 실행')
+    args = parser.parse_args(argv)
+
+    if args.browsers:
+        os.environ['BROWSER_POOL_SIZE'] = str(args.browsers)
+
+    names = resolve_sites(args.sites)
+    overrides = parse_site_intervals(args.site_interval)
+    intervals = {name: overrides.get(name, args.interval) for name in names}
+    print("상주 크롤러 시작: " + ', '.join(f"{name}({intervals[name]:.0f}초)" for name in names))
+
+    scheduler = Scheduler(names, intervals, args.concurrency, args.jitter, args.site_timeout,
+                          send=not args.no_send)
+    signal.signal(signal.SIGTERM, scheduler.stop)
+    signal.signal(signal.SIGINT, scheduler.stop)
+
+    exit_code = scheduler.run_forever(grace=args.grace)
+    print(f"상주 크롤러 종료 (exit {exit_code}): {scheduler.stats}")
+
+    # 끝나지 않은 사이트 스레드가 남아 있으면 인터프리터 종료가 막히므로 즉시 종료
+    if scheduler.abandoned:
+        sys.stdout.flush()
+        os._exit(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+전체 사이트 동시 크롤링 진입점
+
+사용법:
+    python -m crawler.run --sites all --concurrency 4
+    python -m crawler.run --sites ppomppu,ruliweb --site-timeout 300 --no-send
+
+사용 의도:
+- 사이트별 컨테이너를 따로 띄우지 않고 한 프로세스에서 전체 게시판 크롤링
+- 동시 실행 수 제한 + 사이트별 타임아웃 + 사이트 단위 실패 격리
+- 실행 결과와 소요 시간을 하나의 리포트로 출력
+
+효과:
+- 콜드 스타트 1회, 네트워크 대기 시간 중첩
+- 전체 소요 시간 ≒ 가장 느린 사이트 소요 시간
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from crawler.sites import resolve_sites, load_scraper_class, site_label
+from common.crawl_rate import adaptive_enabled, CrawlRateTracker
+from common.metrics import start_run, incr, gauge
+from common.pipeline import scrape_and_send, is_delivered, shutdown_requested, summarize_result
+
+API_URL = os.environ.get('API_URL')
+API_KEY = os.environ.get('API_KEY')
+
+
+def run_site(name, send=True, started=None):
+    """
+    사이트 1개 크롤링 + API 전송
+
+    Args:
+        name: 사이트명 (crawler.sites.SITES 키)
+        send: API 전송 여부
+        started: 시작 시각 기록용 dict (타임아웃 판단에 사용)
+
+    Returns:
+        dict: 사이트 실행 결과 ('next_interval': 적응형 주기 사용 시 다음 실행 권장 간격(초))
+    """
+    if started is not None:
+        started[name] = time.monotonic()
+
+    site = site_label(name)
+    start = time.monotonic()
+    result = {'site': site, 'success': False, 'total_items': 0}
+    run = start_run(site)
+    tracker = None
+
+    try:
+        print(f"[{site}] 크롤링 시작 ...")
+        scraper = load_scraper_class(name)()
+        tracker = _plan_crawl(site, scraper)
+        window_start = time.time() - scraper.filter_minutes * 60
+
+        # 페이지 단위로 수집과 동시에 전송 (crawl_seconds 에 전송 대기 시간 포함)
+        items, api_result = scrape_and_send(scraper, API_URL, API_KEY, site, send=send)
+        incr('items', len(items))
+        result['crawl_seconds'] = round(time.monotonic() - start, 2)
+        result['total_items'] = len(items)
+        print(f"[{site}] 크롤링 완료: {len(items)}개 수집")
+
+        delivered = True
+        if items and send:
+            result['api'] = summarize_result(api_result)
+            print(f"[{site}] API 전송 완료 : {result['api']}")
+            delivered = is_delivered(api_result)
+            if delivered:
+                scraper.commit_watermarks()
+
+        result['success'] = True
+
+        if tracker and not shutdown_requested():  # 종료 요청으로 중단된 실행은 관측에서 제외
+            result['next_interval'] = _observe_crawl(site, tracker, items, window_start, run, delivered)
+
+    except Exception as e:
+        print(f"[{site}] 에러: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        result['error'] = str(e)
+        run.fail(e)
+
+    if tracker:
+        tracker.close()
+    run.finish()
+    result['seconds'] = round(time.monotonic() - start, 2)
+    return result
+
+
+def _plan_crawl(site, scraper):
+    """게시판 등록 속도로 이번 수집 기간 결정 (common.crawl_rate, 비활성 또는 오류 시 None)"""
+    if not adaptive_enabled():
+        return None
+    try:
+        tracker = CrawlRateTracker(site, default_filter_minutes=scraper.filter_minutes)
+    except sqlite3.Error as e:
+        print(f"[{site}] 등록 속도 기록 사용 불가 (고정 수집 기간): {e}")
+        return None
+
+    plan = tracker.plan()
+    scraper.filter_minutes = plan.filter_minutes
+    if plan.max_pages:
+        scraper.max_pages = plan.max_pages
+    scraper.planned_pages = plan.pages
+    gauge('adaptive_filter_minutes', plan.filter_minutes)
+    gauge('page_budget', scraper.max_pages)
+    gauge('pages_predicted', plan.pages)
+    if plan.rate_per_hour is None:
+        print(f"[{site}] 등록 속도 기록 없음, 수집 기간 {plan.filter_minutes}분, 최대 {scraper.max_pages}페이지")
+    else:
+        print(f"[{site}] 등록 속도 {plan.rate_per_hour}건/시간 → 수집 기간 {plan.filter_minutes}분, "
+              f"예상 {plan.pages}페이지 (최대 {scraper.max_pages}페이지)")
+    return tracker
+
+
+def _observe_crawl(site, tracker, items, window_start, run, delivered):
+    """이번 실행 게시글로 등록 속도 / 페이지당 게시글 수 갱신, 다음 실행 권장 간격(초) 반환"""
+    counters = run.counters
+    truncated = counters.get('page_limit_reached', 0) > 0
+    try:
+        observed = tracker.observe(items, window_start, truncated=truncated, delivered=delivered,
+                                   list_pages=counters.get('list_pages', 0), list_rows=counters.get('list_rows', 0))
+    except sqlite3.Error as e:
+        print(f"[{site}] 등록 속도 기록 실패: {e}")
+        return None
+
+    plan = tracker.plan()
+    gauge('observed_rate_per_hour', observed.rate_per_hour)
+    gauge('adaptive_rate_per_hour', plan.rate_per_hour)
+    gauge('adaptive_interval_seconds', plan.interval)
+    if truncated:
+        gauge('page_overflow_posts', observed.overflow_posts)
+        print(f"[{site}] 최대 페이지 도달: 놓친 게시글 약 {observed.overflow_posts}개 추정 "
+              f"→ 다음 실행 최대 {plan.max_pages}페이지")
+    print(f"[{site}] 관측 {observed.rate_per_hour}건/시간, "
+          f"추정 {plan.rate_per_hour}건/시간 → 다음 실행 권장 {plan.interval}초 후")
+    return plan.interval
+
+
+def run_sites(names, concurrency=4, site_timeout=600, send=True):
+    """
+    여러 사이트를 동시에 크롤링
+
+    Args:
+        names: 사이트명 리스트
+        concurrency: 동시에 실행할 사이트 수
+        site_timeout: 사이트별 최대 실행 시간 (초, 시작 시점부터)
+        send: API 전송 여부
+
+    Returns:
+        dict: 통합 결과 리포트
+    """
+    wall_start = time.monotonic()
+    started = {}
+    results = {}
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='crawler')
+    futures = {executor.submit(run_site, name, send, started): name for name in names}
+    pending = set(futures)
+
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                results[name] = future.result()
+
+            # 사이트별 타임아웃 (스레드는 강제 종료할 수 없으므로 결과만 버리고 진행)
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                if name in started and now - started[name] > site_timeout:
+                    print(f"[{site_label(name)}] {site_timeout}초 초과, 타임아웃 처리")
+                    results[name] = {
+                        'site': site_label(name),
+                        'success': False,
+                        'total_items': 0,
+                        'error': f'timeout ({site_timeout}s)',
+                        'seconds': round(now - started[name], 2),
+                        'timed_out': True,
+                    }
+                    pending.discard(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    wall_seconds = round(time.monotonic() - wall_start, 2)
+    ordered = [results[name] for name in names if name in results]
+
+    return {
+        'success': all(r['success'] for r in ordered),
+        'total_items': sum(r['total_items'] for r in ordered),
+        'wall_seconds': wall_seconds,
+        'sum_seconds': round(sum(r.get('seconds', 0) for r in ordered), 2),
+        'sites': ordered,
+    }
+
+
+def print_report(report):
+    """사이트별 소요 시간 리포트 출력"""
+    print(f"\n{'=' * 60}")
+    print("📊 전체 크롤링 결과")
+    print(f"{'=' * 60}")
+    for r in report['sites']:
+        status = "✅" if r['success'] else "❌"
+        error = f" ({r['error']})" if r.get('error') else ''
+        print(f"{status} {r['site']:<12} {r['total_items']:>4}개  {r.get('seconds', 0):>7.2f}초{error}")
+    print(f"{'-' * 60}")
+    print(f"총 {report['total_items']}개 | 실제 소요 {report['wall_seconds']}초 "
+          f"(순차 실행 시 {report['sum_seconds']}초)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='전체 사이트 동시 크롤링')
+    parser.add_argument('--sites', default='all', help="'all' 또는 쉼표로 구분한 사이트명 (예: ppomppu,ruliweb)")
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 실행 사이트 수 (기본 4)')
+    parser.add_argument('--site-timeout', type=int, default=600, help='사이트별 최대 실행 시간(초, 기본 600)')
+    parser.add_argument('--browsers', type=int, default=None, help='Chrome 브라우저 풀 크기 (기본: BROWSER_POOL_SIZE)')
+    parser.add_argument('--no-send', action='store_true', help='API 전송 없이 크롤링만 실행')
+    args = parser.parse_args(argv)
+
+    if args.browsers:
+        os.environ['BROWSER_POOL_SIZE'] = str(args.browsers)
+
+    names = resolve_sites(args.sites)
+    print(f"크롤링 대상: {', '.join(names)} (동시 {args.concurrency}개)")
+
+    report = run_sites(names, args.concurrency, args.site_timeout, send=not args.no_send)
+    print_report(report)
+    print(json.dumps(report, ensure_ascii=False))
+
+    exit_code = 0 if report['success'] else 1
+
+    # 타임아웃된 사이트 스레드가 남아 있으면 인터프리터 종료가 막히므로 즉시 종료
+    if any(r.get('timed_out') for r in report['sites']):
+        sys.stdout.flush()
+        os._exit(exit_code)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
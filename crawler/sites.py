@@ -0,0 +1,55 @@
+"""
+사이트 레지스트리
+
+사이트 이름 → 스크래퍼 클래스 매핑 (functions/<site>/scraper.py)
+"""
+import importlib
+import os
+import sys
+
+# 프로젝트 루트 (common, functions 접근용)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# 사이트명: (모듈 경로, 클래스명, API 전송 시 사이트명)
+SITES = {
+    'ppomppu': ('functions.ppomppu.scraper', 'PpomppuScraper', 'PPOMPPU'),
+    'ruliweb': ('functions.ruliweb.scraper', 'RuliwebScraper', 'RULIWEB'),
+    'quasarzone': ('functions.quasarzone.scraper', 'QuasarzoneScraper', 'QUASARZONE'),
+    'arcalive': ('functions.arcalive.scraper', 'ArcaliveScraper', 'ARCALIVE'),
+    'eomisae': ('functions.eomisae.scraper', 'EomisaeScraper', 'EOMISAE'),
+    'fmkorea': ('functions.fmkorea.scraper', 'FmkoreaScraper', 'FMKOREA'),
+}
+
+
+def resolve_sites(spec):
+    """
+    '--sites' 인자를 사이트 목록으로 변환
+
+    Args:
+        spec: 'all' 또는 'ppomppu,ruliweb' 형태의 문자열
+
+    Returns:
+        list: 사이트명 리스트
+    """
+    if not spec or spec.strip().lower() == 'all':
+        return list(SITES)
+
+    names = [name.strip().lower() for name in spec.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SITES]
+    if unknown:
+        raise ValueError(f"알 수 없는 사이트: {', '.join(unknown)} (가능: {', '.join(SITES)})")
+    return names
+
+
+def load_scraper_class(name):
+    """사이트명으로 스크래퍼 클래스 로드"""
+    module_path, class_name, _ = SITES[name]
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
+def site_label(name):
+    """API 전송용 사이트명 (예: 'PPOMPPU')"""
+    return SITES[name][2]
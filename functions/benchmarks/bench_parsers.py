@@ -0,0 +1,227 @@
+"""
+사이트별 파서 처리량 벤치마크 (오프라인 픽스처 사용, 네트워크/브라우저 없음)
+
+사용법:
+    python functions/benchmarks/bench_parsers.py                     # 전체 사이트, 기준치와 비교
+    python functions/benchmarks/bench_parsers.py --sites ppomppu --repeat 10
+    python functions/benchmarks/bench_parsers.py --save-baseline     # 현재 결과를 기준치로 저장
+
+측정 항목 (사이트별):
+- 목록 페이지: BeautifulSoup 파싱 + 행 선택 + _is_excluded / _extract_item → 초당 처리 행 수
+- 상세 페이지: 파싱 + 상세 시간 선택자 → 초당 처리 페이지 수 (상세 픽스처가 있는 사이트만)
+- 항목별 시간: cProfile 기준 정규화 함수 / 선택자 호출별 누적 시간
+- 최대 메모리: tracemalloc peak
+
+기준치(baseline.json) 대비 초당 처리 행 수가 --tolerance 이상 떨어지거나,
+추출 중 예외가 난 행이 기준치보다 많으면 종료 코드 1
+(처리량은 예외 없이 처리한 행 기준 / 기준치는 같은 머신에서 저장한 값과 비교해야 의미가 있음)
+
+픽스처: fixtures/<site>/ (capture_fixtures.py 로 실제 페이지 수집, build_sample_fixtures.py 로 예시 생성)
+"""
+import argparse
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import statistics
+import sys
+import time
+import tracemalloc
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common, crawler 접근 가능
+
+from bs4 import BeautifulSoup
+
+from crawler.sites import resolve_sites, load_scraper_class
+from fixtures import load_fixtures
+
+BASELINE_PATH = os.path.join(current_dir, 'baseline.json')
+
+# _extract_item 추가 인자 (상세 시간은 비워 두고 목록 정보만으로 추출)
+EXTRACT_ARGS = {
+    'quasarzone': lambda fixture: ({},),
+    'eomisae': lambda fixture: ({}, fixture.get('board') or fixture['url']),
+}
+
+
+@contextlib.contextmanager
+def quiet():
+    """스크래퍼 print 출력 숨김"""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def parse_list_page(name, scraper, fixture):
+    soup = BeautifulSoup(fixture['html'], 'lxml')
+    extra = EXTRACT_ARGS.get(name, lambda f: ())(fixture)
+
+    rows = soup.select(scraper.row_selector)
+    items = failed = 0
+    for row in rows:
+        if hasattr(scraper, '_is_excluded') and scraper._is_excluded(row):
+            continue
+        try:
+            if scraper._extract_item(row, *extra):
+                items += 1
+        except Exception:
+            # 예외 난 행은 처리량에서 제외 (파서가 깨져 일찍 실패하면 빨라 보이지 않도록)
+            failed += 1
+    return len(rows), items, failed
+
+
+def parse_detail_page(scraper, fixture):
+    soup = BeautifulSoup(fixture['html'], 'lxml')
+    element = soup.select_one(scraper.detail_time_selector)
+    return element.get_text(strip=True) if element else None
+
+
+def run_lists(name, scraper, fixtures):
+    rows = items = failed = 0
+    for fixture in fixtures:
+        page_rows, page_items, page_failed = parse_list_page(name, scraper, fixture)
+        rows += page_rows
+        items += page_items
+        failed += page_failed
+    return rows, items, failed
+
+
+def bench_site(name, repeat, profile_top):
+    scraper = load_scraper_class(name)()
+    lists = load_fixtures(name, 'list')
+    details = load_fixtures(name, 'detail')
+    if not lists:
+        print(f"[{name}] 목록 픽스처 없음 (capture_fixtures.py 로 먼저 수집)")
+        return None
+
+    result = {'list_pages': len(lists), 'detail_pages': len(details)}
+
+    # 1. 목록 처리량
+    durations = []
+    with quiet():
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rows, items, failed = run_lists(name, scraper, lists)
+            durations.append(time.perf_counter() - start)
+    median = statistics.median(durations)
+    result.update({
+        'rows': rows,
+        'items': items,
+        'failed': failed,
+        'list_ms': round(median * 1000, 2),
+        'rows_per_sec': round((rows - failed) / median, 1) if median else None,
+    })
+
+    # 2. 상세 페이지 처리량
+    if details and hasattr(scraper, 'detail_time_selector'):
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for fixture in details:
+                parse_detail_page(scraper, fixture)
+            durations.append(time.perf_counter() - start)
+        median = statistics.median(durations)
+        result['detail_pages_per_sec'] = round(len(details) / median, 1) if median else None
+
+    # 3. 최대 메모리
+    tracemalloc.start()
+    with quiet():
+        run_lists(name, scraper, lists)
+    result['peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    tracemalloc.stop()
+
+    # 4. 항목별 시간 (정규화 함수 / 선택자 호출)
+    profiler = cProfile.Profile()
+    with quiet():
+        profiler.runcall(run_lists, name, scraper, lists)
+    result['fields'] = field_times(profiler, rows, profile_top)
+
+    return result
+
+
+def field_times(profiler, rows, top):
+    """common/ 정규화 함수와 bs4 선택자 호출의 누적 시간 (행당 µs)"""
+    stats = pstats.Stats(profiler).stats
+    common_dir = os.path.join(project_root, 'common')
+    selected = []
+    for (filename, _, func_name), (_, calls, _, cumtime, _) in stats.items():
+        is_bs4_call = filename.endswith(os.path.join('bs4', 'element.py')) and func_name in ('select_one', 'select', 'get_text')
+        if filename.startswith(common_dir) or is_bs4_call:
+            label = f"{os.path.basename(filename)}:{func_name}"
+            selected.append((label, calls, cumtime))
+
+    selected.sort(key=lambda entry: entry[2], reverse=True)
+    return [
+        {'name': label, 'calls': calls, 'us_per_row': round(cumtime / rows * 1e6, 1) if rows else None}
+        for label, calls, cumtime in selected[:top]
+    ]
+
+
+def print_result(name, result, baseline):
+    print(f"\n[{name}] 목록 {result['list_pages']}페이지 / 행 {result['rows']}개 / 추출 {result['items']}개")
+    if result['failed']:
+        print(f"  ❌ 추출 예외 {result['failed']}행 (처리량에서 제외)")
+    print(f"  처리 시간 {result['list_ms']}ms → {result['rows_per_sec']} 행/초, 최대 메모리 {result['peak_kb']}KB")
+    if 'detail_pages_per_sec' in result:
+        print(f"  상세 {result['detail_pages']}페이지 → {result['detail_pages_per_sec']} 페이지/초")
+    if baseline and baseline.get('rows_per_sec'):
+        ratio = result['rows_per_sec'] / baseline['rows_per_sec']
+        print(f"  기준치 대비 {ratio:.2f}배 (기준 {baseline['rows_per_sec']} 행/초)")
+    for field in result['fields']:
+        print(f"    {field['name']:<48} {field['calls']:>7}회 {field['us_per_row']:>9}µs/행")
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='사이트별 파서 처리량 벤치마크')
+    parser.add_argument('--sites', default='all')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8, help='항목별 시간 출력 개수')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 성능 저하 비율 (기본 20%%)')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+    failures = []
+
+    for name in resolve_sites(args.sites):
+        result = bench_site(name, args.repeat, args.top)
+        if result is None:
+            continue
+        results[name] = result
+        site_baseline = baseline.get(name)
+        print_result(name, result, site_baseline)
+
+        if result['failed'] > (site_baseline or {}).get('failed', 0):
+            failures.append(name)
+        if site_baseline and site_baseline.get('rows_per_sec'):
+            if result['rows_per_sec'] < site_baseline['rows_per_sec'] * (1 - args.tolerance):
+                regressions.append(name)
+
+    if args.save_baseline and results:
+        saved = {name: {k: v for k, v in r.items() if k != 'fields'} for name, r in results.items()}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({**baseline, **saved}, f, ensure_ascii=False, indent=2)
+        print(f"\n기준치 저장: {args.baseline}")
+
+    if failures:
+        print(f"\n❌ 추출 예외 증가: {', '.join(failures)}")
+    if regressions:
+        print(f"\n⚠️ 성능 저하: {', '.join(regressions)} (허용 {args.tolerance:.0%})")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+가격 / 배송비 추출 엔진 벤치마크 (common.price_parser)
+
+사용법:
+    python functions/benchmarks/bench_price_parser.py
+    python functions/benchmarks/bench_price_parser.py --titles titles.txt --repeat 20
+
+측정 항목:
+- engine: parse_title 1회 스캔 (가격 + 통화 + 배송비 + 정리된 제목)
+- legacy: 기존 방식 재현 (형식별 re.search 순차 시도 + 제목 끝 (가격/배송비) 정규식 + 배송비 키워드)
+- 처리량: 분당 제목 수, 제목당 µs
+- 형식별 인식 결과 분포 (통화 / 배송비 인식 건수)
+- 예시 제목 가격 검증 (EXPECTED_PRICES 와 다르면 종료 코드 1)
+
+--titles 를 주지 않으면 사이트 제목 형식을 흉내 낸 예시 제목을 사용
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common 접근 가능
+
+from common.price_parser import parse_title
+
+SAMPLE_TITLES = [
+    '[쿠팡] 대추방울토마토 2kg (8,910원/무배)',
+    '[11번가] 삼성 갤럭시 버즈3 프로 (189,000/무료)',
+    '[G마켓] LG 울트라기어 27GR83Q (1.5만/3,000)',
+    '[네이버] 로지텍 G PRO X 슈퍼라이트 2 (159,000원/2,500원)',
+    '오늘의집 대추방울토마토 8,910원',
+    '[옥션] 다이슨 V15 청소기 ￦699,200 무료배송',
+    '헤드폰 12.3만원 역대가',
+    '[알리] 샤오미 보조배터리 10850원 무배',
+    '[아마존] 아이폰 16 케이스 $19.99 직구',
+    '[라쿠텐] 카메라 ¥98,000 관부가세 별도',
+    '[아마존 독일] 노트북 €799',
+    '라이젠 7 9800X3D 2025 신형 입고',
+    '[스팀] 엘든 링 50% 할인',
+    '[무료] 에픽게임즈 이번주 무료 게임',
+    '[CU] 편의점 1+1 행사 모음',
+    'RTX 5070 Ti 그래픽카드 (1,099,000/2500)',
+    '[11번가] 2024 맥북 에어 M3 1,390,000원',
+    '갤럭시 S25 2025년형 자급제 2025원 특가',
+]
+
+# 예시 제목 → 기대 원화 가격 (연식 / 모델명 숫자가 가격으로 잡히지 않는지 확인)
+EXPECTED_PRICES = {
+    '[쿠팡] 대추방울토마토 2kg (8,910원/무배)': 8910,
+    '[G마켓] LG 울트라기어 27GR83Q (1.5만/3,000)': 15000,
+    '헤드폰 12.3만원 역대가': 123000,
+    '라이젠 7 9800X3D 2025 신형 입고': None,
+    '[11번가] 2024 맥북 에어 M3 1,390,000원': 1390000,
+    '갤럭시 S25 2025년형 자급제 2025원 특가': 2025,
+}
+
+# ---------- 기존 방식 재현 (number_extractor + 뽐뿌/루리웹 정규식) ----------
+_LEGACY_PATTERNS = [
+    (r'([0-9]+\.?[0-9]*)\s*만\s*원', 10000, 0),
+    (r'[￦₩]\s*([0-9,]+)', 1, 100),
+    (r'([0-9,]+)\s*원', 1, 100),
+    (r'(?<!\d)([0-9]{4,})(?!\d)', 1, 1000),
+]
+_LEGACY_FOREIGN = [
+    r'\$\s*([0-9,]+(?:\.[0-9]{1,2})?)', r'([0-9,]+(?:\.[0-9]{1,2})?)\s*달러', r'([0-9,]+(?:\.[0-9]{1,2})?)\s*USD',
+    r'¥\s*([0-9,]+)', r'([0-9,]+)\s*엔', r'([0-9,]+)\s*JPY',
+    r'€\s*([0-9,]+(?:\.[0-9]{1,2})?)', r'([0-9,]+(?:\.[0-9]{1,2})?)\s*유로', r'([0-9,]+(?:\.[0-9]{1,2})?)\s*EUR',
+]
+
+
+def legacy_parse(title):
+    match = re.search(r'\(([0-9,\.]+)원?\s*/\s*(.+?)\)\s*$', title)
+    if match:
+        shipping_text = match.group(2).strip()
+        shipping = '무료' if any(kw in shipping_text for kw in ['무배', '무료', '공짜']) else shipping_text
+        return title[:match.start()].strip(), match.group(1), shipping
+
+    price = None
+    for pattern, unit, minimum in _LEGACY_PATTERNS:
+        found = re.search(pattern, title)
+        if found:
+            try:
+                value = float(found.group(1).replace(',', '')) * unit
+            except ValueError:
+                continue
+            if minimum <= value <= 100000000:
+                price = int(value)
+                break
+    if price is None:
+        for pattern in _LEGACY_FOREIGN:
+            found = re.search(pattern, title, re.IGNORECASE)
+            if found:
+                price = found.group(0)
+                break
+
+    shipping = None
+    if any(keyword in title for keyword in ['무료배송', '무배', '배송비무료']):
+        shipping = '무료'
+    else:
+        found = re.search(r'배송비?\s*[:：]?\s*([0-9,]+)원?', title)
+        if found:
+            shipping = found.group(1)
+    return title, price, shipping
+
+
+def load_titles(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def throughput(func, titles, repeat):
+    """(제목당 µs 중앙값, 분당 제목 수)"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title in titles:
+            func(title)
+        runs.append((time.perf_counter() - start) / len(titles))
+    per_title = statistics.median(runs)
+    return per_title * 1e6, 60 / per_title
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='가격 / 배송비 추출 엔진 벤치마크')
+    parser.add_argument('--titles', help='제목 파일 (한 줄에 하나)')
+    parser.add_argument('--copies', type=int, default=500, help='예시 제목 반복 횟수 (--titles 없을 때)')
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    titles = load_titles(args.titles) if args.titles else SAMPLE_TITLES * args.copies
+    print(f"제목 {len(titles)}개, {args.repeat}회 측정 중앙값\n")
+
+    results = {}
+    for name, func in (('engine', parse_title), ('legacy', legacy_parse)):
+        per_title_us, per_minute = throughput(func, titles, args.repeat)
+        results[name] = per_title_us
+        print(f"{name:<8} 제목당 {per_title_us:7.2f}µs   분당 {per_minute:>14,.0f}개")
+    print(f"\n속도 향상: {results['legacy'] / results['engine']:.2f}x")
+
+    distinct = list(dict.fromkeys(titles))
+    currencies = Counter(parse_title(title).currency or '없음' for title in distinct)
+    shipping = sum(1 for title in distinct if parse_title(title).shipping_fee)
+    print(f"\n인식 결과 (고유 제목 {len(distinct)}개): 통화 {dict(currencies)}, 배송비 {shipping}개")
+
+    if not args.titles:
+        print()
+        for title in SAMPLE_TITLES:
+            info = parse_title(title)
+            amount = info.price if info.price is not None else info.price_text
+            print(f"  {title:<44} → 가격 {str(amount):<10} 배송비 {str(info.shipping_fee):<8} 제목 {info.title}")
+
+        mismatches = [(title, expected, parse_title(title).price)
+                      for title, expected in EXPECTED_PRICES.items()
+                      if parse_title(title).price != expected]
+        for title, expected, actual in mismatches:
+            print(f"❌ 가격 불일치: {title} → {actual} (기대 {expected})")
+        if mismatches:
+            return 1
+        print(f"\n✅ 가격 검증 통과 ({len(EXPECTED_PRICES)}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
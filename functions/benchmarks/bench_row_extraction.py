@@ -0,0 +1,122 @@
+"""
+목록 행 추출 방식 비교 벤치마크 (page_source + BeautifulSoup vs 페이지 안 JS 추출)
+
+사용법:
+    python functions/benchmarks/bench_row_extraction.py --site arcalive --html saved_arcalive.html
+    python functions/benchmarks/bench_row_extraction.py --site fmkorea --html saved.html --browser
+
+측정 항목:
+- soup 경로: HTML 문자열 → BeautifulSoup(lxml) → 행마다 _extract_item
+- js 경로 (--browser): 저장된 HTML을 Chrome에 file:// 로 띄운 뒤
+    * page_source 전송 + BeautifulSoup + _extract_item  (기존 Chrome 경로)
+    * execute_script 1회로 원시 필드 추출 + _build_item  (row_spec 경로)
+- 전송 크기: page_source 길이 vs 원시 필드 JSON 길이
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common 접근 가능
+sys.path.insert(0, functions_dir)   # 사이트 패키지 접근 가능
+
+from bs4 import BeautifulSoup
+
+from common.row_extractor import extract_rows_in_browser
+
+SCRAPERS = {
+    'arcalive': ('arcalive.scraper', 'ArcaliveScraper'),
+    'fmkorea': ('fmkorea.scraper', 'FmkoreaScraper'),
+}
+
+
+def load_scraper(site):
+    module_name, class_name = SCRAPERS[site]
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name)()
+
+
+def timed(func, repeat):
+    """repeat 회 실행한 소요 시간(ms) 리스트와 마지막 결과"""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations, result
+
+
+def summarize(name, durations, rows):
+    median = statistics.median(durations)
+    print(f"{name:<34} 중앙값 {median:8.2f}ms  최소 {min(durations):8.2f}ms  행 {rows}개")
+    return median
+
+
+def soup_path(scraper, html):
+    soup = BeautifulSoup(html, 'lxml')
+    return [scraper._extract_item(row) for row in soup.select(scraper.row_spec['rows'])]
+
+
+def bench_soup(scraper, html, repeat):
+    durations, items = timed(lambda: soup_path(scraper, html), repeat)
+    return summarize('soup (HTML 문자열 기준)', durations, len(items))
+
+
+def bench_browser(scraper, html_path, repeat):
+    from common.browser_pool import create_chrome_driver
+
+    driver = create_chrome_driver()
+    try:
+        driver.get('file://' + os.path.abspath(html_path))
+
+        def page_source_path():
+            return soup_path(scraper, driver.page_source)
+
+        def js_path():
+            return [scraper._build_item(fields) for fields in extract_rows_in_browser(driver, scraper.row_spec)]
+
+        soup_durations, soup_items = timed(page_source_path, repeat)
+        js_durations, js_items = timed(js_path, repeat)
+
+        soup_median = summarize('Chrome page_source + soup', soup_durations, len(soup_items))
+        js_median = summarize('Chrome execute_script (row_spec)', js_durations, len(js_items))
+        if js_median:
+            print(f"→ {soup_median / js_median:.1f}배")
+
+        source_size = len(driver.page_source.encode('utf-8'))
+        rows_size = len(json.dumps(extract_rows_in_browser(driver, scraper.row_spec), ensure_ascii=False).encode('utf-8'))
+        print(f"전송 크기: page_source {source_size:,}B vs 원시 필드 {rows_size:,}B")
+
+        if soup_items != js_items:
+            print("⚠️ 두 경로의 추출 결과가 다릅니다.")
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='목록 행 추출 방식 비교')
+    parser.add_argument('--site', required=True, choices=sorted(SCRAPERS))
+    parser.add_argument('--html', required=True, help='저장해 둔 목록 페이지 HTML 파일')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--browser', action='store_true', help='Chrome으로 JS 추출 경로까지 비교')
+    args = parser.parse_args(argv)
+
+    scraper = load_scraper(args.site)
+    with open(args.html, encoding='utf-8') as f:
+        html = f.read()
+
+    print(f"[{args.site}] {args.html} ({len(html.encode('utf-8')):,}B), {args.repeat}회 반복")
+    bench_soup(scraper, html, args.repeat)
+
+    if args.browser:
+        bench_browser(scraper, args.html, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+시간 파싱 엔진 벤치마크 (common.time_parser)
+
+사용법:
+    python functions/benchmarks/bench_time_parser.py
+    python functions/benchmarks/bench_time_parser.py --repeat 20000 --page 20
+
+측정 항목 (사이트에서 실제로 보이는 형식별):
+- cold: 결과 캐시를 비운 상태의 1회 파싱 시간
+- warm: 같은 문자열 반복 (절대 시각은 캐시, 상대 시간은 실행 단위 캐시)
+- page: 한 페이지(--page 개) 혼합 문자열을 parse_many 로 일괄 변환
+- 해석 결과 (KST) 를 함께 출력해 형식 인식 여부 확인
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common 접근 가능
+
+from common.deal_item import format_kst
+from common.time_parser import TimeParser, _parse_absolute
+
+# (형식, 예시, 사용 사이트)
+SAMPLES = [
+    ('HH:MM:SS', '13:45:12', '뽐뿌 목록'),
+    ('HH:MM', '13:45', '루리웹 / 퀘이사존 목록'),
+    ('yy.mm.dd HH:MM:SS', '25.10.31 13:45:12', '뽐뿌 title 속성'),
+    ('yy/mm/dd', '25/10/30', '뽐뿌 목록 (지난 글)'),
+    ('YYYY.MM.DD', '2025.10.30', '루리웹 목록 (지난 글)'),
+    ('N분 전', '5분 전', '아카라이브 / 어미새'),
+    ('N시간 전', '2시간 전', '아카라이브 / 어미새'),
+    ('MM-DD', '10-30', '퀘이사존 목록 (지난 글)'),
+    ('YYYY-MM-DD HH:MM', '2025-10-31 13:45', '퀘이사존 상세'),
+    ('YYYY-MM-DD HH:MM:SS', '2025-10-31 13:45:12', '어미새 상세 / 캐시'),
+    ('ISO 8601', '2025-10-31T04:45:12.000Z', '아카라이브 datetime 속성'),
+]
+
+
+def time_per_call(func, repeat):
+    """1회 호출당 평균 µs (5회 측정 중앙값)"""
+    runs = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        runs.append((time.perf_counter() - start) / repeat)
+    return statistics.median(runs) * 1e6
+
+
+def bench_format(text, repeat):
+    now = time.time()
+
+    def cold():
+        _parse_absolute.cache_clear()
+        TimeParser(now).parse(text)
+
+    parser = TimeParser(now)
+    return {
+        'result': format_kst(parser.parse(text)),
+        'cold_us': time_per_call(cold, repeat),
+        'warm_us': time_per_call(lambda: parser.parse(text), repeat),
+    }
+
+
+def bench_page(page_size, repeat):
+    texts = [SAMPLES[i % len(SAMPLES)][1] for i in range(page_size)]
+    parser = TimeParser()
+    return time_per_call(lambda: parser.parse_many(texts), max(repeat // page_size, 1))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='시간 파싱 엔진 벤치마크')
+    parser.add_argument('--repeat', type=int, default=10000)
+    parser.add_argument('--page', type=int, default=20, help='페이지당 시간 문자열 수')
+    args = parser.parse_args(argv)
+
+    print(f"{'형식':<22} {'예시':<28} {'결과 (KST)':<21} {'cold µs':>8} {'warm µs':>8}  사용처")
+    for name, text, used_by in SAMPLES:
+        result = bench_format(text, args.repeat)
+        print(f"{name:<22} {text:<28} {str(result['result']):<21} "
+              f"{result['cold_us']:>8.2f} {result['warm_us']:>8.2f}  {used_by}")
+
+    page_us = bench_page(args.page, args.repeat)
+    print(f"\n페이지 일괄 변환 ({args.page}개 혼합): {page_us:.1f}µs → 문자열당 {page_us / args.page:.2f}µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
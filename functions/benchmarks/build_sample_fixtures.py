@@ -0,0 +1,272 @@
+"""
+사이트별 예시 픽스처 생성 (네트워크 없이 bench_parsers.py 실행용)
+
+사용법:
+    python functions/benchmarks/build_sample_fixtures.py              # 전체 사이트
+    python functions/benchmarks/build_sample_fixtures.py --sites ppomppu --pages 5
+
+- 각 스크래퍼의 목록 / 상세 선택자에 맞춘 HTML 을 고정 시드로 생성 (실제 게시글 / 작성자 정보 없음)
+- 실제 페이지와 비슷하게 행마다 가격 표기 / 배송비 / 시간 형식을 섞고,
+  목록 밖 영역(메뉴, 공지, 제외 행)도 함께 넣어 선택자 탐색 비용을 반영
+- capture_fixtures.py 로 받은 실제 픽스처가 있으면 같은 파일명은 덮어씀 (--sites 로 범위 지정)
+"""
+import argparse
+import html
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common, crawler 접근 가능
+
+from crawler.sites import resolve_sites
+from fixtures import load_manifest, save_manifest, save_fixture
+
+KST = timezone(timedelta(hours=9))
+BASE_TIME = datetime(2025, 10, 18, 12, 0, 0, tzinfo=KST)
+CAPTURED_AT = BASE_TIME.strftime('%Y-%m-%dT%H:%M:%S')
+
+PRODUCTS = [
+    '삼성 990 PRO 2TB NVMe SSD', 'LG 그램 16 2025 노트북', '로지텍 MX Master 3S 마우스', '농심 신라면 40봉',
+    '나이키 에어포스 1 07', '아디다스 삼바 OG', '다이슨 V15 무선청소기', '애플 에어팟 프로 2세대 USB-C',
+    '라이젠 9800X3D 정품 멀티팩', '제주 삼다수 2L 24병', '코카콜라 제로 355ml 24캔', '뉴발란스 993 그레이',
+    '필립스 전동칫솔 소닉케어', 'WD Blue SN5000 1TB', '브리타 정수기 필터 6개입', '스탠리 텀블러 887ml',
+    '한돈 삼겹살 1kg', '샤오미 보조배터리 20000mAh', '캐논 EOS R50 렌즈킷', '오뚜기 진라면 매운맛 멀티팩',
+]
+STORES = ['쿠팡', 'G마켓', '11번가', '네이버', '옥션', 'SSG', '컴퓨존', '무신사', '알리익스프레스', '롯데온']
+CATEGORIES = ['컴퓨터', '디지털', '식품', '의류', '생활', '가전', '기타']
+SHIPPING = ['무료', '무배', '3,000원', '2,500원', '조건부 무료', '착불']
+
+
+def _price(rng):
+    return rng.choice([9900, 12900, 19800, 24900, 39000, 89000, 129000, 259000, 1299000])
+
+
+def _price_text(rng, price):
+    """제목 끝 가격 표기 (사이트마다 섞여 쓰이는 형식)"""
+    style = rng.randrange(5)
+    if style == 0:
+        return f"({price:,}원/{rng.choice(SHIPPING)})"
+    if style == 1:
+        return f"{price:,}원 {rng.choice(SHIPPING)}"
+    if style == 2 and price >= 10000 and price % 1000 == 0:
+        return f"({price / 10000:g}만원/{rng.choice(SHIPPING)})"
+    if style == 3:
+        return f"${price / 1400:.2f}"
+    return f"({price:,}/{rng.choice(SHIPPING)})"
+
+
+def _posts(rng, count, start_no, start_time):
+    """게시글 번호 / 등록 시각이 내려가는 예시 게시글"""
+    posts = []
+    posted = start_time
+    for index in range(count):
+        posted -= timedelta(minutes=rng.randint(1, 6), seconds=rng.randint(0, 59))
+        price = _price(rng)
+        posts.append({
+            'no': start_no - index,
+            'product': rng.choice(PRODUCTS),
+            'store': rng.choice(STORES),
+            'category': rng.choice(CATEGORIES),
+            'price': price,
+            'price_text': _price_text(rng, price),
+            'shipping': rng.choice(SHIPPING),
+            'reply': rng.randint(0, 80),
+            'like': rng.randint(0, 40),
+            'dislike': rng.randint(0, 3),
+            'time': posted,
+        })
+    return posts, posted
+
+
+def _page(body, title):
+    """목록 밖 영역(메뉴 / 푸터)을 포함한 문서"""
+    menu = ''.join(f'<li><a href="/menu/{n}">메뉴 {n}</a></li>' for n in range(60))
+    footer = ''.join(f'<p class="footer-line">안내 문구 {n}</p>' for n in range(20))
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{title}</title></head>'
+            f'<body><header><nav><ul class="gnb">{menu}</ul></nav></header>'
+            f'<main>{body}</main><footer>{footer}</footer></body></html>')
+
+
+def _e(text):
+    return html.escape(str(text), quote=True)
+
+
+# ---------- 사이트별 목록 / 상세 ----------
+
+def ppomppu_list(rng, posts):
+    rows = []
+    for n in range(2):  # 글번호 영역 이미지(쇼핑뽐뿌 / 핫딜) → _is_excluded
+        rows.append(f'<tr class="baseList"><td class="baseList-space baseList-numb"><img src="/images/notice.gif"></td>'
+                    f'<td class="baseList-space title"><a class="baseList-title" href="view.php?id=ppomppu&no=notice{n}">'
+                    f'<span>공지 {n}</span></a></td><td class="baseList-space baseList-rec">0 - 0</td></tr>')
+    for p in posts:
+        title = f"{p['product']} {p['price_text']}"
+        rows.append(
+            f'<tr class="baseList bbs_new1"><td class="baseList-space baseList-numb">{p["no"]}</td>'
+            f'<td class="baseList-space title"><a class="baseList-thumb" href="view.php?id=ppomppu&no={p["no"]}">'
+            f'<img src="//cdn.ppomppu.co.kr/zboard/data3/sample/{p["no"]}.jpg"></a>'
+            f'<div class="baseList-cover"><a class="baseList-title" href="view.php?id=ppomppu&no={p["no"]}">'
+            f'<em class="baseList-head subject_preface">[{_e(p["store"])}]</em> <span>{_e(title)}</span></a>'
+            f' <span class="baseList-c">{p["reply"]}</span> <small class="baseList-small">[{_e(p["category"])}]</small></div></td>'
+            f'<td class="baseList-space" title="{p["time"].strftime("%y.%m.%d %H:%M:%S")}">'
+            f'<time class="baseList-time">{p["time"].strftime("%H:%M:%S")}</time></td>'
+            f'<td class="baseList-space baseList-rec">{p["like"]} - {p["dislike"]}</td>'
+            f'<td class="baseList-space baseList-views">{rng.randint(100, 9000)}</td></tr>'
+        )
+    return _page(f'<table id="revolution_main_table"><tbody>{"".join(rows)}</tbody></table>', '뽐뿌게시판')
+
+
+def quasarzone_list(rng, posts):
+    rows = []
+    for p in posts:
+        href = f'/bbs/qb_saleinfo/views/{p["no"]}'
+        rows.append(
+            f'<tr><td><div class="market-info-type-list"><div class="thumb-wrap"><a class="thumb" href="{href}">'
+            f'<img src="https://img2.quasarzone.com/sample/{p["no"]}.jpg"></a></div>'
+            f'<div class="market-info-list-cont"><p class="tit"><a class="subject-link" href="{href}">'
+            f'<span class="ellipsis-with-reply-cnt">[{_e(p["store"])}] {_e(p["product"])}</span></a>'
+            f'<span class="board-list-comment"><span class="ctn-count">{p["reply"]}</span></span></p>'
+            f'<div class="market-info-sub"><p><span class="category">{_e(p["category"])}</span>'
+            f'<span class="text-orange">￦ {p["price"]:,} (KRW)</span><span>{_e(p["shipping"])}</span></p>'
+            f'<p><span class="date">{p["time"].strftime("%H:%M")}</span><span class="count">{rng.randint(100, 9000)}</span>'
+            f'<span class="num tp2">{p["like"]}</span></p></div></div></div></td></tr>'
+        )
+    return _page(f'<div class="market-type-list"><table><tbody>{"".join(rows)}</tbody></table></div>', '지름/할인정보')
+
+
+def quasarzone_detail(p):
+    return _page(f'<div class="view-title"><h1>{_e(p["product"])}</h1><div class="util-area">'
+                 f'<span class="count">조회 123</span><span class="date">{p["time"].strftime("%Y.%m.%d %H:%M")}</span>'
+                 f'</div></div><div class="view-content">{"<p>본문</p>" * 30}</div>', p['product'])
+
+
+def eomisae_list(rng, posts, board):
+    cards = []
+    for p in posts:
+        href = f'{board}/{p["no"]}'
+        cards.append(
+            f'<div class="card_el n_ntc clear"><div class="tmb_wrp"><a href="{href}">'
+            f'<img class="tmb" src="https://eomisae.co.kr/files/sample/{p["no"]}.jpg"></a></div>'
+            f'<div class="card_content"><h3><a class="pjax" href="{href}">{_e(p["product"])} {_e(p["price_text"])}</a></h3>'
+            f'<div class="infos"><span class="fl">익명</span><span class="fr"><i class="fa fa-comment"></i> {p["reply"]}</span>'
+            f'<span class="fr"><i class="fa fa-heart"></i> {p["like"]}</span></div></div></div>'
+        )
+    notice = '<div class="card_el ntc clear"><div class="card_content"><h3><a class="pjax" href="/notice">공지</a></h3></div></div>'
+    return _page(f'<div class="card_wrap">{notice}{"".join(cards)}</div>', '어미새')
+
+
+def eomisae_detail(p):
+    return _page(f'<div class="rd_hd"><h1>{_e(p["product"])}</h1><div class="btm_area">'
+                 f'<span class="fa fa-user"></span><span>익명</span>'
+                 f'<span class="fa fa-clock-o"></span><span>{p["time"].strftime("%Y.%m.%d %H:%M")}</span>'
+                 f'</div></div><div class="rd_body">{"<p>본문</p>" * 30}</div>', p['product'])
+
+
+def ruliweb_list(rng, posts):
+    rows = ['<tr class="table_body notice"><td class="subject"><a class="subject_link deco" href="/notice">공지</a></td></tr>']
+    for p in posts:
+        rows.append(
+            f'<tr class="table_body blocktarget"><td class="id">{p["no"]}</td>'
+            f'<td class="divsn text_over"><a href="/market/board/1020?cate={p["no"] % 7}">{_e(p["category"])}</a></td>'
+            f'<td class="subject"><div class="relative"><span class="subject_tag">[{_e(p["store"])}]</span>'
+            f'<a class="subject_link deco" href="https://bbs.ruliweb.com/market/board/1020/read/{p["no"]}">'
+            f'[{_e(p["store"])}] {_e(p["product"])} {_e(p["price_text"])}</a>'
+            f'<span class="num_reply">({p["reply"]})</span></div></td>'
+            f'<td class="writer text_over">익명</td><td class="recomd">{p["like"]}</td>'
+            f'<td class="hit">{rng.randint(100, 9000)}</td><td class="time">{p["time"].strftime("%H:%M")}</td></tr>'
+        )
+    return _page(f'<table class="board_list_table"><tbody>{"".join(rows)}</tbody></table>', '핫딜/예판 유저')
+
+
+def fmkorea_list(rng, posts):
+    items = []
+    for p in posts:
+        href = f'/{p["no"]}'
+        items.append(
+            f'<li class="li li_best2_hotdeal0"><div class="li"><a class="thumb_wrp" href="{href}">'
+            f'<img class="thumb" src="//image.fmkorea.com/sample/{p["no"]}.jpg"></a>'
+            f'<h3 class="title"><a class="hotdeal_var8" href="{href}"><span class="ellipsis-target">{_e(p["product"])}</span>'
+            f' <span class="comment_count">[{p["reply"]}]</span></a></h3>'
+            f'<div class="hotdeal_info"><span>쇼핑몰: <a class="strong">{_e(p["store"])}</a></span> / '
+            f'<span>가격: <a class="strong">{p["price"]:,}원</a></span> / '
+            f'<span>배송: <a class="strong">{_e(p["shipping"])}</a></span></div>'
+            f'<div><span class="category"><a>{_e(p["category"])}</a></span> <span class="author">/ 익명</span>'
+            f'<span class="regdate">{p["time"].strftime("%H:%M")}</span></div>'
+            f'<span class="count">{p["like"]}</span></div></li>'
+        )
+    return _page(f'<div class="fm_best_widget _bd_pc"><ul>{"".join(items)}</ul></div>', '핫딜')
+
+
+def arcalive_list(rng, posts):
+    rows = []
+    for p in posts:
+        href = f'/b/hotdeal/{p["no"]}'
+        utc = p['time'].astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        rows.append(
+            f'<div class="vrow hybrid"><div class="vrow-inner"><div class="vrow-top deal">'
+            f'<span class="vcol col-title"><a class="badge" href="/b/hotdeal?category={p["no"] % 7}">{_e(p["category"])}</a>'
+            f'<a class="title hybrid-title" href="{href}">{_e(p["product"])} <span class="info">[{p["reply"]}]</span></a></span></div>'
+            f'<div class="vrow-bottom deal"><span class="deal-store">{_e(p["store"])}</span>'
+            f'<span class="deal-price">{p["price"]:,}원</span><span class="deal-delivery">{_e(p["shipping"])}</span>'
+            f'<span class="vcol col-time"><time datetime="{utc}">{p["time"].strftime("%H:%M")}</time></span>'
+            f'<span class="vcol col-rate">{p["like"]}</span></div></div>'
+            f'<a class="title preview-image" href="{href}"><div class="vrow-preview">'
+            f'<img src="//ac-p.namu.la/sample/{p["no"]}.jpg"></div></a></div>'
+        )
+    return _page(f'<div class="list-table hybrid">{"".join(rows)}</div>', '핫딜 채널')
+
+
+# 사이트 → (게시판 URL, 페이지당 게시글 수, 목록 생성, 상세 생성)
+SITES = {
+    'ppomppu': (['https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu'], 20, ppomppu_list, None),
+    'quasarzone': (['https://quasarzone.com/bbs/qb_saleinfo'], 30, quasarzone_list, quasarzone_detail),
+    'eomisae': (['https://eomisae.co.kr/os', 'https://eomisae.co.kr/rt'], 20, eomisae_list, eomisae_detail),
+    'ruliweb': (['https://bbs.ruliweb.com/market/board/1020'], 28, ruliweb_list, None),
+    'fmkorea': (['https://www.fmkorea.com/hotdeal'], 20, fmkorea_list, None),
+    'arcalive': (['https://arca.live/b/hotdeal'], 45, arcalive_list, None),
+}
+
+
+def build_site(name, pages, details):
+    boards, per_page, build_list, build_detail = SITES[name]
+    rng = random.Random(name)  # 사이트별 고정 시드 (다시 생성해도 같은 픽스처)
+    entries = load_manifest(name)
+    detail_posts = []
+
+    for board_index, board in enumerate(boards):
+        start_no, posted = 900000 - board_index * 100000, BASE_TIME
+        for page_num in range(1, pages + 1):
+            posts, posted = _posts(rng, per_page, start_no, posted)
+            start_no -= per_page
+            page_html = build_list(rng, posts, board) if name == 'eomisae' else build_list(rng, posts)
+            save_fixture(name, entries, f"list_b{board_index}_p{page_num}.html.gz", page_html,
+                         kind='list', url=f"{board}?page={page_num}", board=board,
+                         captured_at=CAPTURED_AT, sample=True)
+            detail_posts.extend(posts)
+
+    if build_detail:
+        for index, post in enumerate(detail_posts[:details]):
+            save_fixture(name, entries, f"detail_{index}.html.gz", build_detail(post),
+                         kind='detail', url=f"{boards[0]}/{post['no']}", captured_at=CAPTURED_AT, sample=True)
+
+    save_manifest(name, entries)
+    print(f"[{name}] 예시 픽스처: 목록 {len(boards) * pages}페이지, 상세 {min(details, len(detail_posts)) if build_detail else 0}페이지")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='사이트별 예시 픽스처 생성')
+    parser.add_argument('--sites', default='all')
+    parser.add_argument('--pages', type=int, default=3, help='게시판별 목록 페이지 수')
+    parser.add_argument('--details', type=int, default=10, help='사이트별 상세 페이지 수 (상세 시간 선택자가 있는 사이트)')
+    args = parser.parse_args(argv)
+
+    for name in resolve_sites(args.sites):
+        build_site(name, args.pages, args.details)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+실제 사이트에서 목록/상세 페이지를 받아 오프라인 픽스처로 저장
+
+사용법:
+    python functions/benchmarks/capture_fixtures.py --sites all --pages 3 --details 5
+    python functions/benchmarks/capture_fixtures.py --sites quasarzone,eomisae --details 10
+
+- 스크래퍼와 같은 PageFetcher(HTTP 우선, Chrome 폴백) 사용
+- 목록 페이지는 게시판별 1~N페이지, 상세 페이지는 상세 시간 선택자가 있는 사이트만 저장
+- 저장 전 스크립트 / 스타일 / iframe / 주석 제거 (fixtures.sanitize_html)
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+functions_dir = os.path.dirname(current_dir)
+project_root = os.path.dirname(functions_dir)
+sys.path.insert(0, project_root)    # common, crawler 접근 가능
+
+from crawler.sites import resolve_sites, load_scraper_class
+from common.fetcher import PageFetcher
+from fixtures import load_manifest, save_manifest, save_fixture, sanitize_html
+
+
+def board_urls(scraper):
+    return list(getattr(scraper, 'urls', None) or [scraper.url])
+
+
+def page_url(scraper, page_num, board_url):
+    if hasattr(scraper, 'urls'):
+        return scraper._page_url(page_num, board_url)
+    return scraper._page_url(page_num)
+
+
+def capture_site(name, pages, details):
+    scraper = load_scraper_class(name)()
+    fetcher = PageFetcher(scraper.source_site, mode=scraper.fetch_mode,
+                          resource_allowlist=getattr(scraper, 'resource_allowlist', None))
+    entries = load_manifest(name)
+    captured_at = datetime.now().isoformat(timespec='seconds')
+    detail_urls = []
+
+    try:
+        for board_index, board_url in enumerate(board_urls(scraper)):
+            for page_num in range(1, pages + 1):
+                url = page_url(scraper, page_num, board_url)
+                soup = fetcher.fetch_soup(url, scraper.list_selector, wait_timeout=30)
+                rows = soup.select(scraper.row_selector)
+                print(f"[{name}] {url}: 게시글 {len(rows)}개")
+
+                save_fixture(name, entries, f"list_b{board_index}_p{page_num}.html.gz",
+                             sanitize_html(fetcher.last_html or str(soup)),
+                             kind='list', url=url, board=board_url, captured_at=captured_at)
+
+                if hasattr(scraper, 'detail_time_selector'):
+                    for row in rows:
+                        try:
+                            detail_urls.append(scraper._product_url(row))
+                        except Exception:
+                            continue
+
+        if detail_urls and details:
+            soups = fetcher.fetch_many_soups(detail_urls[:details], scraper.detail_time_selector, wait_timeout=30)
+            for index, (url, soup) in enumerate(soups.items()):
+                if soup is None:
+                    continue
+                save_fixture(name, entries, f"detail_{index}.html.gz", sanitize_html(str(soup)),
+                             kind='detail', url=url, captured_at=captured_at)
+            print(f"[{name}] 상세 페이지 {sum(1 for s in soups.values() if s is not None)}개 저장")
+
+    finally:
+        fetcher.close()
+        save_manifest(name, entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='오프라인 HTML 픽스처 수집')
+    parser.add_argument('--sites', default='all')
+    parser.add_argument('--pages', type=int, default=3, help='게시판별 목록 페이지 수')
+    parser.add_argument('--details', type=int, default=5, help='사이트별 상세 페이지 수')
+    args = parser.parse_args(argv)
+
+    for name in resolve_sites(args.sites):
+        try:
+            capture_site(name, args.pages, args.details)
+        except Exception as e:
+            print(f"[{name}] 수집 실패: {e}")
+
+
+if __name__ == "__main__":
+    main()
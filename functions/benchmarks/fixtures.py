@@ -0,0 +1,76 @@
+"""
+오프라인 HTML 픽스처 저장/로드
+
+구조:
+    functions/benchmarks/fixtures/<site>/manifest.json
+    functions/benchmarks/fixtures/<site>/list_<board>_p<page>.html.gz
+    functions/benchmarks/fixtures/<site>/detail_<n>.html.gz
+
+manifest.json:
+    [{"file": "...", "kind": "list" | "detail", "url": "...", "board": "...", "captured_at": "...", "sample": true}]
+    (sample: build_sample_fixtures.py 로 만든 예시 페이지)
+
+저장소에는 예시 픽스처와 그 기준치(baseline.json)를 올림. 실제 페이지를 수집하면 sanitize_html 로
+스크립트 / 스타일 / iframe / 주석(광고, 추적 코드, 세션 값)을 지운 뒤 저장
+"""
+import gzip
+import json
+import os
+
+from bs4 import BeautifulSoup, Comment
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def site_dir(site):
+    return os.path.join(FIXTURE_DIR, site)
+
+
+def load_manifest(site):
+    path = os.path.join(site_dir(site), 'manifest.json')
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(site, entries):
+    os.makedirs(site_dir(site), exist_ok=True)
+    with open(os.path.join(site_dir(site), 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False, indent=2)
+
+
+def save_fixture(site, entries, filename, html, **meta):
+    """HTML을 gzip으로 저장하고 manifest 항목 추가 (같은 파일명은 교체)"""
+    os.makedirs(site_dir(site), exist_ok=True)
+    # mtime=0: 내용이 같으면 같은 파일 (저장소에 올린 픽스처를 다시 생성해도 diff 없음)
+    with open(os.path.join(site_dir(site), filename), 'wb') as raw, \
+            gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as f:
+        f.write(html.encode('utf-8'))
+
+    entries[:] = [entry for entry in entries if entry['file'] != filename]
+    entries.append({'file': filename, **meta})
+
+
+def sanitize_html(html):
+    """파서와 무관한 스크립트 / 스타일 / iframe / 주석 제거"""
+    soup = BeautifulSoup(html, 'lxml')
+    for element in soup(['script', 'style', 'noscript', 'iframe']):
+        element.decompose()
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    return str(soup)
+
+
+def load_fixtures(site, kind=None):
+    """
+    Returns:
+        list: manifest 항목 + 'html' (압축 해제한 문자열)
+    """
+    fixtures = []
+    for entry in load_manifest(site):
+        if kind and entry.get('kind') != kind:
+            continue
+        with gzip.open(os.path.join(site_dir(site), entry['file']), 'rt', encoding='utf-8') as f:
+            fixtures.append({**entry, 'html': f.read()})
+    return fixtures
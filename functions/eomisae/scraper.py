@@ -4,30 +4,24 @@ EOMISAE 크롤러
 URL: https://eomisae.co.kr/
 """
 import datetime
-import time
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
 from common.number_extractor import (
-    extract_price_from_text,
-    extract_shipping_fee,
-    format_price,
     extract_number_from_text
 )
-from bs4 import BeautifulSoup
+from common.price_parser import parse_title
 import sys
 import os
 import re
 
-from webdriver_manager.core.os_manager import ChromeType
-
+from common.watermark import BoardWatermark
+from common.deal_item import DealItem, format_kst
+from common.pagination_utils import cut_page
+from common.time_parser import TimeParser
+from common.metrics import timed, incr
+from common.fetcher import PageFetcher, FETCH_MODE_HTTP
+from common.pipeline import ShutdownRequested, shutdown_requested
+from common.detail_cache import DetailTimeCache
 from common.log_util import log_item
-from common.filter_by_regtime import filter_by_time, parse_time, to_iso8601
 from common.store_extractor import extract_store
 
 # common 모듈
@@ -44,24 +38,45 @@ class EomisaeScraper:
         self.main_url = 'https://eomisae.co.kr/'
         self.source_site = 'EOMISAE'
         self.max_pages = 3
+        self.planned_pages = 1  # 시작 시 미리 받을 페이지 수 (crawler.run 이 게시판 등록 속도로 결정, common.crawl_rate)
         self.test_mode = False
 
+        # 페이지 수집 방식 (서버 렌더링 게시판 → HTTP 우선, 실패 시 Chrome)
+        self.fetch_mode = FETCH_MODE_HTTP
+        self.list_selector = 'div.card_wrap'
+        self.row_selector = 'div.card_el.n_ntc.clear'
+        self.resource_allowlist = []  # Chrome 리소스 차단 예외 패턴 (common.resource_blocker)
+        self.watermarks = []  # 게시판별 최고 게시글 번호 (API 전송 성공 후 commit_watermarks 호출)
+        self.detail_time_selector = 'span.fa.fa-clock-o + span'
+        self.detail_workers = 6  # 상세 페이지 동시 요청 수
+        self.detail_cache = None  # 상세 페이지 등록 시간 캐시 (실행마다 열고 닫음)
+
         # 환경 변수에서 필터링 시간 읽기 (기본값 30분)
         self.filter_minutes = int(os.environ.get('FILTER_MINUTES', 30))
+        self.time_parser = TimeParser()  # 실행 시작 시 기준 시각으로 다시 생성
 
-    def scrape(self):
-
+    def scrape(self, on_page=None):
+        """게시판별 페이징 크롤링 (30분 필터링), on_page: 페이지별 필터링 결과 콜백"""
         all_items = []
 
         # 각 게시판 크롤링
         for url in self.urls:
             print(f"게시판 크롤링: {url}")
-            items = self._scrape_with_pagination(url)
+            items = self._scrape_with_pagination(url, on_page)
             all_items.extend(items)
+            if shutdown_requested():
+                print("종료 요청 → 남은 게시판 건너뜀")
+                break
 
         return all_items
 
-    def _scrape_with_pagination(self, url):
+    def commit_watermarks(self):
+        """API 전송 성공 후 호출: 이번 실행에서 전송한 최고 게시글 번호 저장"""
+        for watermark in self.watermarks:
+            watermark.commit()
+        self.watermarks = []
+
+    def _scrape_with_pagination(self, url, on_page=None):
         """
         - 페이지의 마지막 게시글이 30분 이내면 다음 페이지 계속 확인
         - 마지막 게시글이 30분 초과하거나 최대 페이지 도달 시 중단
@@ -69,77 +84,90 @@ class EomisaeScraper:
 
         all_items = []
         page_num = 1
-        driver = None
+        fetcher = None
 
         kst = datetime.timezone(datetime.timedelta(hours=9))
         filter_minutes = self.filter_minutes
         now = datetime.datetime.now(kst)
         cutoff_time = now - datetime.timedelta(minutes=filter_minutes)
+        cutoff_ts = cutoff_time.timestamp()
+        self.time_parser = TimeParser(now)  # 게시글 시간 해석 기준 시각 (실행 단위 고정)
 
         try:
-            driver = self._create_driver()
-            print(f"Chrome 브라우저 시작 : {url}")
+            fetcher = PageFetcher(self.source_site, mode=self.fetch_mode,
+                                  resource_allowlist=self.resource_allowlist)
+            watermark = BoardWatermark(self.source_site, url)
+            self.watermarks.append(watermark)
+            self.detail_cache = self._open_detail_cache()
+            print(f"크롤링 시작 ({self.fetch_mode}) : {url}")
+
+            # 여러 페이지가 필요할 것으로 예상되면 2페이지부터 한 번에 동시 요청 (예상 페이지는 게시판 수로 나눔)
+            planned = -(-self.planned_pages // len(self.urls))
+            fetcher.prefetch_pages([self._page_url(n, url) for n in range(2, min(planned, self.max_pages) + 1)])
 
             while page_num <= self.max_pages:
                 print(f"\n{page_num}페이지 크롤링...")
 
-                # 같은 driver 재사용
-                page_items = self._scrape_page(driver, page_num, url)
+                # 같은 fetcher(Session / driver) 재사용
+                page_items = self._scrape_page(fetcher, page_num, url, watermark)
 
                 if not page_items:
                     print(f"{page_num}페이지: 게시글 없음, 종료")
                     break
 
+                # 페이지당 게시글 수 (다음 실행 페이지 예산 계산, common.crawl_rate)
+                incr('list_pages')
+                incr('list_rows', len(page_items))
+
+                # 지난 실행에서 전송한 게시글(최고 게시글 번호 이하) 제외
+                page_items, reached_seen = watermark.split_new(page_items)
+
                 # 30분 이내 작성된 게시글 필터링
-                page_filtered = filter_by_time(page_items, minutes=filter_minutes)
+                page_cut = cut_page(page_items, cutoff_ts)
+                page_filtered = page_cut.kept
                 if page_filtered:
                     print(f" 수집 대상 {len(page_filtered)}개:")
                     for filtered_item in page_filtered:
                         log_item(filtered_item)
 
                 all_items.extend(page_filtered)
+                watermark.observe(page_filtered)  # 종료 요청으로 on_page 에서 중단돼도 이 페이지까지 반영
+                if on_page:
+                    on_page(page_filtered)  # 페이지 단위 전송 (common.pipeline)
                 print(f"{page_num}페이지: {len(page_items)}개 → 필터링 {len(page_filtered)}개")
 
-                # 다음 페이지 확인 여부 판단
-                last_item = page_items[-1]
-                crawled_at_str = last_item.get('crawledAt', '')
-
-                last_time = None
-                if crawled_at_str:
-                    try:
-                        # 'yyyy-MM-dd HH:mm:ss' 형식이면 직접 파싱
-                        if len(crawled_at_str) == 19 and crawled_at_str[10] == ' ':
-                            last_time = datetime.datetime.strptime(crawled_at_str, '%Y-%m-%d %H:%M:%S')
-                            last_time = last_time.replace(tzinfo=kst)
-                        else:
-                            # parse_time으로 파싱 (상대 시간 등)
-                            last_time = parse_time(crawled_at_str)
-                    except Exception as e:
-                        print(f"시간 파싱 중 오류: {e}")
-                        last_time = None
-
-                if not last_time:
-                    print(f"시간 파싱 실패, 크롤링 종료")
-                    break  # ✅ continue 대신 break로 종료
-
-                if last_time < cutoff_time:
-                    print(f"마지막 게시글 {filter_minutes}분 초과 ({last_time.strftime('%H:%M:%S')}), 종료")
+                if reached_seen:
+                    print(f"지난 실행에서 전송한 게시글 도달 (제외 {watermark.skipped}개), 종료")
+                    break
+
+                # 다음 페이지 확인 여부 판단 (시간 정보가 있는 마지막 게시글 기준, common.pagination_utils)
+                if page_cut.last_ts is None:
+                    print(f"페이지에 시간 정보가 있는 게시글이 없어 크롤링을 종료합니다.")
                     break
 
-                print(f"마지막 게시글 {filter_minutes}분 이내 ({last_time.strftime('%H:%M:%S')}), 다음 페이지 확인")
+                if page_cut.stop:
+                    print(f"마지막 게시글 {filter_minutes}분 초과 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 종료")
+                    break
+
+                print(f"마지막 게시글 {filter_minutes}분 이내 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 다음 페이지 확인")
 
                 # 페이지 간 메모리 정리
-                driver.execute_script("window.stop();")
-                driver.delete_all_cookies()
+                fetcher.reset_page_state()
 
                 page_num += 1
 
             if page_num > self.max_pages:
+                incr('page_limit_reached')  # 수집 기간을 다 확인하지 못함 (common.crawl_rate 관측 구간 보정)
                 print(f"\n최대 페이지({self.max_pages}) 도달, 크롤링 종료")
 
             print(f"\n총 {len(all_items)}개 수집\n")
             return all_items
 
+        except ShutdownRequested as e:
+            # 실패가 아닌 종료 요청 (common.pipeline): 큐에 넣은 페이지까지의 게시글 반환
+            print(f"{e} (수집 {len(all_items)}개)")
+            return all_items
+
         except Exception as e:
             print(f"❌ 크롤링 실패: {e}")
             import traceback
@@ -147,90 +175,35 @@ class EomisaeScraper:
             return all_items            # 수집된 데이터라도 반환
 
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                    print("Chrome 브라우저 정상 종료")
-                except Exception as e:
-                    print(f"Chrome 종료 중 에러: {e}")
-
-    def _create_driver(self):
-        options = Options()
-
-        # User-Agent 설정 (공통)
-        options.add_argument(
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-
-        # 기본 옵션 (공통)
-        options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--referer=https://www.google.com/')
-
-        # 자동화 감지 우회
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            # 환경 자동 감지
-            import platform
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                print("(로컬 Windows 환경 감지 - WebDriverManager 자동 설치)")
-                # 로컬: WebDriverManager 사용
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            else:
-                print("(Linux 컨테이너 환경 감지 - Fargate 경로 사용)")
-                # Fargate: 고정 경로
-                service = Service('/usr/local/bin/chromedriver')
-            
-            driver = webdriver.Chrome(service=service, options=options)
-            print("Chrome 드라이버 생성 성공!")
-
-            # WebDriver 속성 숨기기
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            driver.set_page_load_timeout(60)
-            return driver
-            
-        except Exception as e:
-            print(f"❌ Chrome 드라이버 생성 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
-
-    def _scrape_page(self, driver, page_num, targetUrl):
+            if fetcher:
+                print(f"페이지 수집 통계: {fetcher.stats}")
+                fetcher.close()
+            if self.detail_cache:
+                print(f"상세 시간 캐시 통계: {self.detail_cache.stats()}")
+                self.detail_cache.close()
+                self.detail_cache = None
+
+    def _page_url(self, page_num, board_url):
+        """목록 페이지 URL"""
+        if page_num == 1:
+            return board_url
+        if 'os' in board_url:   # 패션
+            return f"https://eomisae.co.kr/index.php?mid=os&page={page_num}"
+        return f"https://eomisae.co.kr/index.php?mid=rt&page={page_num}"
+
+    def _scrape_page(self, fetcher, page_num, targetUrl, watermark=None):
         """특정 페이지 크롤링"""
         items = []
-        html = None
 
         try:
             # 페이지 URL
-            if page_num == 1:
-                url = targetUrl
-            else:
-                if 'os' in targetUrl:   # 패션
-                    url = f"https://eomisae.co.kr/index.php?mid=os&page={page_num}"
-                else:
-                    url = f"https://eomisae.co.kr/index.php?mid=rt&page={page_num}"
-
-            driver.get(url)
-
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.card_wrap"))
-                )
-                print("게시글 로드 확인")
-            except Exception as e:
-                # 타임아웃 되어도 계속 진행 (부분 데이터라도 수집)
-                print(f"⚠️ 명시적 대기 타임아웃 (계속 진행): {e}")
-
-
-            # HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            url = self._page_url(page_num, targetUrl)
+
+            # HTML 수집 + 파싱 (HTTP 우선, 목록이 없으면 Chrome)
+            # (다음 페이지는 응답 도착 후 미리 받기, 마지노선에서 중단하면 폐기)
+            next_url = self._page_url(page_num + 1, targetUrl) if page_num < self.max_pages else None
+            soup = fetcher.fetch_soup(url, self.list_selector, wait_timeout=15, prefetch_url=next_url,
+                                      row_selector=self.row_selector)
 
             # HTML 저장 (디버깅용)
             # with open(f'debug_{self.source_site}_page{page_num}.html', 'w', encoding='utf-8') as f:
@@ -238,7 +211,7 @@ class EomisaeScraper:
             #print(f"  [DEBUG] HTML 저장: debug_{self.source_site}_page{page_num}.html")
 
             # 게시글 목록
-            cards = soup.select('div.card_el.n_ntc.clear')
+            cards = soup.select(self.row_selector)
             print(f"게시글 {len(cards)}개 발견")
 
             # 다른 선택자들도 시도
@@ -247,6 +220,7 @@ class EomisaeScraper:
                 alternative_rows = soup.select('div._bd.cf.clear')
                 print(f"  [DEBUG] 대체 선택자: {len(alternative_rows)}개")
 
+            targets = []
             for card in cards:
                 try:
                     # 필터링
@@ -262,8 +236,25 @@ class EomisaeScraper:
                         print(f"[어미새] 레벨 미달 제외: {title[:40]}...")
                         continue
 
+                    targets.append(card)
+
+                except Exception as e:
+                    print(f"게시글 파싱 실패: {e}")
+                    continue
+
+            # 상세 페이지 등록 시간 일괄 수집 (카드마다 순차 이동하지 않음)
+            # 이미 전송한 게시글은 어차피 제외되므로 상세 페이지를 받지 않음
+            # (목록에 시간 표시가 없어 기간 필터는 상세 시간으로만 가능, 캐시에 있는 게시글은 로드하지 않음)
+            unseen = [card for card in targets if not (watermark and watermark.is_seen(self._product_url(card)))]
+            if len(unseen) < len(targets):
+                incr('detail_skipped', len(targets) - len(unseen))
+                print(f"상세 페이지 생략: 이미 전송한 게시글 {len(targets) - len(unseen)}개")
+            detail_times = self._fetch_detail_times(fetcher, unseen)
+
+            for card in targets:
+                try:
                     # 데이터 추출
-                    item = self._extract_item(card, driver, url)
+                    item = self._extract_item(card, detail_times, url)
                     if item:
                         items.append(item)
 
@@ -277,12 +268,63 @@ class EomisaeScraper:
             traceback.print_exc()
 
         finally:
-            html = None
             soup = None
 
         return items
 
-    def _extract_item(self, card, driver, url):
+    def _open_detail_cache(self):
+        """상세 시간 캐시 열기 (실패해도 캐시 없이 크롤링 진행)"""
+        try:
+            return DetailTimeCache(self.source_site)
+        except Exception as e:
+            print(f"상세 시간 캐시 사용 불가 (캐시 없이 진행): {e}")
+            return None
+
+    def _product_url(self, card):
+        title_element = card.select_one('a.pjax')
+        return title_element.get('href') if title_element else None
+
+    @timed('detail_times')
+    def _fetch_detail_times(self, fetcher, cards):
+        """
+        페이지의 상세 페이지를 동시에 받아 등록 시간 추출
+
+        캐시에 있는 게시글은 상세 페이지를 로드하지 않는다.
+        상대 시간("N분 전")은 'yyyy-MM-dd HH:mm:ss' 절대 시각으로 변환해 저장한다.
+
+        Returns:
+            dict: {상세 URL: 시간 문자열}
+        """
+        urls = [url for url in map(self._product_url, cards) if url]
+
+        detail_times = self.detail_cache.get_many(urls) if self.detail_cache else {}
+        missing = [url for url in urls if url not in detail_times]
+
+        detail_soups = fetcher.fetch_many_soups(
+            missing, self.detail_time_selector, max_workers=self.detail_workers, wait_timeout=10
+        )
+
+        time_texts = {}
+        for url, detail_soup in detail_soups.items():
+            if detail_soup is None:
+                continue
+            time_element = detail_soup.select_one(self.detail_time_selector)
+            if time_element:
+                time_texts[url] = time_element.get_text(strip=True)
+
+        # 페이지 단위 일괄 변환
+        created = self.time_parser.parse_many(list(time_texts.values()))
+        fetched = {url: format_kst(ts) for url, ts in zip(time_texts, created) if ts is not None}
+
+        if self.detail_cache:
+            self.detail_cache.put_many(fetched)
+        detail_times.update(fetched)
+
+        print(f"상세 페이지 시간 수집: {len(detail_times)}/{len(urls)}개 (캐시 {len(urls) - len(missing)}개, 로드 {len(missing)}개)")
+        return detail_times
+
+    @timed('extract')
+    def _extract_item(self, card, detail_times, url):
         """
         세일정보 추출
         """
@@ -290,11 +332,10 @@ class EomisaeScraper:
         title_element = card.select_one('a.pjax')
         title = title_element.get_text(strip=True) if title_element else None
 
-        # 가격
-        price = extract_price_from_text(title)
-
-        # 배송비
-        shipping_fee = extract_shipping_fee(title)
+        # 가격 / 배송비
+        price_info = parse_title(title)
+        price = price_info.price
+        shipping_fee = price_info.shipping_fee
 
         # 판매처: 제목 첫 단어
         # ex) "금강제화 더비" → "금강제화"
@@ -316,20 +357,10 @@ class EomisaeScraper:
         if not product_url:
             return None
 
-        # 상세 페이지 접속 후 시간 get
-        try:
-            driver.get(product_url)
-            time_element_selector = 'span.fa.fa-clock-o + span'
-            wait = WebDriverWait(driver, 10)  # 상세 페이지 로딩을 위한 대기
-            time_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, time_element_selector)))
-
-            time_text = time_element.text
-            time_obj = parse_time(time_text)
-            time = to_iso8601(time_obj)
-
-        except Exception as e:
-            print(f"  상세 페이지 시간 추출 실패: {product_url}, 에러: {e}")
-            time = None  # 시간 추출 실패 시 None으로 처리
+        # 상세 페이지에서 수집한 시간 ('YYYY-MM-DD HH:MM:SS', DealItem 에서 epoch 로 변환)
+        post_time = detail_times.get(product_url)
+        if not post_time:
+            print(f"  상세 페이지 시간 추출 실패: {product_url}")
 
         # 카테고리
         category = None
@@ -340,16 +371,16 @@ class EomisaeScraper:
         img_element = card.select_one('div.tmb_wrp img.tmb')
         image_url = img_element['src'] if img_element else None
 
-        return {
-            'title': title,
-            'price': price,
-            'storeName': store,
-            'category': category,
-            'shippingFee': shipping_fee,
-            'productUrl': product_url,
-            'imageUrl': image_url,
-            'replyCount': reply_count,
-            'likeCount': like_count,
-            'sourceSite': self.source_site,
-            'createdAt': time
-        }
+        return DealItem(
+            title=title,
+            price=price,
+            store_name=store,
+            category=category,
+            shipping_fee=shipping_fee,
+            product_url=product_url,
+            image_url=image_url,
+            reply_count=reply_count,
+            like_count=like_count,
+            source_site=self.source_site,
+            created_at=post_time,
+        )
@@ -4,33 +4,32 @@ FMKOREA 크롤러
 URL: https://www.fmkorea.com/hotdeal
 """
 import datetime
-import random
 import re
 import sys
 import os
-import time
 import boto3  # [추가] S3 업로드를 위해 import
 
-
-from selenium import webdriver
 from selenium.common.exceptions import TimeoutException # [추가] TimeoutException import
-from selenium.webdriver import ActionChains
 
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-from webdriver_manager.core.os_manager import ChromeType
 
+from common.watermark import BoardWatermark
+from common.deal_item import DealItem, format_kst
+from common.pagination_utils import cut_page
+from common.time_parser import TimeParser
+from common.metrics import timed, incr
+from common.fetcher import PageFetcher, FETCH_MODE_BROWSER
+from common.pipeline import ShutdownRequested
+from common.navigation import NavigationPlanner
+from common.waits import click_and_wait, get_politeness
+from common.row_extractor import extract_fields
 from common.log_util import log_item
 
 # common 모듈
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'common'))
 from common.number_extractor import extract_number_from_text, extract_shipping_fee
-from common.filter_by_regtime import filter_by_time, parse_time, to_iso8601
 
 
 class FmkoreaScraper:
@@ -40,19 +39,51 @@ class FmkoreaScraper:
         self.main_url = 'https://www.fmkorea.com'
         self.source_site = 'FMKOREA'
         self.max_pages = 3
+        self.planned_pages = 1  # 시작 시 미리 받을 페이지 수 (crawler.run 이 게시판 등록 속도로 결정, common.crawl_rate)
         self.test_mode = False
 
+        # 페이지 수집 방식 (봇 차단 + 메뉴 이동이 필요해 Chrome 사용)
+        self.fetch_mode = FETCH_MODE_BROWSER
+        self.list_selector = 'div.fm_best_widget._bd_pc'
+        self.row_selector = 'div.fm_best_widget._bd_pc li.li_best2_hotdeal0'
+        self.resource_allowlist = ['*.css']  # Chrome 리소스 차단 예외 (메뉴 클릭 이동(ActionChains)이 CSS 레이아웃에 의존)
+
+        # 게시글 행 필드 명세 (common.row_extractor, Chrome에서는 페이지 안에서 JS로 한 번에 추출)
+        self.row_spec = {
+            'rows': self.row_selector,
+            'fields': {
+                'title': ('span.ellipsis-target', 'text'),
+                'price': ('div.hotdeal_info span:nth-of-type(2) a.strong', 'text'),
+                'shipping_fee': ('div.hotdeal_info span:nth-of-type(3) a.strong', 'text'),
+                'store': ('div.hotdeal_info span:nth-of-type(1) a.strong', 'text'),
+                'reply': ('span.comment_count', 'text'),
+                'like': ('span.count', 'text'),
+                'time_text': ('span.regdate', 'text'),
+                'href': ('div.li a.hotdeal_var8', 'href'),
+                'category': ('span.category a', 'text'),
+                'image': ('img.thumb', 'src'),
+            },
+        }
+        self.watermarks = []  # 게시판별 최고 게시글 번호 (API 전송 성공 후 commit_watermarks 호출)
+
         # 환경 변수에서 필터링 시간 읽기 (기본값 30분)
         self.filter_minutes = int(os.environ.get('FILTER_MINUTES', 30))
+        self.time_parser = TimeParser()  # 실행 시작 시 기준 시각으로 다시 생성
 
         # [추가] 디버깅 파일을 저장할 S3 버킷 이름 (환경 변수에서 가져오기)
         self.s3_bucket_name = os.environ.get('S3_BUCKET_NAME')
 
-    def scrape(self):
-        """페이징 크롤링 (30분 필터링)"""
-        return self._scrape_with_pagination()
+    def scrape(self, on_page=None):
+        """페이징 크롤링 (30분 필터링), on_page: 페이지별 필터링 결과 콜백"""
+        return self._scrape_with_pagination(on_page)
+
+    def commit_watermarks(self):
+        """API 전송 성공 후 호출: 이번 실행에서 전송한 최고 게시글 번호 저장"""
+        for watermark in self.watermarks:
+            watermark.commit()
+        self.watermarks = []
 
-    def _scrape_with_pagination(self):
+    def _scrape_with_pagination(self, on_page=None):
         """
         - 페이지의 마지막 게시글이 30분 이내면 다음 페이지 계속 확인
         - 마지막 게시글이 30분 초과하거나 최대 페이지 도달 시 중단
@@ -60,77 +91,86 @@ class FmkoreaScraper:
 
         all_items = []
         page_num = 1
-        driver = None
+        fetcher = None
 
         kst = datetime.timezone(datetime.timedelta(hours=9))
         filter_minutes = self.filter_minutes
         now = datetime.datetime.now(kst)
         cutoff_time = now - datetime.timedelta(minutes=filter_minutes)
+        cutoff_ts = cutoff_time.timestamp()
+        self.time_parser = TimeParser(now)  # 게시글 시간 해석 기준 시각 (실행 단위 고정)
 
         try:
-            driver = self._create_driver()
-            print(f"Chrome 브라우저 시작 : {self.url}")
+            fetcher = PageFetcher(self.source_site, mode=self.fetch_mode,
+                                  resource_allowlist=self.resource_allowlist)
+            self.navigator = NavigationPlanner(self.list_selector, warmup=self._warmup)
+            watermark = BoardWatermark(self.source_site, self.url)
+            self.watermarks.append(watermark)
+            print(f"크롤링 시작 ({self.fetch_mode}) : {self.url}")
 
             while page_num <= self.max_pages:
                 print(f"\n{page_num}페이지 크롤링...")
 
-                # 같은 driver 재사용
-                page_items = self._scrape_page(driver, page_num)
+                # 같은 fetcher(Session / driver) 재사용
+                page_items = self._scrape_page(fetcher, page_num)
 
                 if not page_items:
                     print(f"{page_num}페이지: 게시글 없음, 종료")
                     break
 
+                # 페이지당 게시글 수 (다음 실행 페이지 예산 계산, common.crawl_rate)
+                incr('list_pages')
+                incr('list_rows', len(page_items))
+
+                # 지난 실행에서 전송한 게시글(최고 게시글 번호 이하) 제외
+                page_items, reached_seen = watermark.split_new(page_items)
+
                 # 30분 이내 작성된 게시글 필터링
-                page_filtered = filter_by_time(page_items, minutes=filter_minutes)
+                page_cut = cut_page(page_items, cutoff_ts)
+                page_filtered = page_cut.kept
                 if page_filtered:
                     print(f"수집 대상 {len(page_filtered)}개:")
                     for filtered_item in page_filtered:
                         log_item(filtered_item)
 
                 all_items.extend(page_filtered)
+                watermark.observe(page_filtered)  # 종료 요청으로 on_page 에서 중단돼도 이 페이지까지 반영
+                if on_page:
+                    on_page(page_filtered)  # 페이지 단위 전송 (common.pipeline)
                 print(f"{page_num}페이지: {len(page_items)}개 → 필터링 {len(page_filtered)}개")
 
-                # 다음 페이지 확인 여부 판단
-                last_item = page_items[-1]
-                crawled_at_str = last_item.get('createdAt', '')
-
-                last_time = None
-                if crawled_at_str:
-                    try:
-                        # 'yyyy-MM-dd HH:mm:ss' 형식이면 직접 파싱
-                        if len(crawled_at_str) == 19 and crawled_at_str[10] == ' ':
-                            last_time = datetime.datetime.strptime(crawled_at_str, '%Y-%m-%d %H:%M:%S')
-                            last_time = last_time.replace(tzinfo=kst)
-                        else:
-                            # parse_time으로 파싱 (상대 시간 등)
-                            last_time = parse_time(crawled_at_str)
-                    except Exception as e:
-                        print(f"시간 파싱 중 오류: {e}")
-                        last_time = None
-
-                if not last_time:
-                    print(f"시간 파싱 실패, 크롤링 종료")
-                    break  # ✅ continue 대신 break로 종료
-
-                if last_time < cutoff_time:
-                    print(f"마지막 게시글 {filter_minutes}분 초과 ({last_time.strftime('%H:%M:%S')}), 종료")
+                if reached_seen:
+                    print(f"지난 실행에서 전송한 게시글 도달 (제외 {watermark.skipped}개), 종료")
+                    break
+
+                # 다음 페이지 확인 여부 판단 (시간 정보가 있는 마지막 게시글 기준, common.pagination_utils)
+                if page_cut.last_ts is None:
+                    print(f"페이지에 시간 정보가 있는 게시글이 없어 크롤링을 종료합니다.")
+                    break
+
+                if page_cut.stop:
+                    print(f"마지막 게시글 {filter_minutes}분 초과 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 종료")
                     break
 
-                print(f"마지막 게시글 {filter_minutes}분 이내 ({last_time.strftime('%H:%M:%S')}), 다음 페이지 확인")
+                print(f"마지막 게시글 {filter_minutes}분 이내 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 다음 페이지 확인")
 
-                # 페이지 간 메모리 정리
-                driver.execute_script("window.stop();")
-                driver.delete_all_cookies()
+                # 페이지 간 메모리 정리 (쿠키는 유지: 워밍업 / 봇 확인 통과 상태 재사용)
+                fetcher.reset_page_state()
 
                 page_num += 1
 
             if page_num > self.max_pages:
+                incr('page_limit_reached')  # 수집 기간을 다 확인하지 못함 (common.crawl_rate 관측 구간 보정)
                 print(f"\n최대 페이지({self.max_pages}) 도달, 크롤링 종료")
 
             print(f"\n총 {len(all_items)}개 수집\n")
             return all_items
 
+        except ShutdownRequested as e:
+            # 실패가 아닌 종료 요청 (common.pipeline): 큐에 넣은 페이지까지의 게시글 반환
+            print(f"{e} (수집 {len(all_items)}개)")
+            return all_items
+
         except Exception as e:
             print(f"크롤링 실패: {e}")
             import traceback
@@ -138,148 +178,70 @@ class FmkoreaScraper:
             return all_items        # 수집된 데이터라도 반환
 
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                    print("Chrome 브라우저 정상 종료")
-                except Exception as e:
-                    print(f"Chrome 종료 중 에러: {e}")
-
-    def _create_driver(self):
-        options = Options()
-
-        # User-Agent 설정 (공통)
-        options.add_argument(
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            if fetcher:
+                print(f"페이지 수집 통계: {fetcher.stats}")
+                if fetcher.has_driver:
+                    print(f"Chrome {self.navigator.summary()}")
+                fetcher.close()
 
-        # 기본 옵션 (공통)
-        options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--referer=https://www.google.com/')
-
-        # 자동화 감지 우회
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            # 환경 자동 감지
-            import platform
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                print("(로컬 Windows 환경 감지 - WebDriverManager 자동 설치)")
-                # 로컬: WebDriverManager 사용
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            else:
-                print("(Linux 컨테이너 환경 감지 - Fargate 경로 사용)")
-                # Fargate: 고정 경로
-                service = Service('/usr/local/bin/chromedriver')
-            
-            driver = webdriver.Chrome(service=service, options=options)
-            print("Chrome 드라이버 생성 성공!")
-
-            # WebDriver 속성 숨기기
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            driver.set_page_load_timeout(60)
-            return driver
-            
-        except Exception as e:
-            print(f"Chrome 드라이버 생성 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
+    def _warmup(self, driver):
+        """
+        봇 확인 페이지 감지 시에만: 홈페이지 방문 → 전체 게시판 → 핫딜 게시판 클릭 (common.navigation)
 
-    def _scrape_page(self, driver, page_num):
+        Returns:
+            int: 발생한 페이지 로드 수
+        """
+        print("  홈페이지 방문 중...")
+        get_politeness().acquire(self.main_url)
+        driver.get(self.main_url)
+        loads = 1
+
+        # 고정 / 랜덤 대기 대신 메뉴 요소 등장 → 클릭 → 이동 완료 대기 (요청 간격은 common.waits)
+        board_element = WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "li.li1.li_bookmark2.sub a.a1.sub"))
+        )
+        print("전체 게시판 클릭")
+        click_and_wait(driver, board_element)
+        loads += 1
+
+        print("핫딜 게시판 클릭")
+        deal_board_element = WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.XPATH, "//*[@class='bd bList']//a[normalize-space()='핫딜']"))
+        )
+        click_and_wait(driver, deal_board_element)
+        loads += 1
+        return loads
+
+    def _page_url(self, page_num):
+        """목록 페이지 URL"""
+        if page_num == 1:
+            return self.url
+        return f"{self.main_url}/index.php?mid=hotdeal&page={page_num}"
+
+    def _scrape_page(self, fetcher, page_num):
 
         items = []
-        html = None
 
         try:
             # 페이지 URL
-            if page_num == 1:
-                print("  홈페이지 방문 중...")
-                driver.get(self.main_url)
-                time.sleep(random.uniform(2, 4))  # 랜덤 대기
+            url = self._page_url(page_num)
 
-                url = self.main_url
-
-                board_element = WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "li.li1.li_bookmark2.sub a.a1.sub"))
-                )
-
-                try:
-                    # element.click()
-                    print("전체 게시판 클릭")
-                    ActionChains(driver).move_to_element(board_element).click().perform()
-                    time.sleep(random.uniform(1, 3))
-
-                    print("핫딜 게시판 클릭")
-                    deal_board_element = WebDriverWait(driver, 15).until(
-                        EC.presence_of_element_located((By.XPATH, "//*[@class='bd bList']//a[normalize-space()='핫딜']"))
-                    )
-                    ActionChains(driver).move_to_element(deal_board_element).click().perform()
-                    time.sleep(random.uniform(2, 4))
-
-                except Exception as e:
-                    print(f" 핫딜 게시판 클릭 실패, 직접 이동: {e}")
-                    driver.get(self.url)
-                    time.sleep(2)
-
-            else:
-                # 2페이지 이상
-                try:
-                    # url = f"{self.main_url}/index.php?mid=hotdeal&page={page_num}"
-                    nextPagePath = f"//*[@class='bd_pg clear']//a[normalize-space()='{page_num}']"
-                    nextPageEl = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, nextPagePath))
-                    )
-                    ActionChains(driver).move_to_element(nextPageEl).click().perform()
-                    time.sleep(random.uniform(1, 3))
-
-                except Exception as e:
-                    # 2페이지 이상: URL로 직접 이동
-                    url = f"{self.main_url}/index.php?mid=hotdeal&page={page_num}"
-                    driver.get(url)
-                    time.sleep(1)
-
-            # 페이지 로드
-            driver.get(url)
-
-            try:
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.fm_best_widget._bd_pc"))
-                )
-                print("게시글 로드 확인")
-            except Exception as e:
-                # 타임아웃 되어도 계속 진행 (부분 데이터라도 수집)
-                print(f"명시적 대기 타임아웃 (계속 진행): {e}")
-
-            # HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
-
-            # 게시글 목록
-            rows = soup.select('div.fm_best_widget._bd_pc li.li_best2_hotdeal0')
+            # 게시판 이동 + 게시글 행 필드 추출 (Chrome: 페이지 안에서 JS로 추출)
+            rows = fetcher.fetch_rows(
+                url, self.list_selector, self.row_spec, wait_timeout=30,
+                navigate=lambda driver: self.navigator.navigate(driver, page_num, url)
+            )
             print(f"게시글 {len(rows)}개 발견")
 
-            # 다른 선택자들도 시도
-            if len(rows) == 0:
-                print(f"  [DEBUG] 다른 선택자 시도...")
-                alternative_rows = soup.select('div.fm_best_widget._bd_pc')
-                print(f"  [DEBUG] 대체 선택자: {len(alternative_rows)}개")
-
             if not rows:
                 # 게시글이 0개일 때도 디버깅 파일 저장
                 print(f"게시글이 0개입니다. 현재 페이지 상태를 디버깅용으로 S3에 저장합니다.")
-                self._save_debug_files_to_s3(driver, error_prefix="no_posts_found")
+                self._save_debug_files_to_s3(fetcher, error_prefix="no_posts_found")
 
             for row in rows:
                 try:
                     # 데이터 추출
-                    item = self._extract_item(row)
+                    item = self._build_item(row)
                     if item:
                         items.append(item)
 
@@ -290,24 +252,26 @@ class FmkoreaScraper:
         except Exception as e:
             print(f"  페이지 로딩 실패: {e}")
             # 이 경우에도 현재 상태 저장
-            self._save_debug_files_to_s3(driver, error_prefix="page_load_error")
+            self._save_debug_files_to_s3(fetcher, error_prefix="page_load_error")
             import traceback
             traceback.print_exc()
 
-        finally:
-            html = None
-            soup = None
-
         return items
 
     def _extract_item(self, row):
         """
-        세일정보 추출
+        세일정보 추출 (BeautifulSoup 행 요소)
+        """
+        return self._build_item(extract_fields(row, self.row_spec['fields']))
+
+    @timed('extract')
+    def _build_item(self, fields):
+        """
+        원시 필드(row_spec 추출 결과) → 세일정보
         """
         try:
             # 제목
-            title_element = row.select_one('span.ellipsis-target')
-            raw_title = title_element.get_text(strip=True) if title_element else None
+            raw_title = fields['title']
 
             # 댓글수 제거
             comment_match = re.search(r'\[(\d+)\]\s*$', raw_title)
@@ -317,87 +281,62 @@ class FmkoreaScraper:
                 title = raw_title
 
             # 가격
-            price_element = row.select_one('div.hotdeal_info span:nth-of-type(2) a.strong')
-            price = price_element.get_text(strip=True) if price_element else ''
-            price = extract_number_from_text(price)
+            price = extract_number_from_text(fields['price'] or '')
 
             # 배송비
-            shipping_fee_element = row.select_one('div.hotdeal_info span:nth-of-type(3) a.strong')
-            shipping_fee = shipping_fee_element.get_text(strip=True) if shipping_fee_element else None
-            shipping_fee = extract_shipping_fee(shipping_fee)
+            shipping_fee = extract_shipping_fee(fields['shipping_fee'])
 
             # 판매처
-            store_element = row.select_one('div.hotdeal_info span:nth-of-type(1) a.strong')
-            if store_element:
-                store = store_element.get_text(strip=True)
-            else:
-                store = '기타'
+            store = fields['store'] if fields['store'] is not None else '기타'
 
             # 댓글 수
-            reply_count = 0
-            reply_element = row.select_one('span.comment_count')
-            if reply_element:
-                reply_text = reply_element.get_text(strip=True)
-                reply_count = extract_number_from_text(reply_text)
+            reply_count = extract_number_from_text(fields['reply']) if fields['reply'] is not None else 0
 
             # 추천 수
-            like_count = 0
-            like_element = row.select_one('span.count')
-            if like_element:
-                like_count = like_element.get_text(strip=True)
+            like_count = fields['like'] if fields['like'] is not None else 0
 
             # 등록 시간
             time = None
-            time_element = row.select_one('span.regdate')
-            if time_element:
-                time_text = time_element.get_text(strip=True)
-                time_obj = parse_time(time_text)
-                time = to_iso8601(time_obj) if time_obj else None
+            if fields['time_text'] is not None:
+                time = self.time_parser.parse(fields['time_text'])
 
             # URL
-            url_element = row.select_one('div.li a.hotdeal_var8')
-            if not url_element:
-                print(f"URL 없음 (제목: {title[:30]}...)")
-                return None
-
-            href = url_element.get('href', '')
+            href = fields['href']
             if not href:
-                print(f"href 속성 없음 (제목: {title[:30]}...)")
+                print(f"URL 없음 (제목: {title[:30]}...)")
                 return None
-            product_url = self.main_url + url_element.get('href', '')
+            product_url = self.main_url + href
 
             # 카테고리
-            category_element = row.select_one('span.category a')
-            category = category_element.get_text(strip=True) if category_element else None
+            category = fields['category']
 
             # 이미지 url
-            image_element = row.select_one('img.thumb')
-            image_url = image_element['src'] if image_element else None
-
-            return {
-                'title': title,
-                'price': price,
-                'storeName': store,
-                'category': category,
-                'shippingFee': shipping_fee,
-                'productUrl': product_url,
-                'imageUrl': image_url,
-                'replyCount': reply_count,
-                'likeCount': like_count,
-                'sourceSite': self.source_site,
-                'createdAt': time
-            }
+            image_url = fields['image']
+
+            return DealItem(
+                title=title,
+                price=price,
+                store_name=store,
+                category=category,
+                shipping_fee=shipping_fee,
+                product_url=product_url,
+                image_url=image_url,
+                reply_count=reply_count,
+                like_count=like_count,
+                source_site=self.source_site,
+                created_at=time,
+            )
 
         except Exception as e:
             print(f"항목 추출 중 오류: {e}")
             return None
 
-    def _save_debug_files_to_s3(self, driver, error_prefix):
+    def _save_debug_files_to_s3(self, fetcher, error_prefix):
         """
         에러 발생 시 스크린샷과 HTML을 S3에 저장
 
         Args:
-            driver: Selenium WebDriver 인스턴스
+            fetcher: PageFetcher 인스턴스 (마지막으로 받은 HTML / Chrome 드라이버)
             error_prefix: 파일명 접두사 (예: "no_posts_found", "page_load_error")
 
         목적:
@@ -419,7 +358,7 @@ class FmkoreaScraper:
 
             # 1. HTML 소스 저장
             html_filename = f"{error_prefix}_{timestamp}.html"
-            html_content = driver.page_source
+            html_content = fetcher.driver.page_source if fetcher.has_driver else (fetcher.last_html or '')
             s3_client.put_object(
                 Bucket=self.s3_bucket_name,
                 Key=f"debug/{self.source_site}/{html_filename}",
@@ -428,9 +367,12 @@ class FmkoreaScraper:
             )
             print(f"✅ HTML 저장: s3://{self.s3_bucket_name}/debug/{self.source_site}/{html_filename}")
 
-            # 2. 스크린샷 저장
+            # 2. 스크린샷 저장 (Chrome을 사용한 경우만)
+            if not fetcher.has_driver:
+                return
+
             screenshot_filename = f"{error_prefix}_{timestamp}.png"
-            screenshot_data = driver.get_screenshot_as_png()
+            screenshot_data = fetcher.driver.get_screenshot_as_png()
             s3_client.put_object(
                 Bucket=self.s3_bucket_name,
                 Key=f"debug/{self.source_site}/{screenshot_filename}",
@@ -8,17 +8,18 @@ URL: https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu
 import sys
 import os
 import re
-from bs4 import BeautifulSoup
 from datetime import datetime, timezone, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
+from common.watermark import BoardWatermark
+from common.deal_item import DealItem, format_kst
+from common.pagination_utils import cut_page, page_url
+from common.time_parser import TimeParser
+from common.metrics import timed, incr
+from common.fetcher import PageFetcher, FETCH_MODE_HTTP
+from common.pipeline import ShutdownRequested
 from common.log_util import log_item
 from common.store_extractor import clean_store_name
+from common.price_parser import parse_title
 
 # common 모듈
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -30,16 +31,31 @@ class PpomppuScraper:
         self.source_site = 'PPOMPPU'
         self.main_url = 'https://www.ppomppu.co.kr/zboard/'
         self.max_pages = 3  # 최대 페이지 제한 (무한 루프 방지)
+        self.planned_pages = 1  # 시작 시 미리 받을 페이지 수 (crawler.run 이 게시판 등록 속도로 결정, common.crawl_rate)
         self.test_mode = False
 
+        # 페이지 수집 방식 (서버 렌더링 게시판 → HTTP 우선, 실패 시 Chrome)
+        self.fetch_mode = FETCH_MODE_HTTP
+        self.list_selector = '#revolution_main_table'
+        self.row_selector = '#revolution_main_table tbody tr.baseList'
+        self.resource_allowlist = []  # Chrome 리소스 차단 예외 패턴 (common.resource_blocker)
+        self.watermarks = []  # 게시판별 최고 게시글 번호 (API 전송 성공 후 commit_watermarks 호출)
+
         # 환경 변수에서 필터링 시간 읽기 (기본값 30분)
         self.filter_minutes = int(os.environ.get('FILTER_MINUTES', 30))
+        self.time_parser = TimeParser()  # 실행 시작 시 기준 시각으로 다시 생성
+
+    def scrape(self, on_page=None):
+        """페이징 크롤링 (30분 필터링), on_page: 페이지별 필터링 결과 콜백"""
+        return self._scrape_with_pagination(on_page)
 
-    def scrape(self):
-        """페이징 크롤링 (30분 필터링)"""
-        return self._scrape_with_pagination()
+    def commit_watermarks(self):
+        """API 전송 성공 후 호출: 이번 실행에서 전송한 최고 게시글 번호 저장"""
+        for watermark in self.watermarks:
+            watermark.commit()
+        self.watermarks = []
 
-    def _scrape_with_pagination(self):
+    def _scrape_with_pagination(self, on_page=None):
         """
         - 페이지의 마지막 게시글이 30분 이내면 다음 페이지 계속 확인
         - 마지막 게시글이 30분 초과하거나 최대 페이지 도달 시 중단
@@ -47,33 +63,48 @@ class PpomppuScraper:
 
         all_items = []
         page_num = 1
-        driver = None
+        fetcher = None
 
         filter_minutes = self.filter_minutes
         # 타임존 및 시간 기준 설정 (KST = UTC+9)
         kst = timezone(timedelta(hours=9))
         now = datetime.now(kst)
         cutoff_time = now - timedelta(minutes=filter_minutes)
+        cutoff_ts = cutoff_time.timestamp()
+        self.time_parser = TimeParser(now)  # 게시글 시간 해석 기준 시각 (실행 단위 고정)
         print(f"크롤링 실행 시간 (KST): {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"수집 기준 시간 (KST): {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
         try:
-            driver = self._create_driver()
-            print(f"Chrome 브라우저 시작 : {self.url}")
+            fetcher = PageFetcher(self.source_site, mode=self.fetch_mode,
+                                  resource_allowlist=self.resource_allowlist)
+            watermark = BoardWatermark(self.source_site, self.url)
+            self.watermarks.append(watermark)
+            print(f"크롤링 시작 ({self.fetch_mode}) : {self.url}")
+
+            # 여러 페이지가 필요할 것으로 예상되면 2페이지부터 한 번에 동시 요청
+            fetcher.prefetch_pages([self._page_url(n) for n in range(2, min(self.planned_pages, self.max_pages) + 1)])
 
             while page_num <= self.max_pages:
                 print(f"\n{page_num}페이지 크롤링...")
 
-                # 같은 driver 재사용
-                page_items = self._scrape_page(driver, page_num)
+                # 같은 fetcher(Session / driver) 재사용
+                page_items = self._scrape_page(fetcher, page_num)
 
                 if not page_items:
                     print(f"{page_num}페이지: 게시글 없음, 종료")
                     break
 
+                # 페이지당 게시글 수 (다음 실행 페이지 예산 계산, common.crawl_rate)
+                incr('list_pages')
+                incr('list_rows', len(page_items))
+
+                # 지난 실행에서 전송한 게시글(최고 게시글 번호 이하) 제외
+                page_items, reached_seen = watermark.split_new(page_items)
+
                 # 30분 이내 작성된 게시글 필터링
-                # page_filtered = filter_by_time(page_items, minutes=filter_minutes)
-                page_filtered = self.filter_by_time_aware(page_items, cutoff_time)
+                page_cut = cut_page(page_items, cutoff_ts)
+                page_filtered = page_cut.kept
 
                 if page_filtered:
                     print(f"수집 대상 {len(page_filtered)}개:")
@@ -81,51 +112,43 @@ class PpomppuScraper:
                         log_item(filtered_item)
 
                 all_items.extend(page_filtered)
+                watermark.observe(page_filtered)  # 종료 요청으로 on_page 에서 중단돼도 이 페이지까지 반영
+                if on_page:
+                    on_page(page_filtered)  # 페이지 단위 전송 (common.pipeline)
                 print(f"{page_num}페이지: {len(page_items)}개 → 필터링 {len(page_filtered)}개")
 
-                # 다음 페이지 확인 여부 판단
-                last_item_in_page = page_items[-1]
-                last_crawled_at_str = last_item_in_page.get('createdAt')  # 값이 없으면 None
-
-                if not last_crawled_at_str:
-                    print(f" [경고] 페이지 마지막 게시글의 시간 정보가 없어 다음 페이지를 계속 확인합니다.")
-
-                else:
-                    try:
-                        # 크롤링된 시간 문자열('YYYY-MM-DD HH:mm:ss')을 Timezone이 없는(Naive) datetime 객체로 파싱
-                        last_time_naive = datetime.strptime(last_crawled_at_str, '%Y-%m-%d %H:%M:%S')
-                        # 파싱된 Naive 객체에 KST 타임존 정보를 부여하여 Aware 객체로 만듦
-                        last_time_aware = last_time_naive.replace(tzinfo=kst)
-
-                        # 이제 Aware 객체끼리 안전하게 비교 가능
-                        if last_time_aware < cutoff_time:
-                            print(f"페이지의 마지막 게시글 시간이 마지노선을 초과하여 크롤링을 종료합니다.")
-                            print(
-                                f" (마지막 글 시간: {last_time_aware.strftime('%H:%M:%S')} < 마지노선: {cutoff_time.strftime('%H:%M:%S')})")
-                            break  # 루프 탈출
-                        else:
-                            print(f"페이지의 마지막 게시글 시간이 마지노선 이내이므로 다음 페이지를 확인합니다.")
-                            print(
-                                f" (마지막 글 시간: {last_time_aware.strftime('%H:%M:%S')} >= 마지노선: {cutoff_time.strftime('%H:%M:%S')})")
-
-                    except ValueError:
-                        # 'YYYY-MM-DD HH:mm:ss' 형식이 아닌 경우 (이론상 발생하면 안 됨)
-                        print(f" [오류] createdAt 필드('{last_crawled_at_str}')의 형식이 올바르지 않아 다음 페이지를 계속 확인합니다.")
-                    except Exception as e:
-                        print(f" [오류] 알 수 없는 시간 처리 오류: {e}. 다음 페이지를 계속 확인합니다.")
+                if reached_seen:
+                    print(f"지난 실행에서 전송한 게시글 도달 (제외 {watermark.skipped}개), 종료")
+                    break
+
+                # 다음 페이지 확인 여부 판단 (시간 정보가 있는 마지막 게시글 기준, common.pagination_utils)
+                if page_cut.last_ts is None:
+                    print(f"페이지에 시간 정보가 있는 게시글이 없어 크롤링을 종료합니다.")
+                    break
+
+                if page_cut.stop:
+                    print(f"마지막 게시글 {filter_minutes}분 초과 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 종료")
+                    break
+
+                print(f"마지막 게시글 {filter_minutes}분 이내 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 다음 페이지 확인")
 
                 # 페이지 간 메모리 정리
-                driver.execute_script("window.stop();")
-                driver.delete_all_cookies()
+                fetcher.reset_page_state()
 
                 page_num += 1
 
             if page_num > self.max_pages:
+                incr('page_limit_reached')  # 수집 기간을 다 확인하지 못함 (common.crawl_rate 관측 구간 보정)
                 print(f"\n최대 페이지({self.max_pages}) 도달, 크롤링 종료")
 
             print(f"\n총 {len(all_items)}개 수집\n")
             return all_items
 
+        except ShutdownRequested as e:
+            # 실패가 아닌 종료 요청 (common.pipeline): 큐에 넣은 페이지까지의 게시글 반환
+            print(f"{e} (수집 {len(all_items)}개)")
+            return all_items
+
         except Exception as e:
             print(f"크롤링 실패: {e}")
             import traceback
@@ -133,90 +156,31 @@ class PpomppuScraper:
             return all_items            # 수집된 데이터라도 반환
 
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                    print("Chrome 브라우저 정상 종료")
-                except Exception as e:
-                    print(f"Chrome 종료 중 에러: {e}")
-
-    def _create_driver(self):
-        options = Options()
+            if fetcher:
+                print(f"페이지 수집 통계: {fetcher.stats}")
+                fetcher.close()
 
-        # User-Agent 설정 (공통)
-        options.add_argument(
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    def _page_url(self, page_num):
+        """목록 페이지 URL"""
+        return page_url(self.url, 'page', page_num)
 
-        # 기본 옵션 (공통)
-        # options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--referer=https://www.google.com/')
-
-        # 자동화 감지 우회
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            # 환경 자동 감지
-            import platform
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                print("(로컬 Windows 환경 감지 - WebDriverManager 자동 설치)")
-                # 로컬: WebDriverManager 사용
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            else:
-                print("(Linux 컨테이너 환경 감지 - Fargate 경로 사용)")
-                # Fargate: 고정 경로
-                service = Service('/usr/local/bin/chromedriver')
-            
-            driver = webdriver.Chrome(service=service, options=options)
-            print("✅ Chrome 드라이버 생성 성공!")
-
-            # WebDriver 속성 숨기기
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            driver.set_page_load_timeout(60)
-            return driver
-            
-        except Exception as e:
-            print(f"❌ Chrome 드라이버 생성 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
-
-    def _scrape_page(self, driver, page_num):
+    def _scrape_page(self, fetcher, page_num):
         """
         개별 페이지 크롤링
         """
         items = []
-        html = None
 
         try:
-            if page_num == 1:
-                url = self.url
-            else:
-                url = f"{self.url}&page={page_num}"
-
-            driver.get(url)
+            url = self._page_url(page_num)
 
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '#revolution_main_table'))
-                )
-                print("게시글 로드 확인")
-            except Exception as e:
-                # 타임아웃 되어도 계속 진행 (부분 데이터라도 수집)
-                print(f"명시적 대기 타임아웃 (계속 진행): {e}")
-
-            # HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            # HTML 수집 + 파싱 (HTTP 우선, 목록이 없으면 Chrome)
+            # (다음 페이지는 응답 도착 후 미리 받기, 마지노선에서 중단하면 폐기)
+            next_url = self._page_url(page_num + 1) if page_num < self.max_pages else None
+            soup = fetcher.fetch_soup(url, self.list_selector, wait_timeout=15, prefetch_url=next_url,
+                                      row_selector=self.row_selector)
 
             # 게시글 목록
-            rows = soup.select('#revolution_main_table tbody tr.baseList')
+            rows = soup.select(self.row_selector)
             print(f"페이지 {page_num}: {len(rows)}개 발견")
 
             # 다른 선택자들도 시도
@@ -246,7 +210,6 @@ class PpomppuScraper:
             traceback.print_exc()
 
         finally:
-            html = None
             soup = None
 
         return items
@@ -266,6 +229,7 @@ class PpomppuScraper:
 
         return False
 
+    @timed('extract')
     def _extract_item(self, row):
         """
         세일정보 추출
@@ -274,40 +238,11 @@ class PpomppuScraper:
         title_element = row.select_one('a.baseList-title')
         raw_title = title_element.get_text(strip=True) if title_element else None
 
-        # (가격/배송비)
-        pattern = r'\(([0-9,\.]+)원?\s*/\s*(.+?)\)\s*$'
-        match = re.search(pattern, raw_title)
-
-        # 제목 (가격/배송비) 제거
-        if match:
-            title = raw_title[:match.start()].strip()
-            # 가격/배송비 추출
-        else:
-            title = raw_title  # 패턴 없으면 원본 제목 사용
-
-        price = None
-        shipping_fee = None
-
-        if match:
-            # 가격
-            price_text = match.group(1).replace(',', '')
-            try:
-                if '만' in raw_title:
-                    price = int(float(price_text) * 10000)
-                else:
-                    price = int(float(price_text))
-            except:
-                pass
-
-            # 배송비
-            shipping_text = match.group(2).strip()
-            if any(kw in shipping_text for kw in ['무배', '무료', '무료배송', '공짜', '0']):
-                shipping_fee = "무료배송"
-            elif shipping_text.replace(',', '').isdigit():
-                fee = int(shipping_text.replace(',', ''))
-                shipping_fee = f"{fee}"
-            else:
-                shipping_fee = shipping_text
+        # 가격 / 배송비 / 제목 끝 (가격/배송비) 제거
+        price_info = parse_title(raw_title)
+        title = price_info.title
+        price = price_info.price
+        shipping_fee = price_info.shipping_fee
 
         # 판매처 : 제목에서 추출
         store = None
@@ -338,41 +273,24 @@ class PpomppuScraper:
                 like_count = like + dislike
 
 
-        # 등록 시간 (YYYY-MM-DD HH:mm:ss 형식으로 변환)
+        # 등록 시간 (epoch 초)
         # 1. time 요소를 찾는다.
+        created_at = None
         time_element = row.select_one('time.baseList-time')
 
         # 2. 부모인 <td>를 찾는다.
         if time_element:
             time_cell = time_element.find_parent('td')
 
-            try:
-                # 3. title 확인.
-                if time_cell and time_cell.has_attr('title'):
-                    title_time_text = time_cell['title']
-                    time_obj = datetime.strptime(title_time_text, '%y.%m.%d %H:%M:%S')
-                    created_at = time_obj.strftime('%Y-%m-%d %H:%M:%S')
-
-                # 4. title이 없다면 <time> 시도
-                else:
-                    time_text = time_element.get_text(strip=True)
-                    now = datetime.now()
-
-                    if time_text.count(':') == 2:
-                        hour, minute, second = map(int, time_text.split(':'))
-                        time_obj = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
-                    elif time_text.count('/') == 2:
-                        time_obj = datetime.strptime(time_text, '%y/%m/%d')
-                    else:
-                        time_obj = None
-
-                    if time_obj:
-                        created_at = time_obj.strftime('%Y-%m-%d %H:%M:%S')
-
-            except Exception as e:
-                error_source = time_cell.get('title', time_element.get_text(strip=True)) if time_cell else "N/A"
-                print(f"  [ERROR] 시간 파싱 중 오류 발생: '{error_source}', 오류: {e}")
-                created_at = None
+            # 3. title('yy.mm.dd HH:MM:SS') 우선, 없다면 <time> 텍스트('HH:MM:SS' 또는 'yy/mm/dd')
+            if time_cell and time_cell.has_attr('title'):
+                time_text = time_cell['title']
+            else:
+                time_text = time_element.get_text(strip=True)
+
+            created_at = self.time_parser.parse(time_text)
+            if created_at is None:
+                print(f"  [ERROR] 시간 파싱 실패: '{time_text}'")
 
         # 카테고리
         category_element = row.select_one('small.baseList-small')
@@ -393,49 +311,17 @@ class PpomppuScraper:
 
         print(f"{title} : {created_at}")
 
-        return {
-            'title': title,
-            'price': price,
-            'storeName': store,
-            'category': category,
-            'shippingFee': shipping_fee,
-            'productUrl': product_url,
-            'imageUrl': image_url,
-            'replyCount': reply_count,
-            'likeCount': like_count,
-            'sourceSite': self.source_site,
-            'createdAt': created_at
-        }
-
-    def filter_by_time_aware(self, items, cutoff_time):
-        """
-        Timezone을 인지(aware)하여 아이템 리스트를 필터링하는 함수.
-
-        :param items: 크롤링된 아이템 딕셔너리의 리스트
-        :param cutoff_time: Timezone 정보가 포함된(aware) 기준 시간 datetime 객체
-        :return: 필터링된 아이템 리스트
-        """
-        kst = timezone(timedelta(hours=9))
-
-        filtered_list = []
-        for item in items:
-            created_at_str = item.get('createdAt')
-            if not created_at_str:
-                continue  # 시간 정보 없으면 건너뛰기
-
-            try:
-                # 크롤링된 시간 문자열을 Timezone 없는(Naive) datetime 객체로 파싱
-                item_time_naive = datetime.strptime(created_at_str, '%Y-%m-%d %H:%M:%S')
-
-                # 파싱된 Naive 객체에 KST 타임존 정보를 부여하여 Aware 객체로 만듦
-                item_time_aware = item_time_naive.replace(tzinfo=kst)
-
-                # Aware 객체끼리 비교하여 최신 글만 리스트에 추가
-                if item_time_aware >= cutoff_time:
-                    filtered_list.append(item)
-
-            except Exception as e:
-                print(f"  [FILTER-ERROR] '{created_at_str}' 시간 필터링 중 오류: {e}")
-                continue
+        return DealItem(
+            title=title,
+            price=price,
+            store_name=store,
+            category=category,
+            shipping_fee=shipping_fee,
+            product_url=product_url,
+            image_url=image_url,
+            reply_count=reply_count,
+            like_count=like_count,
+            source_site=self.source_site,
+            created_at=created_at,
+        )
 
-        return filtered_list
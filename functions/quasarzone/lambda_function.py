@@ -2,26 +2,26 @@ import json
 import os
 from datetime import datetime
 from scraper import QuasarzoneScraper
-from common.api_client import send_to_spring_boot
+from common.metrics import start_run, incr
+from common.pipeline import scrape_and_send, is_delivered, summarize_result
 
 API_URL = os.environ.get('API_URL')
 API_KEY = os.environ.get('API_KEY')
 SITE_NAME = 'QUASARZONE'
 
 def lambda_handler(event, context):
+    run = start_run(SITE_NAME)
     try:
         print(f"[{SITE_NAME}] 크롤링 시작 ...")
         scraper = QuasarzoneScraper()
-        items = scraper.scrape()
+        # 페이지 단위로 수집과 동시에 전송 (STREAM_SEND=0 이면 수집 후 한 번에 전송)
+        items, result = scrape_and_send(scraper, API_URL, API_KEY, SITE_NAME)
+        incr('items', len(items))
         print(f"[{SITE_NAME}] 크롤링 완료: {len(items)}개 수집")
         if items:
-            result = send_to_spring_boot(
-                api_url=API_URL,
-                api_key=API_KEY,
-                site=SITE_NAME,
-                items=items
-            )
-            print(f"API 전송 완료 : {result}")
+            print(f"API 전송 완료 : {summarize_result(result)}")
+            if is_delivered(result):
+                scraper.commit_watermarks()
             return {'statusCode': 200, 'body': json.dumps({'success': True, 'site': SITE_NAME, 'total_items': len(items)})}
         else:
             return {'statusCode': 200, 'body': json.dumps({'success': True, 'site': SITE_NAME, 'message': '30분 이내 게시글 없음'})}
@@ -29,7 +29,10 @@ def lambda_handler(event, context):
         print(f"[{SITE_NAME}] 에러: {str(e)}")
         import traceback
         traceback.print_exc()
+        run.fail(e)
         return {'statusCode': 500, 'body': json.dumps({'success': False, 'error': str(e)})}
+    finally:
+        run.finish()
 
 if __name__ == "__main__":
     print("Fargate Task 실행: lambda_handler 호출")
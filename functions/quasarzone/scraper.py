@@ -5,25 +5,21 @@ URL: https://quasarzone.com/bbs/qb_saleinfo
 """
 
 from datetime import datetime, timezone, timedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 import sys
 import os
 import re
 
-from webdriver_manager.core.os_manager import ChromeType
-
+from common.watermark import BoardWatermark
+from common.deal_item import DealItem, format_kst
+from common.pagination_utils import cut_page, page_url
+from common.time_parser import TimeParser
+from common.metrics import timed, incr
+from common.fetcher import PageFetcher, FETCH_MODE_HTTP
+from common.pipeline import ShutdownRequested
+from common.detail_cache import DetailTimeCache
 from common.log_util import log_item
 from common.number_extractor import extract_shipping_fee
 from common.store_extractor import extract_store
-from common.filter_by_regtime import filter_by_time, parse_time, to_iso8601
-from common.parse_universal_time import _parse_universal_time
 
 # common 모듈
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'common'))
@@ -36,16 +32,34 @@ class QuasarzoneScraper:
         self.main_url = 'https://quasarzone.com'
         self.source_site = 'QUASARZONE'
         self.max_pages = 3  # 최대 페이지 제한 (무한 루프 방지)
+        self.planned_pages = 1  # 시작 시 미리 받을 페이지 수 (crawler.run 이 게시판 등록 속도로 결정, common.crawl_rate)
         self.test_mode = False
 
+        # 페이지 수집 방식 (서버 렌더링 게시판 → HTTP 우선, 실패 시 Chrome)
+        self.fetch_mode = FETCH_MODE_HTTP
+        self.list_selector = 'div.market-type-list'
+        self.row_selector = 'div.market-type-list tbody tr'
+        self.resource_allowlist = []  # Chrome 리소스 차단 예외 패턴 (common.resource_blocker)
+        self.watermarks = []  # 게시판별 최고 게시글 번호 (API 전송 성공 후 commit_watermarks 호출)
+        self.detail_time_selector = 'div.util-area span.date'
+        self.detail_workers = 6  # 상세 페이지 동시 요청 수
+        self.detail_cache = None  # 상세 페이지 등록 시간 캐시 (실행마다 열고 닫음)
+
         # 환경 변수에서 필터링 시간 읽기 (기본값 30분)
         self.filter_minutes = int(os.environ.get('FILTER_MINUTES', 30))
+        self.time_parser = TimeParser()  # 실행 시작 시 기준 시각으로 다시 생성
+
+    def scrape(self, on_page=None):
+        """페이징 크롤링 (30분 필터링), on_page: 페이지별 필터링 결과 콜백"""
+        return self._scrape_with_pagination(on_page)
 
-    def scrape(self):
-        """페이징 크롤링 (30분 필터링)"""
-        return self._scrape_with_pagination()
+    def commit_watermarks(self):
+        """API 전송 성공 후 호출: 이번 실행에서 전송한 최고 게시글 번호 저장"""
+        for watermark in self.watermarks:
+            watermark.commit()
+        self.watermarks = []
 
-    def _scrape_with_pagination(self):
+    def _scrape_with_pagination(self, on_page=None):
         """
         - 페이지의 마지막 게시글이 30분 이내면 다음 페이지 계속 확인
         - 마지막 게시글이 30분 초과하거나 최대 페이지 도달 시 중단
@@ -53,33 +67,49 @@ class QuasarzoneScraper:
 
         all_items = []
         page_num = 1
-        driver = None
+        fetcher = None
 
         filter_minutes = self.filter_minutes
         # 타임존 및 시간 기준 설정 (KST = UTC+9)
         kst = timezone(timedelta(hours=9))
         now = datetime.now(kst)
         cutoff_time = now - timedelta(minutes=filter_minutes)
+        cutoff_ts = cutoff_time.timestamp()
+        self.time_parser = TimeParser(now)  # 게시글 시간 해석 기준 시각 (실행 단위 고정)
         print(f"크롤링 실행 시간 (KST): {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"수집 기준 시간 (KST): {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
         try:
-            driver = self._create_driver()
-            print(f"Chrome 브라우저 시작 : {self.url}")
+            fetcher = PageFetcher(self.source_site, mode=self.fetch_mode,
+                                  resource_allowlist=self.resource_allowlist)
+            watermark = BoardWatermark(self.source_site, self.url)
+            self.watermarks.append(watermark)
+            self.detail_cache = self._open_detail_cache()
+            print(f"크롤링 시작 ({self.fetch_mode}) : {self.url}")
+
+            # 여러 페이지가 필요할 것으로 예상되면 2페이지부터 한 번에 동시 요청
+            fetcher.prefetch_pages([self._page_url(n) for n in range(2, min(self.planned_pages, self.max_pages) + 1)])
 
             while page_num <= self.max_pages:
                 print(f"\n{page_num}페이지 크롤링...")
 
-                # 같은 driver 재사용
-                page_items = self._scrape_page(driver, page_num)
+                # 같은 fetcher(Session / driver) 재사용
+                page_items = self._scrape_page(fetcher, page_num, watermark, cutoff_ts)
 
                 if not page_items:
                     print(f"{page_num}페이지: 게시글 없음, 종료")
                     break
 
+                # 페이지당 게시글 수 (다음 실행 페이지 예산 계산, common.crawl_rate)
+                incr('list_pages')
+                incr('list_rows', len(page_items))
+
+                # 지난 실행에서 전송한 게시글(최고 게시글 번호 이하) 제외
+                page_items, reached_seen = watermark.split_new(page_items)
+
                 # 30분 이내 작성된 게시글 필터링
-                # page_filtered = filter_by_time(page_items, minutes=filter_minutes)
-                page_filtered = self.filter_by_time_aware(page_items, cutoff_time)
+                page_cut = cut_page(page_items, cutoff_ts)
+                page_filtered = page_cut.kept
 
                 if page_filtered:
                     print(f"수집 대상 {len(page_filtered)}개:")
@@ -87,51 +117,43 @@ class QuasarzoneScraper:
                         log_item(filtered_item)
 
                 all_items.extend(page_filtered)
+                watermark.observe(page_filtered)  # 종료 요청으로 on_page 에서 중단돼도 이 페이지까지 반영
+                if on_page:
+                    on_page(page_filtered)  # 페이지 단위 전송 (common.pipeline)
                 print(f"{page_num}페이지: {len(page_items)}개 → 필터링 {len(page_filtered)}개")
 
-                # 다음 페이지 확인 여부 판단
-                last_item_in_page = page_items[-1]
-                last_crawled_at_str = last_item_in_page.get('createdAt')  # 값이 없으면 None
-
-                if not last_crawled_at_str:
-                    print(f" [경고] 페이지 마지막 게시글의 시간 정보가 없어 다음 페이지를 계속 확인합니다.")
-
-                else:
-                    try:
-                        # 크롤링된 시간 문자열('YYYY-MM-DD HH:mm:ss')을 Timezone이 없는(Naive) datetime 객체로 파싱
-                        last_time_naive = datetime.strptime(last_crawled_at_str, '%Y-%m-%d %H:%M:%S')
-                        # 파싱된 Naive 객체에 KST 타임존 정보를 부여하여 Aware 객체로 만듦
-                        last_time_aware = last_time_naive.replace(tzinfo=kst)
-
-                        # 이제 Aware 객체끼리 안전하게 비교 가능
-                        if last_time_aware < cutoff_time:
-                            print(f"페이지의 마지막 게시글 시간이 마지노선을 초과하여 크롤링을 종료합니다.")
-                            print(
-                                f" (마지막 글 시간: {last_time_aware.strftime('%H:%M:%S')} < 마지노선: {cutoff_time.strftime('%H:%M:%S')})")
-                            break  # 루프 탈출
-                        else:
-                            print(f"페이지의 마지막 게시글 시간이 마지노선 이내이므로 다음 페이지를 확인합니다.")
-                            print(
-                                f" (마지막 글 시간: {last_time_aware.strftime('%H:%M:%S')} >= 마지노선: {cutoff_time.strftime('%H:%M:%S')})")
-
-                    except ValueError:
-                        # 'YYYY-MM-DD HH:mm:ss' 형식이 아닌 경우 (이론상 발생하면 안 됨)
-                        print(f" [오류] createdAt 필드('{last_crawled_at_str}')의 형식이 올바르지 않아 다음 페이지를 계속 확인합니다.")
-                    except Exception as e:
-                        print(f" [오류] 알 수 없는 시간 처리 오류: {e}. 다음 페이지를 계속 확인합니다.")
+                if reached_seen:
+                    print(f"지난 실행에서 전송한 게시글 도달 (제외 {watermark.skipped}개), 종료")
+                    break
+
+                # 다음 페이지 확인 여부 판단 (시간 정보가 있는 마지막 게시글 기준, common.pagination_utils)
+                if page_cut.last_ts is None:
+                    print(f"페이지에 시간 정보가 있는 게시글이 없어 크롤링을 종료합니다.")
+                    break
+
+                if page_cut.stop:
+                    print(f"마지막 게시글 {filter_minutes}분 초과 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 종료")
+                    break
+
+                print(f"마지막 게시글 {filter_minutes}분 이내 ({format_kst(page_cut.last_ts, '%H:%M:%S')}), 다음 페이지 확인")
 
                 # 페이지 간 메모리 정리
-                driver.execute_script("window.stop();")
-                driver.delete_all_cookies()
+                fetcher.reset_page_state()
 
                 page_num += 1
 
             if page_num > self.max_pages:
+                incr('page_limit_reached')  # 수집 기간을 다 확인하지 못함 (common.crawl_rate 관측 구간 보정)
                 print(f"\n최대 페이지({self.max_pages}) 도달, 크롤링 종료")
 
             print(f"\n총 {len(all_items)}개 수집\n")
             return all_items
 
+        except ShutdownRequested as e:
+            # 실패가 아닌 종료 요청 (common.pipeline): 큐에 넣은 페이지까지의 게시글 반환
+            print(f"{e} (수집 {len(all_items)}개)")
+            return all_items
+
         except Exception as e:
             print(f"크롤링 실패: {e}")
             import traceback
@@ -139,90 +161,34 @@ class QuasarzoneScraper:
             return all_items            # 수집된 데이터라도 반환
 
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                    print("Chrome 브라우저 정상 종료")
-                except Exception as e:
-                    print(f"Chrome 종료 중 에러: {e}")
-
-    def _create_driver(self):
-        options = Options()
+            if fetcher:
+                print(f"페이지 수집 통계: {fetcher.stats}")
+                fetcher.close()
+            if self.detail_cache:
+                print(f"상세 시간 캐시 통계: {self.detail_cache.stats()}")
+                self.detail_cache.close()
+                self.detail_cache = None
 
-        # User-Agent 설정 (공통)
-        options.add_argument(
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-
-        # 기본 옵션 (공통)
-        options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--referer=https://www.google.com/')
-
-        # 자동화 감지 우회
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            # ✅ 환경 자동 감지
-            import platform
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                print("(로컬 Windows 환경 감지 - WebDriverManager 자동 설치)")
-                # 로컬: WebDriverManager 사용
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            else:
-                print("(Linux 컨테이너 환경 감지 - Fargate 경로 사용)")
-                # Fargate: 고정 경로
-                service = Service('/usr/local/bin/chromedriver')
-            
-            driver = webdriver.Chrome(service=service, options=options)
-            print("Chrome 드라이버 생성 성공!")
-
-            # WebDriver 속성 숨기기
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            driver.set_page_load_timeout(60)
-            return driver
-            
-        except Exception as e:
-            print(f"Chrome 드라이버 생성 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
+    def _page_url(self, page_num):
+        """목록 페이지 URL"""
+        return page_url(self.url, 'page', page_num)
 
-    def _scrape_page(self, driver, page_num):
+    def _scrape_page(self, fetcher, page_num, watermark=None, cutoff_ts=None):
 
         items = []
-        html = None
 
         try:
             # 페이지 URL
-            if page_num == 1:
-                url = self.url
-            else:
-                url = f"{self.url}&page={page_num}"
-
-            driver.get(url)
-
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.market-type-list"))
-                )
-                print("게시글 로드 확인")
-            except Exception as e:
-                # 타임아웃 되어도 계속 진행 (부분 데이터라도 수집)
-                print(f"명시적 대기 타임아웃 (계속 진행): {e}")
-
+            url = self._page_url(page_num)
 
-            # HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            # HTML 수집 + 파싱 (HTTP 우선, 목록이 없으면 Chrome)
+            # (다음 페이지는 응답 도착 후 미리 받기, 마지노선에서 중단하면 폐기)
+            next_url = self._page_url(page_num + 1) if page_num < self.max_pages else None
+            soup = fetcher.fetch_soup(url, self.list_selector, wait_timeout=15, prefetch_url=next_url,
+                                      row_selector=self.row_selector)
 
             # 게시글 목록
-            rows = soup.select('div.market-type-list tbody tr')
+            rows = soup.select(self.row_selector)
             print(f"게시글 {len(rows)}개 발견")
 
             # 다른 선택자들도 시도
@@ -231,10 +197,14 @@ class QuasarzoneScraper:
                 alternative_rows = soup.select('div.market-type-list')
                 print(f"  [DEBUG] 대체 선택자: {len(alternative_rows)}개")
 
+            # 상세 페이지 등록 시간 일괄 수집 (목록 페이지는 다시 로드하지 않음)
+            # (이미 전송한 게시글 / 목록 시간으로 기간 밖이 확실한 게시글은 상세 페이지를 받지 않음)
+            detail_times = self._fetch_detail_times(fetcher, self._detail_targets(rows, watermark, cutoff_ts))
+
             for row in rows:
                 try:
                     # 데이터 추출
-                    item = self._extract_item(row, driver)
+                    item = self._extract_item(row, detail_times)
                     if item:
                         items.append(item)
 
@@ -248,12 +218,100 @@ class QuasarzoneScraper:
             traceback.print_exc()
 
         finally:
-            html = None
             soup = None
 
         return items
 
-    def _extract_item(self, row, driver):
+    def _product_url(self, row):
+        url_element = row.select_one('p.tit a')
+        return self.main_url + url_element['href']
+
+    def _detail_targets(self, rows, watermark, cutoff_ts):
+        """
+        상세 페이지 시간이 필요한 행 (워터마크 이하 게시글, 목록 시간이 수집 기준보다 확실히 이전인 게시글 제외)
+
+        목록 시간은 오늘 글 'HH:MM', 이전 글 날짜만 표시 → 날짜만 있으면 그날 마지막 시각으로 보고 비교
+        (자정을 걸친 수집 기간에서 어제 글을 잘못 제외하지 않도록)
+        제외된 행은 _extract_item 에서 목록 시간을 사용
+        """
+        targets = []
+        for row in rows:
+            try:
+                if watermark and watermark.is_seen(self._product_url(row)):
+                    continue
+            except Exception:
+                pass  # URL 없는 행은 기존대로 상세 수집 단계에서 제외
+
+            if cutoff_ts is not None:
+                time_element = row.select_one('span.date')
+                time_text = time_element.get_text(strip=True) if time_element else ''
+                listed = self.time_parser.parse(time_text) if time_text else None
+                if listed is not None:
+                    latest = listed + (59 if ':' in time_text else 24 * 60 * 60)
+                    if latest < cutoff_ts:
+                        continue
+            targets.append(row)
+
+        if len(targets) < len(rows):
+            incr('detail_skipped', len(rows) - len(targets))
+            print(f"상세 페이지 생략: {len(rows) - len(targets)}개 (이미 전송 / 수집 기간 밖)")
+        return targets
+
+    def _open_detail_cache(self):
+        """상세 시간 캐시 열기 (실패해도 캐시 없이 크롤링 진행)"""
+        try:
+            return DetailTimeCache(self.source_site)
+        except Exception as e:
+            print(f"상세 시간 캐시 사용 불가 (캐시 없이 진행): {e}")
+            return None
+
+    @timed('detail_times')
+    def _fetch_detail_times(self, fetcher, rows):
+        """
+        페이지의 상세 페이지를 동시에 받아 등록 시간 추출
+
+        캐시에 있는 게시글은 상세 페이지를 로드하지 않는다.
+        "N분 전" 같은 상대 시간은 그대로 저장하면 다음 실행에서 틀어지므로
+        절대 시각('yyyy-MM-dd HH:mm:ss')으로 변환해 저장한다.
+
+        Returns:
+            dict: {상세 URL: 시간 문자열}
+        """
+        urls = []
+        for row in rows:
+            try:
+                urls.append(self._product_url(row))
+            except Exception:
+                continue
+
+        detail_times = self.detail_cache.get_many(urls) if self.detail_cache else {}
+        missing = [url for url in urls if url not in detail_times]
+
+        detail_soups = fetcher.fetch_many_soups(
+            missing, self.detail_time_selector, max_workers=self.detail_workers, wait_timeout=30
+        )
+
+        time_texts = {}
+        for url, detail_soup in detail_soups.items():
+            if detail_soup is None:
+                continue
+            detail_time_element = detail_soup.select_one(self.detail_time_selector)
+            if detail_time_element:
+                time_texts[url] = detail_time_element.get_text(strip=True)
+
+        # 페이지 단위 일괄 변환
+        created = self.time_parser.parse_many(list(time_texts.values()))
+        fetched = {url: format_kst(ts) for url, ts in zip(time_texts, created) if ts is not None}
+
+        if self.detail_cache:
+            self.detail_cache.put_many(fetched)
+        detail_times.update(fetched)
+
+        print(f"상세 페이지 시간 수집: {len(detail_times)}/{len(urls)}개 (캐시 {len(urls) - len(missing)}개, 로드 {len(missing)}개)")
+        return detail_times
+
+    @timed('extract')
+    def _extract_item(self, row, detail_times):
         """
         세일정보 추출
         """
@@ -303,8 +361,7 @@ class QuasarzoneScraper:
         category = category_element.get_text(strip=True) if category_element else None
 
         # URL
-        url_element = row.select_one('p.tit a')
-        product_url = self.main_url + url_element['href']
+        product_url = self._product_url(row)
 
         # 이미지 url
         image_element = row.select_one('a.thumb img')
@@ -314,151 +371,27 @@ class QuasarzoneScraper:
         created_at = None
         time_element = row.select_one('span.date')
 
-        try:
-            current_url = driver.current_url  # 현재 URL 저장
-            driver.get(product_url)
-
-            # time_element_selector = 'div.util-area span.date'
-            wait = WebDriverWait(driver, 30)
-            detail_time_element = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.util-area span.date')))
-
-            time_text = detail_time_element.text
-
-            # 원래 페이지로 복귀
-            driver.get(current_url)
-
-        except Exception as e:
-            print("상세페이지 접속 실패")
+        # 상세 페이지 시간 우선, 실패 시 목록의 시간 사용
+        time_text = detail_times.get(product_url)
+        if not time_text:
+            print("상세 페이지 시간 없음 → 목록 시간 사용")
             time_text = time_element.text
 
-        created_at = _parse_universal_time(time_text)
-        print(f"created_at : {created_at}")
-
-        print(f"title : {title} | time : {created_at}")
-
-        return {
-            'title': title,
-            'price': price,
-            'storeName': store,
-            'category': category,
-            'shippingFee': shipping_fee,
-            'productUrl': product_url,
-            'imageUrl': image_url,
-            'replyCount': reply_count,
-            'likeCount': like_count,
-            'sourceSite': self.source_site,
-            'createdAt': created_at
-        }
-
-    def _parse_universal_time(self, time_text):
-        """
-        다양한 형태의 시간 문자열을 파싱하여 timezone-aware datetime 객체로 변환합니다.
-        - "N분 전", "N시간 전", "방금"
-        - "HH:mm", "HH:mm:ss"
-        - "YYYY-MM-DD", "YY-MM-DD", "YYYY.MM.DD", "YY.MM.DD"
-        - ISO 8601 형식 (예: "2025-10-31T15:30:00+09:00")
-        """
-        import re
-        from datetime import datetime, timezone, timedelta
-
-        # KST 타임존 설정
-        kst = timezone(timedelta(hours=9))
-        now = datetime.now(kst)
-        time_text = time_text.strip()
-
-        try:
-            # ISO 8601 형식 (가장 정확한 정보)
-            if 'T' in time_text and ('+' in time_text or 'Z' in time_text):
-                # Python 3.11+ 에서는 Z를 바로 파싱 가능, 하위 호환성을 위해 Z를 +00:00으로 변경
-                if time_text.endswith('Z'):
-                    time_text = time_text[:-1] + '+00:00'
-                return datetime.fromisoformat(time_text)
-
-            # "N분 전" 형식
-            if '분 전' in time_text:
-                minutes_ago = int(re.search(r'(\d+)', time_text).group(1))
-                return now - timedelta(minutes=minutes_ago)
-
-            # "N시간 전" 형식
-            if '시간 전' in time_text:
-                hours_ago = int(re.search(r'(\d+)', time_text).group(1))
-                return now - timedelta(hours=hours_ago)
-
-            # "방금" 형식
-            if '방금' in time_text:
-                return now
-
-            # "HH:mm" 또는 "HH:mm:ss" 형식 (오늘 날짜)
-            if ':' in time_text and '-' not in time_text and '.' not in time_text and '/' not in time_text:
-                parts = list(map(int, time_text.split(':')))
-                hour = parts[0]
-                minute = parts[1]
-                second = parts[2] if len(parts) > 2 else 0
-                return now.replace(hour=hour, minute=minute, second=second, microsecond=0)
-
-            # "YYYY-MM-DD" 또는 "YY-MM-DD" 형식
-            # "YYYY-MM-DD" 또는 "YY-MM-DD" 또는 "MM-DD" 또는 "YYYY-MM-DD HH:mm" 형식 (★★★★★ v4 변경점 ★★★★★)
-            if '-' in time_text:
-                parts = time_text.split()
-                date_part = parts[0]
-
-                # "YYYY-MM-DD HH:mm" 형식
-                if len(parts) > 1 and ':' in parts[1]:
-                    return datetime.strptime(time_text, '%Y-%m-%d %H:%M').replace(tzinfo=kst)
-
-                # "YYYY-MM-DD", "YY-MM-DD", "MM-DD" 형식
-                else:
-                    date_parts = date_part.split('-')
-                    if len(date_parts) == 3:
-                        return datetime.strptime(date_part,
-                                                     '%Y-%m-%d' if len(date_parts[0]) == 4 else '%y-%m-%d').replace(tzinfo=kst)
-                    elif len(date_parts) == 2:
-                        return datetime.strptime(f"{now.year}-{date_part}", '%Y-%m-%d').replace(tzinfo=kst)
-
-            # "YYYY.MM.DD" 또는 "YY.MM.DD" 형식
-            if '.' in time_text:
-                return datetime.strptime(time_text,
-                                         '%Y.%m.%d' if len(time_text.split('.')[0]) == 4 else '%y.%m.%d').replace(
-                    tzinfo=kst)
-
-            # 그 외 처리 불가
-            return None
-
-        except Exception as e:
-            print(f"  [PARSING-ERROR] 범용 시간 파싱 실패: '{time_text}', 오류: {e}")
-            return None
-
-
-    def filter_by_time_aware(self, items, cutoff_time):
-        """
-        Timezone을 인지(aware)하여 아이템 리스트를 필터링하는 함수.
-
-        :param items: 크롤링된 아이템 딕셔너리의 리스트
-        :param cutoff_time: Timezone 정보가 포함된(aware) 기준 시간 datetime 객체
-        :return: 필터링된 아이템 리스트
-        """
-        kst = timezone(timedelta(hours=9))
-
-        filtered_list = []
-        for item in items:
-            created_at_str = item.get('createdAt')
-            if not created_at_str:
-                continue  # 시간 정보 없으면 건너뛰기
-
-            try:
-                # 크롤링된 시간 문자열을 Timezone 없는(Naive) datetime 객체로 파싱
-                item_time_naive = datetime.strptime(created_at_str, '%Y-%m-%d %H:%M:%S')
-
-                # 파싱된 Naive 객체에 KST 타임존 정보를 부여하여 Aware 객체로 만듦
-                item_time_aware = item_time_naive.replace(tzinfo=kst)
-
-                # Aware 객체끼리 비교하여 최신 글만 리스트에 추가
-                if item_time_aware >= cutoff_time:
-                    filtered_list.append(item)
-
-            except Exception as e:
-                print(f"  [FILTER-ERROR] '{created_at_str}' 시간 필터링 중 오류: {e}")
-                continue
-
-        return filtered_list
\ No newline at end of file
+        created_at = self.time_parser.parse(time_text)
+        print(f"created_at : {format_kst(created_at)}")
+
+        print(f"title : {title} | time : {format_kst(created_at)}")
+
+        return DealItem(
+            title=title,
+            price=price,
+            store_name=store,
+            category=category,
+            shipping_fee=shipping_fee,
+            product_url=product_url,
+            image_url=image_url,
+            reply_count=reply_count,
+            like_count=like_count,
+            source_site=self.source_site,
+            created_at=created_at,
+        )
@@ -63,10 +63,10 @@ def test_scraper(scraper_class, site_name):
             print(f"   제목: {sample.get('title', 'N/A')[:50]}...")
             print(f"   가격: {sample.get('price', 'N/A')}")
             print(f"   판매처: {sample.get('storeName', 'N/A')}")
-            print(f"   시간: {sample.get('crawledAt', 'N/A')}")
+            print(f"   시간: {sample.get('createdAt', 'N/A')}")
 
             # 데이터 구조 검증
-            required_fields = ['title', 'productUrl', 'sourceSite', 'crawledAt']
+            required_fields = ['title', 'productUrl', 'sourceSite', 'createdAt']
             missing_fields = [f for f in required_fields if f not in sample]
             if missing_fields:
                 print(f"   ⚠️ 누락된 필드: {missing_fields}")
@@ -97,7 +97,7 @@ def test_site(site_name):
                 print(f"    가격: {item.get('price_str', item.get('price', 'N/A'))}")
                 print(f"    판매처: {item.get('storeName', 'N/A')}")
                 print(f"    URL: {item.get('productUrl', 'N/A')[:60]}...")
-                print(f"    시간: {item.get('crawledAt', 'N/A')}")
+                print(f"    시간: {item.get('createdAt', 'N/A')}")
                 print()
 
             if len(items) > 3:
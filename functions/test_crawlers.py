@@ -156,7 +156,7 @@ def test_single_site(site_key, save_json=True, filter_minutes=120):
                 print(f"\n[{i}] {item.get('title', 'N/A')[:60]}...")
                 print(f"    가격: {item.get('price', 'N/A')}")
                 print(f"    판매처: {item.get('storeName', 'N/A')}")
-                print(f"    시간: {item.get('crawledAt', 'N/A')}")
+                print(f"    시간: {item.get('createdAt', 'N/A')}")
                 
                 # URL 길이 체크
                 product_url = item.get('productUrl', '')
@@ -167,7 +167,7 @@ def test_single_site(site_key, save_json=True, filter_minutes=120):
                 print(f"\n... 외 {len(items) - 3}개")
             
             # 필수 필드 검증
-            required_fields = ['title', 'productUrl', 'sourceSite', 'crawledAt']
+            required_fields = ['title', 'productUrl', 'sourceSite', 'createdAt']
             sample = items[0]
             missing_fields = [f for f in required_fields if f not in sample or not sample[f]]
             